@@ -0,0 +1,99 @@
+"""Benchmark: attaching uma.moe banner images to Game8 rows.
+
+Compares the old per-row scan over every image-map key with the Aho-Corasick
+matcher (`_NameMatcher`) on a synthetic roster at 1x and 10x the current size.
+
+    python bench/bench_image_matcher.py [--roster 250] [--rows 200]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from main import _NameMatcher  # noqa: E402
+
+_SYLLABLES = [
+    "ka", "ki", "sa", "to", "no", "mi", "ya", "ta", "ri", "su", "zu", "ra",
+    "ma", "na", "ho", "shi", "ro", "da", "ku", "ne", "go", "ru", "fu", "ji",
+]
+
+
+def _synthetic_roster(size: int, seed: int = 7) -> list[str]:
+    """Normalized character names, with '(original)' entries and their aliases."""
+    rnd = random.Random(seed)
+    names: list[str] = []
+    seen: set[str] = set()
+    while len(names) < size:
+        first = "".join(rnd.choice(_SYLLABLES) for _ in range(rnd.randint(2, 4)))
+        last = "".join(rnd.choice(_SYLLABLES) for _ in range(rnd.randint(2, 3)))
+        base = f"{first} {last}"
+        if base in seen:
+            continue
+        seen.add(base)
+        if rnd.random() < 0.5:
+            names.append(f"{base} (original)")
+            names.append(base)
+        else:
+            names.append(base)
+    return names[:size]
+
+
+def _synthetic_titles(roster: list[str], rows: int, seed: int = 11) -> list[str]:
+    rnd = random.Random(seed)
+    bases = [n for n in roster if not n.endswith(" (original)")]
+    titles = []
+    for _ in range(rows):
+        if rnd.random() < 0.2:
+            titles.append("support card gacha — unknown card")
+        else:
+            titles.append(f"{rnd.choice(bases)} — {rnd.choice(bases)}")
+    return titles
+
+
+def _naive_longest(keys: list[str], title: str) -> str:
+    best_key = ""
+    for k in keys:
+        if k and k in title and len(k) > len(best_key):
+            best_key = k
+    return best_key
+
+
+def _time(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(roster_size: int, rows: int) -> None:
+    print(f"{'roster':>8} {'rows':>6} {'naive ms':>10} {'build ms':>10} {'match ms':>10} {'speedup':>8}")
+    for scale in (1, 10):
+        roster = _synthetic_roster(roster_size * scale)
+        titles = _synthetic_titles(roster, rows)
+
+        build_s = _time(lambda: _NameMatcher(roster))
+        matcher = _NameMatcher(roster)
+        naive_s = _time(lambda: [_naive_longest(roster, t) for t in titles])
+        match_s = _time(lambda: [matcher.longest(t) for t in titles])
+
+        for t in titles:
+            assert matcher.longest(t) == _naive_longest(roster, t), t
+
+        print(
+            f"{len(roster):>8} {rows:>6} {naive_s * 1000:>10.2f} {build_s * 1000:>10.2f} "
+            f"{match_s * 1000:>10.2f} {naive_s / match_s if match_s else 0:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--roster", type=int, default=250, help="current roster size (names incl. aliases)")
+    parser.add_argument("--rows", type=int, default=200, help="Game8 rows to match")
+    args = parser.parse_args()
+    run(args.roster, args.rows)
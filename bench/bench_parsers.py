@@ -0,0 +1,296 @@
+"""Offline parser benchmark suite.
+
+Runs every parser/extractor on the checked-in fixtures (scale 1) and on
+synthetic inputs at 10x and 100x, and reports per function:
+
+- seconds per call and throughput (items/s, and MB/s for text inputs)
+- peak Python allocation of one call (tracemalloc)
+
+Results are written as JSON so runs from different versions can be compared:
+
+    python bench/bench_parsers.py                         # all benchmarks, 1/10/100x
+    python bench/bench_parsers.py --scales 1 10 -k uma    # subset
+    python bench/bench_parsers.py --compare bench/results/old.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+sys.path.insert(0, HERE)
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+import main  # noqa: E402
+import synthetic  # noqa: E402
+
+RESULTS_DIR = os.path.join(HERE, "results")
+
+
+def _soup(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, "html.parser")
+
+
+def _doc(fixture: str, generator, scale: int) -> str:
+    """Scale 1 reads the checked-in fixture; larger scales are generated."""
+    return synthetic.read_fixture(fixture) if scale == 1 else generator(scale)
+
+
+# Each benchmark: name -> setup(scale) returning (fn, items, bytes).
+# Setup work (building inputs, parsing HTML that the function under test
+# receives as a tree) is excluded from the timing.
+
+def _bench_game8_date_range(scale):
+    texts = synthetic.game8_date_strings(scale)
+    return (lambda: [main._parse_game8_utc_date_range(t) for t in texts]), len(texts), sum(map(len, texts))
+
+
+def _bench_parse_html_gacha(scale):
+    html = _doc("gametora_gacha.html", synthetic.gacha_html, scale)
+    return (lambda: _soup(html)), 1, len(html.encode())
+
+
+def _bench_parse_next_data(scale):
+    html = _doc("gametora_gacha.html", synthetic.gacha_html, scale)
+    soup = _soup(html)
+    return (lambda: main._parse_next_data(soup)), 1, len(html.encode())
+
+
+def _bench_gacha_banner_builder(scale):
+    html = _doc("gametora_gacha.html", synthetic.gacha_html, scale)
+    props = main._parse_next_data(_soup(html))
+    n = len(props["currentCharBanners"]["en"]) + len(props["currentSupportBanners"]["en"])
+    return (lambda: main._build_gacha_banners(props, "en")), n, 0
+
+
+def _bench_gacha_banner_builder_all(scale):
+    html = _doc("gametora_gacha.html", synthetic.gacha_html, scale)
+    props = main._parse_next_data(_soup(html))
+    n = sum(len(props[k].get(r, [])) for k in ("currentCharBanners", "currentSupportBanners") for r in main._gacha_regions(props))
+    return (lambda: main._build_gacha_banners_all(props)), n, 0
+
+
+def _bench_card_index(scale):
+    html = _doc("gametora_gacha.html", synthetic.gacha_html, scale)
+    props = main._parse_next_data(_soup(html))
+    cards = main._gacha_cards(props)
+    return (lambda: main._CardIndex(b"", cards)), len(cards), 0
+
+
+def _bench_event_slugs(scale):
+    html = _doc("gametora_story_events.html", synthetic.story_list_html, scale)
+    soup = _soup(html)
+    return (lambda: main._extract_event_slugs(soup)), 120 * scale, len(html.encode())
+
+
+def _bench_event_page(scale):
+    slugs = synthetic.event_slugs(1)[:scale]
+    pages = [synthetic.event_page_html(slug, i) for i, slug in enumerate(slugs)]
+
+    def run():
+        for html in pages:
+            soup = _soup(html)
+            main._parse_next_data(soup)
+            main._extract_event_banner_image_url(soup)
+
+    return run, len(pages), sum(len(p.encode()) for p in pages)
+
+
+def _bench_game8_rows(scale):
+    html = _doc("game8_banners.html", synthetic.game8_html, scale)
+    soup = _soup(html)
+    rows = len(soup.find_all("tr"))
+    return (lambda: main._parse_game8_banner_rows(soup, "bench", synthetic.BASE_TS)), rows, len(html.encode())
+
+
+def _bench_uma_extract_map(scale):
+    js = _doc("uma_moe_timeline_chunk.js", synthetic.uma_chunk_js, scale)
+    return (lambda: main._uma_moe_extract_map(js, "Qt")), 20 * scale, len(js.encode())
+
+
+def _bench_uma_extract_timeline(scale):
+    js = _doc("uma_moe_timeline_chunk.js", synthetic.uma_chunk_js, scale)
+    return (lambda: main._uma_moe_extract_timeline(js)), 100 * scale, len(js.encode())
+
+
+def _bench_uma_global_date(scale):
+    js = _doc("uma_moe_timeline_chunk.js", synthetic.uma_chunk_js, scale)
+    tl = main._uma_moe_extract_timeline(js)
+    jp_dates = []
+    for _name, image, start_s, _end_s in tl["story_rows"]:
+        ts = main._parse_uma_moe_human_dt_to_ts(start_s)
+        if ts:
+            jp_dates.append((image, datetime.fromtimestamp(ts, tz=timezone.utc)))
+    pairs = [{"jp": jp, "global": tl["story_confirmed"][img]} for img, jp in jp_dates if img in tl["story_confirmed"]]
+    args = (tl["jp_launch"], tl["global_launch"], tl["catchup_rate"])
+
+    def run():
+        for _img, jp in jp_dates:
+            main._uma_moe_calculate_global_date(jp, pairs, *args)
+
+    return run, len(jp_dates), 0
+
+
+def _bench_uma_banner_images(scale):
+    # The regex pass of _get_uma_moe_character_banner_image_map, without the fetch.
+    import re
+
+    js = _doc("uma_moe_timeline_chunk.js", synthetic.uma_chunk_js, scale)
+    pattern = re.compile(r"pickup_characters:\[(.*?)\],image_path:\"(assets/images/character/banner/[^\"]+)\"", re.S)
+    return (lambda: pattern.findall(js)), 300 * scale, len(js.encode())
+
+
+def _bench_entity_merge(scale):
+    rows_a = main._parse_game8_banner_rows(_soup(synthetic.game8_html(scale)), "a", synthetic.BASE_TS)
+    rows_b = main._parse_game8_banner_rows(_soup(synthetic.game8_html(scale, seed=9)), "b", synthetic.BASE_TS)
+    rows_b += rows_a[::2]
+    return (lambda: main._merge_sources([("a", rows_a), ("b", rows_b)])), len(rows_a) + len(rows_b), 0
+
+
+BENCHMARKS = {
+    "game8_date_range": _bench_game8_date_range,
+    "parse_html_gacha": _bench_parse_html_gacha,
+    "parse_next_data": _bench_parse_next_data,
+    "gacha_banner_builder": _bench_gacha_banner_builder,
+    "gacha_banner_builder_all": _bench_gacha_banner_builder_all,
+    "card_index": _bench_card_index,
+    "event_slugs": _bench_event_slugs,
+    "event_page": _bench_event_page,
+    "game8_rows": _bench_game8_rows,
+    "uma_extract_map": _bench_uma_extract_map,
+    "uma_extract_timeline": _bench_uma_extract_timeline,
+    "uma_global_date": _bench_uma_global_date,
+    "uma_banner_images": _bench_uma_banner_images,
+    "entity_merge": _bench_entity_merge,
+}
+
+
+def _measure(fn, min_seconds: float) -> tuple[float, int]:
+    """Best seconds per call over repeated rounds, and total calls made."""
+    fn()  # warm-up (regex compilation, caches)
+    best = float("inf")
+    calls = 0
+    started = time.perf_counter()
+    while calls < 3 or time.perf_counter() - started < min_seconds:
+        gc.disable()
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        gc.enable()
+        best = min(best, elapsed)
+        calls += 1
+    return best, calls
+
+
+def _peak_alloc(fn) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - base)
+
+
+def run(names: list[str], scales: list[int], min_seconds: float) -> list[dict]:
+    results = []
+    for name in names:
+        for scale in scales:
+            fn, items, nbytes = BENCHMARKS[name](scale)
+            seconds, calls = _measure(fn, min_seconds)
+            peak = _peak_alloc(fn)
+            res = {
+                "name": name,
+                "scale": scale,
+                "items": items,
+                "bytes": nbytes,
+                "calls": calls,
+                "seconds_per_call": seconds,
+                "items_per_second": items / seconds if seconds else None,
+                "mb_per_second": (nbytes / 1e6) / seconds if seconds and nbytes else None,
+                "peak_alloc_bytes": peak,
+            }
+            results.append(res)
+            print(
+                f"{name:<22} {scale:>4}x {seconds * 1000:>10.3f} ms {res['items_per_second'] or 0:>12,.0f} it/s "
+                f"{(res['mb_per_second'] or 0):>8.2f} MB/s {peak / 1024:>10,.0f} KiB peak",
+                flush=True,
+            )
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True, text=True, timeout=5
+        )
+        return out.stdout.strip() or "unknown"
+    except Exception:
+        return "unknown"
+
+
+def compare(current: list[dict], previous_path: str) -> None:
+    with open(previous_path, encoding="utf-8") as f:
+        previous = {(r["name"], r["scale"]): r for r in json.load(f)["results"]}
+    print(f"\nvs {previous_path} (time ratio > 1 means slower now)")
+    for r in current:
+        old = previous.get((r["name"], r["scale"]))
+        if not old:
+            continue
+        t_ratio = r["seconds_per_call"] / old["seconds_per_call"] if old["seconds_per_call"] else float("nan")
+        m_ratio = r["peak_alloc_bytes"] / old["peak_alloc_bytes"] if old["peak_alloc_bytes"] else float("nan")
+        flag = "  <-- slower" if t_ratio > 1.2 else ""
+        print(f"{r['name']:<22} {r['scale']:>4}x time x{t_ratio:.2f}  memory x{m_ratio:.2f}{flag}")
+
+
+def main_cli() -> None:
+    parser = argparse.ArgumentParser(description="Offline parser benchmarks.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("-k", dest="filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--min-seconds", type=float, default=0.3, help="minimum timing time per case")
+    parser.add_argument("--output", default="", help="JSON output path (default bench/results/parsers-<rev>-<time>.json)")
+    parser.add_argument("--compare", default="", help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    names = [n for n in BENCHMARKS if args.filter in n]
+    results = run(names, args.scales, args.min_seconds)
+
+    rev = _git_revision()
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out_path = args.output or os.path.join(RESULTS_DIR, f"parsers-{rev}-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "meta": {
+                    "revision": rev,
+                    "created_at": stamp,
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "platform": platform.platform(),
+                },
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\nwrote {out_path}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,103 @@
+"""End-to-end refresh benchmark against bench/fake_upstream.py.
+
+Starts the fake upstream in-process, points the tracker at it and runs full
+refreshes, reporting wall time, upstream requests by status, per-stage time
+(from the refresh trace) and how many items each section produced:
+
+    python bench/crawl_bench.py --workers 1 2 4 --latency-ms 200
+    python bench/crawl_bench.py --error-rate 0.1 --rate-limit-rate 0.05 --retries 3 --backoff 0.2
+    python bench/crawl_bench.py --scale 10 --slow-body-kbps 256
+"""
+
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+sys.path.insert(0, HERE)
+
+import requests  # noqa: E402
+import uvicorn  # noqa: E402
+
+import fake_upstream  # noqa: E402
+import synthetic  # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(faults: dict, seed: int | None) -> tuple[uvicorn.Server, str]:
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(fake_upstream.create_app(faults, seed), host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def _stage_times(trace: dict) -> dict[str, float]:
+    """Top-level stage spans (children of the refresh root) -> ms."""
+    roots = {sp["span_id"] for sp in trace["spans"] if not sp["parent_id"]}
+    return {sp["name"]: sp.get("duration_ms", 0.0) for sp in trace["spans"] if sp["parent_id"] in roots}
+
+
+def run(args: argparse.Namespace) -> None:
+    if not args.fixed_clock:
+        synthetic.BASE_TS = int(time.time())
+    server, base_url = start_server(fake_upstream.faults_from_args(args), args.seed)
+    print(f"fake upstream at {base_url}\n")
+
+    os.environ.update(UMA_UPSTREAM_BASE_URL=base_url, UMA_TRACE_FILE="", UMA_STATE_DB="", UMA_ASSET_CACHE_DIR="")
+    import main
+
+    main.HTTP_RETRIES = args.retries
+    main.HTTP_BACKOFF_SECONDS = args.backoff
+    main.HTTP_TIMEOUT = args.timeout
+    try:
+        for workers in args.workers:
+            main.REFRESH_MAX_WORKERS = workers
+            for i in range(args.refreshes):
+                requests.post(f"{base_url}/_stats/reset", timeout=5)
+                trace_id = f"crawl-{workers}-{i}"
+                t0 = time.perf_counter()
+                main.fetch_gametora_data(trace_id)
+                wall = time.perf_counter() - t0
+
+                stats = requests.get(f"{base_url}/_stats", timeout=5).json()
+                cache = main.events_cache
+                sections = {k: len(v) for k, v in cache.items() if isinstance(v, list)}
+                print(
+                    f"workers={workers} run={i} wall={wall:.2f}s requests={sum(stats.values())} "
+                    f"ok={'yes' if cache['last_updated'] else 'no'} items={sections}"
+                )
+                print("  upstream: " + ", ".join(f"{k}={v}" for k, v in sorted(stats.items())))
+                trace = main._recent_traces.get(trace_id)
+                if trace:
+                    stages = sorted(_stage_times(trace).items(), key=lambda kv: -kv[1])
+                    print("  stages:   " + ", ".join(f"{name} {ms:.0f}ms" for name, ms in stages))
+    finally:
+        server.should_exit = True
+
+
+def main_cli() -> None:
+    parser = argparse.ArgumentParser(description="Refresh throughput/resilience against the fake upstream.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[4], help="UMA_REFRESH_MAX_WORKERS values to try")
+    parser.add_argument("--refreshes", type=int, default=1, help="refreshes per worker setting")
+    parser.add_argument("--retries", type=int, default=2, help="UMA_HTTP_RETRIES")
+    parser.add_argument("--backoff", type=float, default=0.5, help="UMA_HTTP_BACKOFF_SECONDS")
+    parser.add_argument("--timeout", type=float, default=30.0, help="UMA_HTTP_TIMEOUT")
+    fake_upstream.add_fault_arguments(parser)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,224 @@
+"""Local stand-in for gametora.com, game8.co and uma.moe.
+
+Serves bench/synthetic.py documents (and placeholder banner PNGs) under
+/<host>/<path>, the layout the
+tracker's UMA_UPSTREAM_BASE_URL override produces, so a whole refresh can run
+against it:
+
+    python bench/fake_upstream.py --port 8090 --latency-ms 150 --error-rate 0.05
+    UMA_UPSTREAM_BASE_URL=http://127.0.0.1:8090 python main.py
+
+Faults (applied per request, randomly):
+
+    --latency-ms / --jitter-ms   delay before the response starts
+    --rate-limit-rate            fraction answered 429 with Retry-After
+    --error-rate                 fraction answered 500/502/503
+    --slow-body-kbps             stream bodies at this rate (0 = all at once)
+    --scale                      roster/page size multiplier (see synthetic.py)
+
+They can be changed while running with `POST /_faults` (JSON with the same
+names, underscores instead of dashes) and read back with `GET /_faults`.
+`GET /_stats` returns request counts per host and status; `POST /_stats/reset`
+clears them.
+
+Generated dates are relative to the time the server starts (so there are
+current and upcoming events), unless --fixed-clock is given.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+from functools import lru_cache
+from threading import Lock
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synthetic  # noqa: E402
+
+_CHUNK_BYTES = 16 * 1024
+
+DEFAULT_FAULTS = {
+    "latency_ms": 0.0,
+    "jitter_ms": 0.0,
+    "rate_limit_rate": 0.0,
+    "error_rate": 0.0,
+    "retry_after": 1,
+    "slow_body_kbps": 0.0,
+    "scale": 1,
+}
+
+
+@lru_cache(maxsize=8)
+def _slug_index(scale: int) -> dict[str, int]:
+    return {slug: i for i, slug in enumerate(synthetic.event_slugs(scale))}
+
+
+def _event_page(m: re.Match, scale: int) -> str | None:
+    index = _slug_index(scale).get(m.group(1))
+    if index is None:
+        return None
+    return synthetic.event_page_html(m.group(1), index)
+
+
+_HTML = "text/html; charset=utf-8"
+_JS = "application/javascript; charset=utf-8"
+_PNG = "image/png"
+
+# host -> [(path pattern, generator(match, scale) -> body or None, content type)]
+ROUTES = {
+    "gametora.com": [
+        (re.compile(r"/umamusume/?"), lambda m, scale: synthetic.home_html(scale), _HTML),
+        (re.compile(r"/umamusume/gacha"), lambda m, scale: synthetic.gacha_html(scale), _HTML),
+        (re.compile(r"/umamusume/events(?:/story-events)?/?"), lambda m, scale: synthetic.story_list_html(scale), _HTML),
+        (re.compile(r"/umamusume/events/champions-meeting"), lambda m, scale: synthetic.champions_meeting_html(), _HTML),
+        (re.compile(r"/umamusume/events/([\w-]+)"), _event_page, _HTML),
+        (re.compile(r"/images/umamusume/[\w/.-]+\.png"), lambda m, scale: synthetic.banner_png(m.group(0)), _PNG),
+    ],
+    "game8.co": [
+        (re.compile(r"/games/Umamusume-Pretty-Derby/archives/537125"), lambda m, scale: synthetic.game8_html(scale), _HTML),
+    ],
+    "uma.moe": [
+        (re.compile(r"/timeline"), lambda m, scale: synthetic.uma_timeline_html(), _HTML),
+        (re.compile(r"/main-[\w-]+\.js"), lambda m, scale: synthetic.uma_main_js(), _JS),
+        (re.compile(r"/chunk-TIMELINE1\.js"), lambda m, scale: synthetic.uma_chunk_js(scale), _JS),
+        (re.compile(r"/assets/images/[\w/.-]+\.png"), lambda m, scale: synthetic.banner_png(m.group(0)), _PNG),
+    ],
+}
+
+
+@lru_cache(maxsize=512)
+def render(host: str, path: str, scale: int) -> tuple[bytes, str] | None:
+    """Body and content type for host+path, or None when nothing matches."""
+    for pattern, generator, content_type in ROUTES.get(host, []):
+        m = pattern.fullmatch(path)
+        if m:
+            body = generator(m, scale)
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            return (body, content_type) if body is not None else None
+    return None
+
+
+def create_app(faults: dict | None = None, seed: int | None = None) -> FastAPI:
+    app = FastAPI(title="fake upstream")
+    app.state.faults = {**DEFAULT_FAULTS, **(faults or {})}
+    app.state.stats = Counter()
+    stats_lock = Lock()
+    rnd = random.Random(seed)
+
+    def count(host: str, status: int) -> None:
+        with stats_lock:
+            app.state.stats[f"{host} {status}"] += 1
+
+    @app.get("/_faults")
+    def get_faults():
+        return app.state.faults
+
+    @app.post("/_faults")
+    async def set_faults(request: Request):
+        body = await request.json()
+        unknown = set(body) - set(DEFAULT_FAULTS)
+        if unknown:
+            return JSONResponse({"error": f"unknown fault settings: {sorted(unknown)}"}, status_code=400)
+        app.state.faults.update(body)
+        return app.state.faults
+
+    @app.get("/_stats")
+    def get_stats():
+        with stats_lock:
+            return dict(app.state.stats)
+
+    @app.post("/_stats/reset")
+    def reset_stats():
+        with stats_lock:
+            app.state.stats.clear()
+        return {}
+
+    @app.get("/{host}/{path:path}")
+    async def upstream(host: str, path: str):
+        f = app.state.faults
+        delay = (f["latency_ms"] + rnd.uniform(0, f["jitter_ms"])) / 1000.0
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        roll = rnd.random()
+        if roll < f["rate_limit_rate"]:
+            count(host, 429)
+            return Response("Too Many Requests", status_code=429, headers={"Retry-After": str(f["retry_after"])})
+        if roll < f["rate_limit_rate"] + f["error_rate"]:
+            status = rnd.choice((500, 502, 503))
+            count(host, status)
+            return Response("upstream error", status_code=status)
+
+        # Documents at large scales take a while to generate; keep that off the event loop.
+        doc = await asyncio.to_thread(render, host, "/" + path, int(f["scale"]))
+        if doc is None:
+            count(host, 404)
+            return Response("Not Found", status_code=404)
+        body, content_type = doc
+        count(host, 200)
+
+        kbps = f["slow_body_kbps"]
+        if not kbps:
+            return Response(body, media_type=content_type)
+
+        async def trickle():
+            pause = _CHUNK_BYTES / (kbps * 1024)
+            for i in range(0, len(body), _CHUNK_BYTES):
+                yield body[i:i + _CHUNK_BYTES]
+                await asyncio.sleep(pause)
+
+        return StreamingResponse(trickle(), media_type=content_type, headers={"Content-Length": str(len(body))})
+
+    return app
+
+
+def faults_from_args(args: argparse.Namespace) -> dict:
+    return {
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "rate_limit_rate": args.rate_limit_rate,
+        "error_rate": args.error_rate,
+        "retry_after": args.retry_after,
+        "slow_body_kbps": args.slow_body_kbps,
+        "scale": args.scale,
+    }
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of requests answered 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 5xx")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--slow-body-kbps", type=float, default=0.0, help="stream bodies at this rate (0 = off)")
+    parser.add_argument("--scale", type=int, default=1, help="roster/page size multiplier")
+    parser.add_argument("--seed", type=int, default=None, help="seed for fault injection")
+    parser.add_argument("--fixed-clock", action="store_true", help="keep synthetic.py's fixed dates (2026-01-01)")
+
+
+def main_cli() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Fake gametora.com / game8.co / uma.moe for load and fault testing.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    if not args.fixed_clock:
+        synthetic.BASE_TS = int(time.time())
+    print(f"UMA_UPSTREAM_BASE_URL=http://{args.host}:{args.port}", flush=True)
+    uvicorn.run(create_app(faults_from_args(args), args.seed), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main_cli()
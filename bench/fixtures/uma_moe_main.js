@@ -0,0 +1 @@
+var routes=[{path:"p0",loadComponent:()=>import("./chunk-P0000.js")},{path:"p1",loadComponent:()=>import("./chunk-P0001.js")},{path:"p2",loadComponent:()=>import("./chunk-P0002.js")},{path:"p3",loadComponent:()=>import("./chunk-P0003.js")},{path:"p4",loadComponent:()=>import("./chunk-P0004.js")},{path:"p5",loadComponent:()=>import("./chunk-P0005.js")},{path:"p6",loadComponent:()=>import("./chunk-P0006.js")},{path:"p7",loadComponent:()=>import("./chunk-P0007.js")},{path:"p8",loadComponent:()=>import("./chunk-P0008.js")},{path:"p9",loadComponent:()=>import("./chunk-P0009.js")},{path:"p10",loadComponent:()=>import("./chunk-P0010.js")},{path:"p11",loadComponent:()=>import("./chunk-P0011.js")},{path:"p12",loadComponent:()=>import("./chunk-P0012.js")},{path:"p13",loadComponent:()=>import("./chunk-P0013.js")},{path:"p14",loadComponent:()=>import("./chunk-P0014.js")},{path:"p15",loadComponent:()=>import("./chunk-P0015.js")},{path:"p16",loadComponent:()=>import("./chunk-P0016.js")},{path:"p17",loadComponent:()=>import("./chunk-P0017.js")},{path:"p18",loadComponent:()=>import("./chunk-P0018.js")},{path:"p19",loadComponent:()=>import("./chunk-P0019.js")},{path:"p20",loadComponent:()=>import("./chunk-P0020.js")},{path:"p21",loadComponent:()=>import("./chunk-P0021.js")},{path:"p22",loadComponent:()=>import("./chunk-P0022.js")},{path:"p23",loadComponent:()=>import("./chunk-P0023.js")},{path:"p24",loadComponent:()=>import("./chunk-P0024.js")},{path:"p25",loadComponent:()=>import("./chunk-P0025.js")},{path:"p26",loadComponent:()=>import("./chunk-P0026.js")},{path:"p27",loadComponent:()=>import("./chunk-P0027.js")},{path:"p28",loadComponent:()=>import("./chunk-P0028.js")},{path:"p29",loadComponent:()=>import("./chunk-P0029.js")},{path:"timeline",loadComponent:()=>import("./chunk-TIMELINE1.js")}];
\ No newline at end of file
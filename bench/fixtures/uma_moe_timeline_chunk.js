@@ -0,0 +1 @@
+import{a as t}from"./chunk-CORE.js";function f0(t){return t.map(e=>e*0).filter(Boolean)};function f1(t){return t.map(e=>e*1).filter(Boolean)};function f2(t){return t.map(e=>e*2).filter(Boolean)};function f3(t){return t.map(e=>e*3).filter(Boolean)};function f4(t){return t.map(e=>e*4).filter(Boolean)};function f5(t){return t.map(e=>e*5).filter(Boolean)};function f6(t){return t.map(e=>e*6).filter(Boolean)};function f7(t){return t.map(e=>e*7).filter(Boolean)};function f8(t){return t.map(e=>e*8).filter(Boolean)};function f9(t){return t.map(e=>e*9).filter(Boolean)};function f10(t){return t.map(e=>e*10).filter(Boolean)};function f11(t){return t.map(e=>e*11).filter(Boolean)};function f12(t){return t.map(e=>e*12).filter(Boolean)};function f13(t){return t.map(e=>e*13).filter(Boolean)};function f14(t){return t.map(e=>e*14).filter(Boolean)};function f15(t){return t.map(e=>e*15).filter(Boolean)};function f16(t){return t.map(e=>e*16).filter(Boolean)};function f17(t){return t.map(e=>e*17).filter(Boolean)};function f18(t){return t.map(e=>e*18).filter(Boolean)};function f19(t){return t.map(e=>e*19).filter(Boolean)};function f20(t){return t.map(e=>e*20).filter(Boolean)};function f21(t){return t.map(e=>e*21).filter(Boolean)};function f22(t){return t.map(e=>e*22).filter(Boolean)};function f23(t){return t.map(e=>e*23).filter(Boolean)};function f24(t){return t.map(e=>e*24).filter(Boolean)};function f25(t){return t.map(e=>e*25).filter(Boolean)};function f26(t){return t.map(e=>e*26).filter(Boolean)};function f27(t){return t.map(e=>e*27).filter(Boolean)};function f28(t){return t.map(e=>e*28).filter(Boolean)};function f29(t){return t.map(e=>e*29).filter(Boolean)};function f30(t){return t.map(e=>e*30).filter(Boolean)};function f31(t){return t.map(e=>e*31).filter(Boolean)};function f32(t){return t.map(e=>e*32).filter(Boolean)};function f33(t){return t.map(e=>e*33).filter(Boolean)};function f34(t){return t.map(e=>e*34).filter(Boolean)};function f35(t){return t.map(e=>e*35).filter(Boolean)};function f36(t){return t.map(e=>e*36).filter(Boolean)};function f37(t){return t.map(e=>e*37).filter(Boolean)};function f38(t){return t.map(e=>e*38).filter(Boolean)};function f39(t){return t.map(e=>e*39).filter(Boolean)};function f40(t){return t.map(e=>e*40).filter(Boolean)};function f41(t){return t.map(e=>e*41).filter(Boolean)};function f42(t){return t.map(e=>e*42).filter(Boolean)};function f43(t){return t.map(e=>e*43).filter(Boolean)};function f44(t){return t.map(e=>e*44).filter(Boolean)};function f45(t){return t.map(e=>e*45).filter(Boolean)};function f46(t){return t.map(e=>e*46).filter(Boolean)};function f47(t){return t.map(e=>e*47).filter(Boolean)};function f48(t){return t.map(e=>e*48).filter(Boolean)};function f49(t){return t.map(e=>e*49).filter(Boolean)};function f50(t){return t.map(e=>e*50).filter(Boolean)};function f51(t){return t.map(e=>e*51).filter(Boolean)};function f52(t){return t.map(e=>e*52).filter(Boolean)};function f53(t){return t.map(e=>e*53).filter(Boolean)};function f54(t){return t.map(e=>e*54).filter(Boolean)};function f55(t){return t.map(e=>e*55).filter(Boolean)};function f56(t){return t.map(e=>e*56).filter(Boolean)};function f57(t){return t.map(e=>e*57).filter(Boolean)};function f58(t){return t.map(e=>e*58).filter(Boolean)};function f59(t){return t.map(e=>e*59).filter(Boolean)};function f60(t){return t.map(e=>e*60).filter(Boolean)};function f61(t){return t.map(e=>e*61).filter(Boolean)};function f62(t){return t.map(e=>e*62).filter(Boolean)};function f63(t){return t.map(e=>e*63).filter(Boolean)};function f64(t){return t.map(e=>e*64).filter(Boolean)};function f65(t){return t.map(e=>e*65).filter(Boolean)};function f66(t){return t.map(e=>e*66).filter(Boolean)};function f67(t){return t.map(e=>e*67).filter(Boolean)};function f68(t){return t.map(e=>e*68).filter(Boolean)};function f69(t){return t.map(e=>e*69).filter(Boolean)};function f70(t){return t.map(e=>e*70).filter(Boolean)};function f71(t){return t.map(e=>e*71).filter(Boolean)};function f72(t){return t.map(e=>e*72).filter(Boolean)};function f73(t){return t.map(e=>e*73).filter(Boolean)};function f74(t){return t.map(e=>e*74).filter(Boolean)};function f75(t){return t.map(e=>e*75).filter(Boolean)};function f76(t){return t.map(e=>e*76).filter(Boolean)};function f77(t){return t.map(e=>e*77).filter(Boolean)};function f78(t){return t.map(e=>e*78).filter(Boolean)};function f79(t){return t.map(e=>e*79).filter(Boolean)};function f80(t){return t.map(e=>e*80).filter(Boolean)};function f81(t){return t.map(e=>e*81).filter(Boolean)};function f82(t){return t.map(e=>e*82).filter(Boolean)};function f83(t){return t.map(e=>e*83).filter(Boolean)};function f84(t){return t.map(e=>e*84).filter(Boolean)};function f85(t){return t.map(e=>e*85).filter(Boolean)};function f86(t){return t.map(e=>e*86).filter(Boolean)};function f87(t){return t.map(e=>e*87).filter(Boolean)};function f88(t){return t.map(e=>e*88).filter(Boolean)};function f89(t){return t.map(e=>e*89).filter(Boolean)};function f90(t){return t.map(e=>e*90).filter(Boolean)};function f91(t){return t.map(e=>e*91).filter(Boolean)};function f92(t){return t.map(e=>e*92).filter(Boolean)};function f93(t){return t.map(e=>e*93).filter(Boolean)};function f94(t){return t.map(e=>e*94).filter(Boolean)};function f95(t){return t.map(e=>e*95).filter(Boolean)};function f96(t){return t.map(e=>e*96).filter(Boolean)};function f97(t){return t.map(e=>e*97).filter(Boolean)};function f98(t){return t.map(e=>e*98).filter(Boolean)};function f99(t){return t.map(e=>e*99).filter(Boolean)};function f100(t){return t.map(e=>e*100).filter(Boolean)};function f101(t){return t.map(e=>e*101).filter(Boolean)};function f102(t){return t.map(e=>e*102).filter(Boolean)};function f103(t){return t.map(e=>e*103).filter(Boolean)};function f104(t){return t.map(e=>e*104).filter(Boolean)};function f105(t){return t.map(e=>e*105).filter(Boolean)};function f106(t){return t.map(e=>e*106).filter(Boolean)};function f107(t){return t.map(e=>e*107).filter(Boolean)};function f108(t){return t.map(e=>e*108).filter(Boolean)};function f109(t){return t.map(e=>e*109).filter(Boolean)};function f110(t){return t.map(e=>e*110).filter(Boolean)};function f111(t){return t.map(e=>e*111).filter(Boolean)};function f112(t){return t.map(e=>e*112).filter(Boolean)};function f113(t){return t.map(e=>e*113).filter(Boolean)};function f114(t){return t.map(e=>e*114).filter(Boolean)};function f115(t){return t.map(e=>e*115).filter(Boolean)};function f116(t){return t.map(e=>e*116).filter(Boolean)};function f117(t){return t.map(e=>e*117).filter(Boolean)};function f118(t){return t.map(e=>e*118).filter(Boolean)};function f119(t){return t.map(e=>e*119).filter(Boolean)};function f120(t){return t.map(e=>e*120).filter(Boolean)};function f121(t){return t.map(e=>e*121).filter(Boolean)};function f122(t){return t.map(e=>e*122).filter(Boolean)};function f123(t){return t.map(e=>e*123).filter(Boolean)};function f124(t){return t.map(e=>e*124).filter(Boolean)};function f125(t){return t.map(e=>e*125).filter(Boolean)};function f126(t){return t.map(e=>e*126).filter(Boolean)};function f127(t){return t.map(e=>e*127).filter(Boolean)};function f128(t){return t.map(e=>e*128).filter(Boolean)};function f129(t){return t.map(e=>e*129).filter(Boolean)};function f130(t){return t.map(e=>e*130).filter(Boolean)};function f131(t){return t.map(e=>e*131).filter(Boolean)};function f132(t){return t.map(e=>e*132).filter(Boolean)};function f133(t){return t.map(e=>e*133).filter(Boolean)};function f134(t){return t.map(e=>e*134).filter(Boolean)};function f135(t){return t.map(e=>e*135).filter(Boolean)};function f136(t){return t.map(e=>e*136).filter(Boolean)};function f137(t){return t.map(e=>e*137).filter(Boolean)};function f138(t){return t.map(e=>e*138).filter(Boolean)};function f139(t){return t.map(e=>e*139).filter(Boolean)};function f140(t){return t.map(e=>e*140).filter(Boolean)};function f141(t){return t.map(e=>e*141).filter(Boolean)};function f142(t){return t.map(e=>e*142).filter(Boolean)};function f143(t){return t.map(e=>e*143).filter(Boolean)};function f144(t){return t.map(e=>e*144).filter(Boolean)};function f145(t){return t.map(e=>e*145).filter(Boolean)};function f146(t){return t.map(e=>e*146).filter(Boolean)};function f147(t){return t.map(e=>e*147).filter(Boolean)};function f148(t){return t.map(e=>e*148).filter(Boolean)};function f149(t){return t.map(e=>e*149).filter(Boolean)};function f150(t){return t.map(e=>e*150).filter(Boolean)};function f151(t){return t.map(e=>e*151).filter(Boolean)};function f152(t){return t.map(e=>e*152).filter(Boolean)};function f153(t){return t.map(e=>e*153).filter(Boolean)};function f154(t){return t.map(e=>e*154).filter(Boolean)};function f155(t){return t.map(e=>e*155).filter(Boolean)};function f156(t){return t.map(e=>e*156).filter(Boolean)};function f157(t){return t.map(e=>e*157).filter(Boolean)};function f158(t){return t.map(e=>e*158).filter(Boolean)};function f159(t){return t.map(e=>e*159).filter(Boolean)};function f160(t){return t.map(e=>e*160).filter(Boolean)};function f161(t){return t.map(e=>e*161).filter(Boolean)};function f162(t){return t.map(e=>e*162).filter(Boolean)};function f163(t){return t.map(e=>e*163).filter(Boolean)};function f164(t){return t.map(e=>e*164).filter(Boolean)};function f165(t){return t.map(e=>e*165).filter(Boolean)};function f166(t){return t.map(e=>e*166).filter(Boolean)};function f167(t){return t.map(e=>e*167).filter(Boolean)};function f168(t){return t.map(e=>e*168).filter(Boolean)};function f169(t){return t.map(e=>e*169).filter(Boolean)};function f170(t){return t.map(e=>e*170).filter(Boolean)};function f171(t){return t.map(e=>e*171).filter(Boolean)};function f172(t){return t.map(e=>e*172).filter(Boolean)};function f173(t){return t.map(e=>e*173).filter(Boolean)};function f174(t){return t.map(e=>e*174).filter(Boolean)};function f175(t){return t.map(e=>e*175).filter(Boolean)};function f176(t){return t.map(e=>e*176).filter(Boolean)};function f177(t){return t.map(e=>e*177).filter(Boolean)};function f178(t){return t.map(e=>e*178).filter(Boolean)};function f179(t){return t.map(e=>e*179).filter(Boolean)};function f180(t){return t.map(e=>e*180).filter(Boolean)};function f181(t){return t.map(e=>e*181).filter(Boolean)};function f182(t){return t.map(e=>e*182).filter(Boolean)};function f183(t){return t.map(e=>e*183).filter(Boolean)};function f184(t){return t.map(e=>e*184).filter(Boolean)};function f185(t){return t.map(e=>e*185).filter(Boolean)};function f186(t){return t.map(e=>e*186).filter(Boolean)};function f187(t){return t.map(e=>e*187).filter(Boolean)};function f188(t){return t.map(e=>e*188).filter(Boolean)};function f189(t){return t.map(e=>e*189).filter(Boolean)};function f190(t){return t.map(e=>e*190).filter(Boolean)};function f191(t){return t.map(e=>e*191).filter(Boolean)};function f192(t){return t.map(e=>e*192).filter(Boolean)};function f193(t){return t.map(e=>e*193).filter(Boolean)};function f194(t){return t.map(e=>e*194).filter(Boolean)};function f195(t){return t.map(e=>e*195).filter(Boolean)};function f196(t){return t.map(e=>e*196).filter(Boolean)};function f197(t){return t.map(e=>e*197).filter(Boolean)};function f198(t){return t.map(e=>e*198).filter(Boolean)};function f199(t){return t.map(e=>e*199).filter(Boolean)};function f200(t){return t.map(e=>e*200).filter(Boolean)};function f201(t){return t.map(e=>e*201).filter(Boolean)};function f202(t){return t.map(e=>e*202).filter(Boolean)};function f203(t){return t.map(e=>e*203).filter(Boolean)};function f204(t){return t.map(e=>e*204).filter(Boolean)};function f205(t){return t.map(e=>e*205).filter(Boolean)};function f206(t){return t.map(e=>e*206).filter(Boolean)};function f207(t){return t.map(e=>e*207).filter(Boolean)};function f208(t){return t.map(e=>e*208).filter(Boolean)};function f209(t){return t.map(e=>e*209).filter(Boolean)};function f210(t){return t.map(e=>e*210).filter(Boolean)};function f211(t){return t.map(e=>e*211).filter(Boolean)};function f212(t){return t.map(e=>e*212).filter(Boolean)};function f213(t){return t.map(e=>e*213).filter(Boolean)};function f214(t){return t.map(e=>e*214).filter(Boolean)};function f215(t){return t.map(e=>e*215).filter(Boolean)};function f216(t){return t.map(e=>e*216).filter(Boolean)};function f217(t){return t.map(e=>e*217).filter(Boolean)};function f218(t){return t.map(e=>e*218).filter(Boolean)};function f219(t){return t.map(e=>e*219).filter(Boolean)};function f220(t){return t.map(e=>e*220).filter(Boolean)};function f221(t){return t.map(e=>e*221).filter(Boolean)};function f222(t){return t.map(e=>e*222).filter(Boolean)};function f223(t){return t.map(e=>e*223).filter(Boolean)};function f224(t){return t.map(e=>e*224).filter(Boolean)};function f225(t){return t.map(e=>e*225).filter(Boolean)};function f226(t){return t.map(e=>e*226).filter(Boolean)};function f227(t){return t.map(e=>e*227).filter(Boolean)};function f228(t){return t.map(e=>e*228).filter(Boolean)};function f229(t){return t.map(e=>e*229).filter(Boolean)};function f230(t){return t.map(e=>e*230).filter(Boolean)};function f231(t){return t.map(e=>e*231).filter(Boolean)};function f232(t){return t.map(e=>e*232).filter(Boolean)};function f233(t){return t.map(e=>e*233).filter(Boolean)};function f234(t){return t.map(e=>e*234).filter(Boolean)};function f235(t){return t.map(e=>e*235).filter(Boolean)};function f236(t){return t.map(e=>e*236).filter(Boolean)};function f237(t){return t.map(e=>e*237).filter(Boolean)};function f238(t){return t.map(e=>e*238).filter(Boolean)};function f239(t){return t.map(e=>e*239).filter(Boolean)};function f240(t){return t.map(e=>e*240).filter(Boolean)};function f241(t){return t.map(e=>e*241).filter(Boolean)};function f242(t){return t.map(e=>e*242).filter(Boolean)};function f243(t){return t.map(e=>e*243).filter(Boolean)};function f244(t){return t.map(e=>e*244).filter(Boolean)};function f245(t){return t.map(e=>e*245).filter(Boolean)};function f246(t){return t.map(e=>e*246).filter(Boolean)};function f247(t){return t.map(e=>e*247).filter(Boolean)};function f248(t){return t.map(e=>e*248).filter(Boolean)};function f249(t){return t.map(e=>e*249).filter(Boolean)};function f250(t){return t.map(e=>e*250).filter(Boolean)};function f251(t){return t.map(e=>e*251).filter(Boolean)};function f252(t){return t.map(e=>e*252).filter(Boolean)};function f253(t){return t.map(e=>e*253).filter(Boolean)};function f254(t){return t.map(e=>e*254).filter(Boolean)};function f255(t){return t.map(e=>e*255).filter(Boolean)};function f256(t){return t.map(e=>e*256).filter(Boolean)};function f257(t){return t.map(e=>e*257).filter(Boolean)};function f258(t){return t.map(e=>e*258).filter(Boolean)};function f259(t){return t.map(e=>e*259).filter(Boolean)};function f260(t){return t.map(e=>e*260).filter(Boolean)};function f261(t){return t.map(e=>e*261).filter(Boolean)};function f262(t){return t.map(e=>e*262).filter(Boolean)};function f263(t){return t.map(e=>e*263).filter(Boolean)};function f264(t){return t.map(e=>e*264).filter(Boolean)};function f265(t){return t.map(e=>e*265).filter(Boolean)};function f266(t){return t.map(e=>e*266).filter(Boolean)};function f267(t){return t.map(e=>e*267).filter(Boolean)};function f268(t){return t.map(e=>e*268).filter(Boolean)};function f269(t){return t.map(e=>e*269).filter(Boolean)};function f270(t){return t.map(e=>e*270).filter(Boolean)};function f271(t){return t.map(e=>e*271).filter(Boolean)};function f272(t){return t.map(e=>e*272).filter(Boolean)};function f273(t){return t.map(e=>e*273).filter(Boolean)};function f274(t){return t.map(e=>e*274).filter(Boolean)};function f275(t){return t.map(e=>e*275).filter(Boolean)};function f276(t){return t.map(e=>e*276).filter(Boolean)};function f277(t){return t.map(e=>e*277).filter(Boolean)};function f278(t){return t.map(e=>e*278).filter(Boolean)};function f279(t){return t.map(e=>e*279).filter(Boolean)};function f280(t){return t.map(e=>e*280).filter(Boolean)};function f281(t){return t.map(e=>e*281).filter(Boolean)};function f282(t){return t.map(e=>e*282).filter(Boolean)};function f283(t){return t.map(e=>e*283).filter(Boolean)};function f284(t){return t.map(e=>e*284).filter(Boolean)};function f285(t){return t.map(e=>e*285).filter(Boolean)};function f286(t){return t.map(e=>e*286).filter(Boolean)};function f287(t){return t.map(e=>e*287).filter(Boolean)};function f288(t){return t.map(e=>e*288).filter(Boolean)};function f289(t){return t.map(e=>e*289).filter(Boolean)};function f290(t){return t.map(e=>e*290).filter(Boolean)};function f291(t){return t.map(e=>e*291).filter(Boolean)};function f292(t){return t.map(e=>e*292).filter(Boolean)};function f293(t){return t.map(e=>e*293).filter(Boolean)};function f294(t){return t.map(e=>e*294).filter(Boolean)};function f295(t){return t.map(e=>e*295).filter(Boolean)};function f296(t){return t.map(e=>e*296).filter(Boolean)};function f297(t){return t.map(e=>e*297).filter(Boolean)};function f298(t){return t.map(e=>e*298).filter(Boolean)};function f299(t){return t.map(e=>e*299).filter(Boolean)};function f300(t){return t.map(e=>e*300).filter(Boolean)};function f301(t){return t.map(e=>e*301).filter(Boolean)};function f302(t){return t.map(e=>e*302).filter(Boolean)};function f303(t){return t.map(e=>e*303).filter(Boolean)};function f304(t){return t.map(e=>e*304).filter(Boolean)};function f305(t){return t.map(e=>e*305).filter(Boolean)};function f306(t){return t.map(e=>e*306).filter(Boolean)};function f307(t){return t.map(e=>e*307).filter(Boolean)};function f308(t){return t.map(e=>e*308).filter(Boolean)};function f309(t){return t.map(e=>e*309).filter(Boolean)};function f310(t){return t.map(e=>e*310).filter(Boolean)};function f311(t){return t.map(e=>e*311).filter(Boolean)};function f312(t){return t.map(e=>e*312).filter(Boolean)};function f313(t){return t.map(e=>e*313).filter(Boolean)};function f314(t){return t.map(e=>e*314).filter(Boolean)};function f315(t){return t.map(e=>e*315).filter(Boolean)};function f316(t){return t.map(e=>e*316).filter(Boolean)};function f317(t){return t.map(e=>e*317).filter(Boolean)};function f318(t){return t.map(e=>e*318).filter(Boolean)};function f319(t){return t.map(e=>e*319).filter(Boolean)};function f320(t){return t.map(e=>e*320).filter(Boolean)};function f321(t){return t.map(e=>e*321).filter(Boolean)};function f322(t){return t.map(e=>e*322).filter(Boolean)};function f323(t){return t.map(e=>e*323).filter(Boolean)};function f324(t){return t.map(e=>e*324).filter(Boolean)};function f325(t){return t.map(e=>e*325).filter(Boolean)};function f326(t){return t.map(e=>e*326).filter(Boolean)};function f327(t){return t.map(e=>e*327).filter(Boolean)};function f328(t){return t.map(e=>e*328).filter(Boolean)};function f329(t){return t.map(e=>e*329).filter(Boolean)};function f330(t){return t.map(e=>e*330).filter(Boolean)};function f331(t){return t.map(e=>e*331).filter(Boolean)};function f332(t){return t.map(e=>e*332).filter(Boolean)};function f333(t){return t.map(e=>e*333).filter(Boolean)};function f334(t){return t.map(e=>e*334).filter(Boolean)};function f335(t){return t.map(e=>e*335).filter(Boolean)};function f336(t){return t.map(e=>e*336).filter(Boolean)};function f337(t){return t.map(e=>e*337).filter(Boolean)};function f338(t){return t.map(e=>e*338).filter(Boolean)};function f339(t){return t.map(e=>e*339).filter(Boolean)};function f340(t){return t.map(e=>e*340).filter(Boolean)};function f341(t){return t.map(e=>e*341).filter(Boolean)};function f342(t){return t.map(e=>e*342).filter(Boolean)};function f343(t){return t.map(e=>e*343).filter(Boolean)};function f344(t){return t.map(e=>e*344).filter(Boolean)};function f345(t){return t.map(e=>e*345).filter(Boolean)};function f346(t){return t.map(e=>e*346).filter(Boolean)};function f347(t){return t.map(e=>e*347).filter(Boolean)};function f348(t){return t.map(e=>e*348).filter(Boolean)};function f349(t){return t.map(e=>e*349).filter(Boolean)};function f350(t){return t.map(e=>e*350).filter(Boolean)};function f351(t){return t.map(e=>e*351).filter(Boolean)};function f352(t){return t.map(e=>e*352).filter(Boolean)};function f353(t){return t.map(e=>e*353).filter(Boolean)};function f354(t){return t.map(e=>e*354).filter(Boolean)};function f355(t){return t.map(e=>e*355).filter(Boolean)};function f356(t){return t.map(e=>e*356).filter(Boolean)};function f357(t){return t.map(e=>e*357).filter(Boolean)};function f358(t){return t.map(e=>e*358).filter(Boolean)};function f359(t){return t.map(e=>e*359).filter(Boolean)};function f360(t){return t.map(e=>e*360).filter(Boolean)};function f361(t){return t.map(e=>e*361).filter(Boolean)};function f362(t){return t.map(e=>e*362).filter(Boolean)};function f363(t){return t.map(e=>e*363).filter(Boolean)};function f364(t){return t.map(e=>e*364).filter(Boolean)};function f365(t){return t.map(e=>e*365).filter(Boolean)};function f366(t){return t.map(e=>e*366).filter(Boolean)};function f367(t){return t.map(e=>e*367).filter(Boolean)};function f368(t){return t.map(e=>e*368).filter(Boolean)};function f369(t){return t.map(e=>e*369).filter(Boolean)};function f370(t){return t.map(e=>e*370).filter(Boolean)};function f371(t){return t.map(e=>e*371).filter(Boolean)};function f372(t){return t.map(e=>e*372).filter(Boolean)};function f373(t){return t.map(e=>e*373).filter(Boolean)};function f374(t){return t.map(e=>e*374).filter(Boolean)};function f375(t){return t.map(e=>e*375).filter(Boolean)};function f376(t){return t.map(e=>e*376).filter(Boolean)};function f377(t){return t.map(e=>e*377).filter(Boolean)};function f378(t){return t.map(e=>e*378).filter(Boolean)};function f379(t){return t.map(e=>e*379).filter(Boolean)};function f380(t){return t.map(e=>e*380).filter(Boolean)};function f381(t){return t.map(e=>e*381).filter(Boolean)};function f382(t){return t.map(e=>e*382).filter(Boolean)};function f383(t){return t.map(e=>e*383).filter(Boolean)};function f384(t){return t.map(e=>e*384).filter(Boolean)};function f385(t){return t.map(e=>e*385).filter(Boolean)};function f386(t){return t.map(e=>e*386).filter(Boolean)};function f387(t){return t.map(e=>e*387).filter(Boolean)};function f388(t){return t.map(e=>e*388).filter(Boolean)};function f389(t){return t.map(e=>e*389).filter(Boolean)};function f390(t){return t.map(e=>e*390).filter(Boolean)};function f391(t){return t.map(e=>e*391).filter(Boolean)};function f392(t){return t.map(e=>e*392).filter(Boolean)};function f393(t){return t.map(e=>e*393).filter(Boolean)};function f394(t){return t.map(e=>e*394).filter(Boolean)};function f395(t){return t.map(e=>e*395).filter(Boolean)};function f396(t){return t.map(e=>e*396).filter(Boolean)};function f397(t){return t.map(e=>e*397).filter(Boolean)};function f398(t){return t.map(e=>e*398).filter(Boolean)};function f399(t){return t.map(e=>e*399).filter(Boolean)};var ee=new Date(Date.UTC(2021,1,24)),_e=new Date(Date.UTC(2025,5,26)),me=1.6;var Qt=new Map([["story_0000.png",new Date(Date.UTC(2025,5,26,22,0,0))],["story_0001.png",new Date(Date.UTC(2025,6,5,22,0,0))],["story_0002.png",new Date(Date.UTC(2025,6,14,22,0,0))],["story_0003.png",new Date(Date.UTC(2025,6,23,22,0,0))],["story_0004.png",new Date(Date.UTC(2025,7,1,22,0,0))],["story_0005.png",new Date(Date.UTC(2025,7,10,22,0,0))],["story_0006.png",new Date(Date.UTC(2025,7,19,22,0,0))],["story_0007.png",new Date(Date.UTC(2025,7,28,22,0,0))],["story_0008.png",new Date(Date.UTC(2025,8,6,22,0,0))],["story_0009.png",new Date(Date.UTC(2025,8,15,22,0,0))],["story_0010.png",new Date(Date.UTC(2025,8,24,22,0,0))],["story_0011.png",new Date(Date.UTC(2025,9,3,22,0,0))],["story_0012.png",new Date(Date.UTC(2025,9,12,22,0,0))],["story_0013.png",new Date(Date.UTC(2025,9,21,22,0,0))],["story_0014.png",new Date(Date.UTC(2025,9,30,22,0,0))],["story_0015.png",new Date(Date.UTC(2025,10,8,22,0,0))],["story_0016.png",new Date(Date.UTC(2025,10,17,22,0,0))],["story_0017.png",new Date(Date.UTC(2025,10,26,22,0,0))],["story_0018.png",new Date(Date.UTC(2025,11,5,22,0,0))],["story_0019.png",new Date(Date.UTC(2025,11,14,22,0,0))]]);var Xt=new Map([["champions_meeting_0",new Date(Date.UTC(2025,7,1,22,0,0))],["champions_meeting_1",new Date(Date.UTC(2025,7,21,22,0,0))],["champions_meeting_2",new Date(Date.UTC(2025,8,10,22,0,0))],["champions_meeting_3",new Date(Date.UTC(2025,8,30,22,0,0))],["champions_meeting_4",new Date(Date.UTC(2025,9,20,22,0,0))],["champions_meeting_5",new Date(Date.UTC(2025,10,9,22,0,0))],["champions_meeting_6",new Date(Date.UTC(2025,10,29,22,0,0))],["champions_meeting_7",new Date(Date.UTC(2025,11,19,22,0,0))],["champions_meeting_8",new Date(Date.UTC(2026,0,8,22,0,0))],["champions_meeting_9",new Date(Date.UTC(2026,0,28,22,0,0))]]);var Vt=[{event_name:"Sashiriki Noru Story",image:"story_0000.png",start_date:"24 Feb 2021, 5:00",end_date:"5 Mar 2021, 5:00"},{event_name:"Shijirazu Rishi Story",image:"story_0001.png",start_date:"10 Mar 2021, 5:00",end_date:"19 Mar 2021, 5:00"},{event_name:"Jina Yaku Story",image:"story_0002.png",start_date:"24 Mar 2021, 5:00",end_date:"2 Apr 2021, 5:00"},{event_name:"Fujiriru Nazu Story",image:"story_0003.png",start_date:"7 Apr 2021, 5:00",end_date:"16 Apr 2021, 5:00"},{event_name:"Rana Hofuto Story",image:"story_0004.png",start_date:"21 Apr 2021, 5:00",end_date:"30 Apr 2021, 5:00"},{event_name:"Fugo Tokiku Story",image:"story_0005.png",start_date:"5 May 2021, 5:00",end_date:"14 May 2021, 5:00"},{event_name:"Gora Yaroku Story",image:"story_0006.png",start_date:"19 May 2021, 5:00",end_date:"28 May 2021, 5:00"},{event_name:"Furokago Tanena Story",image:"story_0007.png",start_date:"2 Jun 2021, 5:00",end_date:"11 Jun 2021, 5:00"},{event_name:"Rakuto Roru Story",image:"story_0008.png",start_date:"16 Jun 2021, 5:00",end_date:"25 Jun 2021, 5:00"},{event_name:"Yatoneru Sujiya Story",image:"story_0009.png",start_date:"30 Jun 2021, 5:00",end_date:"9 Jul 2021, 5:00"},{event_name:"Shitano Furo Story",image:"story_0010.png",start_date:"14 Jul 2021, 5:00",end_date:"23 Jul 2021, 5:00"},{event_name:"Yami Gozu Story",image:"story_0011.png",start_date:"28 Jul 2021, 5:00",end_date:"6 Aug 2021, 5:00"},{event_name:"Runenesu Maroma Story",image:"story_0012.png",start_date:"11 Aug 2021, 5:00",end_date:"20 Aug 2021, 5:00"},{event_name:"Norushi Mina Story",image:"story_0013.png",start_date:"25 Aug 2021, 5:00",end_date:"3 Sept 2021, 5:00"},{event_name:"Jimatoho Sane Story",image:"story_0014.png",start_date:"8 Sept 2021, 5:00",end_date:"17 Sept 2021, 5:00"},{event_name:"Hohomasa Shisufu Story",image:"story_0015.png",start_date:"22 Sept 2021, 5:00",end_date:"1 Oct 2021, 5:00"},{event_name:"Sayaji Hoshiji Story",image:"story_0016.png",start_date:"6 Oct 2021, 5:00",end_date:"15 Oct 2021, 5:00"},{event_name:"Kaka Riku Story",image:"story_0017.png",start_date:"20 Oct 2021, 5:00",end_date:"29 Oct 2021, 5:00"},{event_name:"Yariro Zurori Story",image:"story_0018.png",start_date:"3 Nov 2021, 5:00",end_date:"12 Nov 2021, 5:00"},{event_name:"Naneshi Neshiru Story",image:"story_0019.png",start_date:"17 Nov 2021, 5:00",end_date:"26 Nov 2021, 5:00"},{event_name:"Shinoji Shisugo Story",image:"story_0020.png",start_date:"1 Dec 2021, 5:00",end_date:"10 Dec 2021, 5:00"},{event_name:"Zuraru Nema Story",image:"story_0021.png",start_date:"15 Dec 2021, 5:00",end_date:"24 Dec 2021, 5:00"},{event_name:"Nerizugo Shijimi Story",image:"story_0022.png",start_date:"29 Dec 2021, 5:00",end_date:"7 Jan 2022, 5:00"},{event_name:"Dakane Kimika Story",image:"story_0023.png",start_date:"12 Jan 2022, 5:00",end_date:"21 Jan 2022, 5:00"},{event_name:"Kutorufu Rashiku Story",image:"story_0024.png",start_date:"26 Jan 2022, 5:00",end_date:"4 Feb 2022, 5:00"},{event_name:"Yano Nekana Story",image:"story_0025.png",start_date:"9 Feb 2022, 5:00",end_date:"18 Feb 2022, 5:00"},{event_name:"Shisashita Rara Story",image:"story_0026.png",start_date:"23 Feb 2022, 5:00",end_date:"4 Mar 2022, 5:00"},{event_name:"Rugo Nezu Story",image:"story_0027.png",start_date:"9 Mar 2022, 5:00",end_date:"18 Mar 2022, 5:00"},{event_name:"Kigo Futo Story",image:"story_0028.png",start_date:"23 Mar 2022, 5:00",end_date:"1 Apr 2022, 5:00"},{event_name:"Goshi Jisago Story",image:"story_0029.png",start_date:"6 Apr 2022, 5:00",end_date:"15 Apr 2022, 5:00"},{event_name:"Fuda Nesa Story",image:"story_0030.png",start_date:"20 Apr 2022, 5:00",end_date:"29 Apr 2022, 5:00"},{event_name:"Nego Gohoshi Story",image:"story_0031.png",start_date:"4 May 2022, 5:00",end_date:"13 May 2022, 5:00"},{event_name:"Kagonoya Shihoho Story",image:"story_0032.png",start_date:"18 May 2022, 5:00",end_date:"27 May 2022, 5:00"},{event_name:"Rishifuku Sura Story",image:"story_0033.png",start_date:"1 Jun 2022, 5:00",end_date:"10 Jun 2022, 5:00"},{event_name:"Rakisa Ririshi Story",image:"story_0034.png",start_date:"15 Jun 2022, 5:00",end_date:"24 Jun 2022, 5:00"},{event_name:"Horaki Tane Story",image:"story_0035.png",start_date:"29 Jun 2022, 5:00",end_date:"8 Jul 2022, 5:00"},{event_name:"Tadajiki Zura Story",image:"story_0036.png",start_date:"13 Jul 2022, 5:00",end_date:"22 Jul 2022, 5:00"},{event_name:"Kiji Funa Story",image:"story_0037.png",start_date:"27 Jul 2022, 5:00",end_date:"5 Aug 2022, 5:00"},{event_name:"Samiji Mada Story",image:"story_0038.png",start_date:"10 Aug 2022, 5:00",end_date:"19 Aug 2022, 5:00"},{event_name:"Hoji Gosano Story",image:"story_0039.png",start_date:"24 Aug 2022, 5:00",end_date:"2 Sept 2022, 5:00"},{event_name:"Raro Miro Story",image:"story_0040.png",start_date:"7 Sept 2022, 5:00",end_date:"16 Sept 2022, 5:00"},{event_name:"Nomisuji Roku Story",image:"story_0041.png",start_date:"21 Sept 2022, 5:00",end_date:"30 Sept 2022, 5:00"},{event_name:"Tatafu Nafu Story",image:"story_0042.png",start_date:"5 Oct 2022, 5:00",end_date:"14 Oct 2022, 5:00"},{event_name:"Zuta Kuma Story",image:"story_0043.png",start_date:"19 Oct 2022, 5:00",end_date:"28 Oct 2022, 5:00"},{event_name:"Zuma Kamaro Story",image:"story_0044.png",start_date:"2 Nov 2022, 5:00",end_date:"11 Nov 2022, 5:00"},{event_name:"Runofuta Rirumi Story",image:"story_0045.png",start_date:"16 Nov 2022, 5:00",end_date:"25 Nov 2022, 5:00"},{event_name:"Mifu Masa Story",image:"story_0046.png",start_date:"30 Nov 2022, 5:00",end_date:"9 Dec 2022, 5:00"},{event_name:"Kaki Kitogo Story",image:"story_0047.png",start_date:"14 Dec 2022, 5:00",end_date:"23 Dec 2022, 5:00"},{event_name:"Datorura Kida Story",image:"story_0048.png",start_date:"28 Dec 2022, 5:00",end_date:"6 Jan 2023, 5:00"},{event_name:"Nata Sashisa Story",image:"story_0049.png",start_date:"11 Jan 2023, 5:00",end_date:"20 Jan 2023, 5:00"},{event_name:"Kukimiru Totofu Story",image:"story_0050.png",start_date:"25 Jan 2023, 5:00",end_date:"3 Feb 2023, 5:00"},{event_name:"Kiru Ruji Story",image:"story_0051.png",start_date:"8 Feb 2023, 5:00",end_date:"17 Feb 2023, 5:00"},{event_name:"Gofusu Hotaya Story",image:"story_0052.png",start_date:"22 Feb 2023, 5:00",end_date:"3 Mar 2023, 5:00"},{event_name:"Dagoyari Riro Story",image:"story_0053.png",start_date:"8 Mar 2023, 5:00",end_date:"17 Mar 2023, 5:00"},{event_name:"Jifuruzu Kune Story",image:"story_0054.png",start_date:"22 Mar 2023, 5:00",end_date:"31 Mar 2023, 5:00"},{event_name:"Kirarafu Taka Story",image:"story_0055.png",start_date:"5 Apr 2023, 5:00",end_date:"14 Apr 2023, 5:00"},{event_name:"Fuzuna Rano Story",image:"story_0056.png",start_date:"19 Apr 2023, 5:00",end_date:"28 Apr 2023, 5:00"},{event_name:"Kazu Shika Story",image:"story_0057.png",start_date:"3 May 2023, 5:00",end_date:"12 May 2023, 5:00"},{event_name:"Risaru Tanono Story",image:"story_0058.png",start_date:"17 May 2023, 5:00",end_date:"26 May 2023, 5:00"},{event_name:"Damita Nenaku Story",image:"story_0059.png",start_date:"31 May 2023, 5:00",end_date:"9 Jun 2023, 5:00"}];var jt=[{name:"Sagittarius Cup",start_date:"25 Apr 2021, 5:00",end_date:"1 May 2021, 5:00",track:"Niigata",distance:"2000m",conditions:"Turf / Soft"},{name:"Gemini Cup",start_date:"25 May 2021, 5:00",end_date:"31 May 2021, 5:00",track:"Chukyo",distance:"1200m",conditions:"Turf / Firm"},{name:"Scorpio Cup",start_date:"24 Jun 2021, 5:00",end_date:"30 Jun 2021, 5:00",track:"Nakayama",distance:"1600m",conditions:"Dirt / Heavy"},{name:"Taurus Cup",start_date:"24 Jul 2021, 5:00",end_date:"30 Jul 2021, 5:00",track:"Tokyo",distance:"3000m",conditions:"Turf / Firm"},{name:"Taurus Cup",start_date:"23 Aug 2021, 5:00",end_date:"29 Aug 2021, 5:00",track:"Hanshin",distance:"3200m",conditions:"Dirt / Good"},{name:"Scorpio Cup",start_date:"22 Sept 2021, 5:00",end_date:"28 Sept 2021, 5:00",track:"Niigata",distance:"3000m",conditions:"Dirt / Heavy"},{name:"Scorpio Cup",start_date:"22 Oct 2021, 5:00",end_date:"28 Oct 2021, 5:00",track:"Kyoto",distance:"2400m",conditions:"Turf / Firm"},{name:"Scorpio Cup",start_date:"21 Nov 2021, 5:00",end_date:"27 Nov 2021, 5:00",track:"Tokyo",distance:"2200m",conditions:"Dirt / Good"},{name:"Leo Cup",start_date:"21 Dec 2021, 5:00",end_date:"27 Dec 2021, 5:00",track:"Sapporo",distance:"1600m",conditions:"Turf / Soft"},{name:"Virgo Cup",start_date:"20 Jan 2022, 5:00",end_date:"26 Jan 2022, 5:00",track:"Kokura",distance:"2200m",conditions:"Turf / Firm"},{name:"Aries Cup",start_date:"19 Feb 2022, 5:00",end_date:"25 Feb 2022, 5:00",track:"Chukyo",distance:"1600m",conditions:"Turf / Good"},{name:"Libra Cup",start_date:"21 Mar 2022, 5:00",end_date:"27 Mar 2022, 5:00",track:"Kokura",distance:"3200m",conditions:"Turf / Firm"},{name:"Aquarius Cup",start_date:"20 Apr 2022, 5:00",end_date:"26 Apr 2022, 5:00",track:"Nakayama",distance:"1800m",conditions:"Dirt / Good"},{name:"Libra Cup",start_date:"20 May 2022, 5:00",end_date:"26 May 2022, 5:00",track:"Hanshin",distance:"1600m",conditions:"Dirt / Heavy"},{name:"Aries Cup",start_date:"19 Jun 2022, 5:00",end_date:"25 Jun 2022, 5:00",track:"Fukushima",distance:"3000m",conditions:"Dirt / Good"},{name:"Virgo Cup",start_date:"19 Jul 2022, 5:00",end_date:"25 Jul 2022, 5:00",track:"Sapporo",distance:"3200m",conditions:"Dirt / Good"},{name:"Leo Cup",start_date:"18 Aug 2022, 5:00",end_date:"24 Aug 2022, 5:00",track:"Nakayama",distance:"2000m",conditions:"Turf / Firm"},{name:"Aries Cup",start_date:"17 Sept 2022, 5:00",end_date:"23 Sept 2022, 5:00",track:"Nakayama",distance:"3200m",conditions:"Dirt / Heavy"},{name:"Capricorn Cup",start_date:"17 Oct 2022, 5:00",end_date:"23 Oct 2022, 5:00",track:"Hanshin",distance:"3000m",conditions:"Dirt / Heavy"},{name:"Taurus Cup",start_date:"16 Nov 2022, 5:00",end_date:"22 Nov 2022, 5:00",track:"Nakayama",distance:"1400m",conditions:"Turf / Good"},{name:"Cancer Cup",start_date:"16 Dec 2022, 5:00",end_date:"22 Dec 2022, 5:00",track:"Sapporo",distance:"2200m",conditions:"Turf / Firm"},{name:"Pisces Cup",start_date:"15 Jan 2023, 5:00",end_date:"21 Jan 2023, 5:00",track:"Kyoto",distance:"1600m",conditions:"Turf / Firm"},{name:"Cancer Cup",start_date:"14 Feb 2023, 5:00",end_date:"20 Feb 2023, 5:00",track:"Hanshin",distance:"2500m",conditions:"Dirt / Good"},{name:"Capricorn Cup",start_date:"16 Mar 2023, 5:00",end_date:"22 Mar 2023, 5:00",track:"Nakayama",distance:"3200m",conditions:"Turf / Firm"},{name:"Scorpio Cup",start_date:"15 Apr 2023, 5:00",end_date:"21 Apr 2023, 5:00",track:"Kyoto",distance:"3200m",conditions:"Turf / Soft"},{name:"Pisces Cup",start_date:"15 May 2023, 5:00",end_date:"21 May 2023, 5:00",track:"Hanshin",distance:"2200m",conditions:"Turf / Soft"},{name:"Taurus Cup",start_date:"14 Jun 2023, 5:00",end_date:"20 Jun 2023, 5:00",track:"Chukyo",distance:"1200m",conditions:"Turf / Good"},{name:"Aquarius Cup",start_date:"14 Jul 2023, 5:00",end_date:"20 Jul 2023, 5:00",track:"Tokyo",distance:"2500m",conditions:"Dirt / Good"},{name:"Virgo Cup",start_date:"13 Aug 2023, 5:00",end_date:"19 Aug 2023, 5:00",track:"Tokyo",distance:"1200m",conditions:"Turf / Soft"},{name:"Pisces Cup",start_date:"12 Sept 2023, 5:00",end_date:"18 Sept 2023, 5:00",track:"Nakayama",distance:"2400m",conditions:"Dirt / Heavy"},{name:"Virgo Cup",start_date:"12 Oct 2023, 5:00",end_date:"18 Oct 2023, 5:00",track:"Nakayama",distance:"2200m",conditions:"Turf / Firm"},{name:"Gemini Cup",start_date:"11 Nov 2023, 5:00",end_date:"17 Nov 2023, 5:00",track:"Sapporo",distance:"2500m",conditions:"Dirt / Good"},{name:"Aries Cup",start_date:"11 Dec 2023, 5:00",end_date:"17 Dec 2023, 5:00",track:"Fukushima",distance:"1600m",conditions:"Turf / Good"},{name:"Scorpio Cup",start_date:"10 Jan 2024, 5:00",end_date:"16 Jan 2024, 5:00",track:"Sapporo",distance:"1200m",conditions:"Turf / Firm"},{name:"Aquarius Cup",start_date:"9 Feb 2024, 5:00",end_date:"15 Feb 2024, 5:00",track:"Fukushima",distance:"2500m",conditions:"Turf / Soft"},{name:"Taurus Cup",start_date:"10 Mar 2024, 5:00",end_date:"16 Mar 2024, 5:00",track:"Niigata",distance:"1400m",conditions:"Dirt / Good"},{name:"Pisces Cup",start_date:"9 Apr 2024, 5:00",end_date:"15 Apr 2024, 5:00",track:"Kyoto",distance:"3000m",conditions:"Turf / Firm"},{name:"Scorpio Cup",start_date:"9 May 2024, 5:00",end_date:"15 May 2024, 5:00",track:"Sapporo",distance:"2000m",conditions:"Dirt / Heavy"},{name:"Virgo Cup",start_date:"8 Jun 2024, 5:00",end_date:"14 Jun 2024, 5:00",track:"Chukyo",distance:"3000m",conditions:"Turf / Soft"},{name:"Scorpio Cup",start_date:"8 Jul 2024, 5:00",end_date:"14 Jul 2024, 5:00",track:"Fukushima",distance:"1200m",conditions:"Dirt / Heavy"}];var Bn=[{year:2021,image:"2021_30000.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rune Roshi[New,0.75% rate]","Mikizu Yaku (Original)[New,0.75% rate]","Riki Jisufu[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30000.png",type:"character"},{year:2021,image:"2021_30001.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Fuji Neka (Original)[New,0.75% rate]","Kumira Shigo (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30001.png",type:"character"},{year:2021,image:"2021_30002.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Neratogo Naki[New,0.75% rate]","Yanehori Goki (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30002.png",type:"character"},{year:2021,image:"2021_30003.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rorirori Sunaji (Original)[New,0.75% rate]","Nagomiri Goro (Original)[New,0.75% rate]","Rokisaru Kiho (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30003.png",type:"character"},{year:2021,image:"2021_30004.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Ruri Kasari[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30004.png",type:"character"},{year:2021,image:"2021_30005.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Makufu Jito (Original)[New,0.75% rate]","Hojiri Takaki[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30005.png",type:"character"},{year:2021,image:"2021_30006.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Notasu Tori[New,0.75% rate]","Dato Mari (Original)[New,0.75% rate]","Jiri Nono (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30006.png",type:"character"},{year:2021,image:"2021_30007.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nezu Fushine[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30007.png",type:"character"},{year:2021,image:"2021_30008.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nehoya Dato (Original)[New,0.75% rate]","Mata Hokugo (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30008.png",type:"character"},{year:2021,image:"2021_30009.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kuta Nata (Original)[New,0.75% rate]","Jitogoki Rashigo (Original)[New,0.75% rate]","Masura Kukina[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30009.png",type:"character"},{year:2021,image:"2021_30010.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Sukuru Tatoho[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30010.png",type:"character"},{year:2021,image:"2021_30011.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kunaru Zusaho (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30011.png",type:"character"},{year:2021,image:"2021_30012.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tone Shina[New,0.75% rate]","Kajiroro Ramimi (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30012.png",type:"character"},{year:2021,image:"2021_30013.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kuneto Rago (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30013.png",type:"character"},{year:2021,image:"2021_30014.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rinerori Rafuka[New,0.75% rate]","Sumishi Kikada[New,0.75% rate]","Kika Gotoda (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30014.png",type:"character"},{year:2021,image:"2021_30015.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yayara Toya (Original)[New,0.75% rate]","Rina Rashi (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30015.png",type:"character"},{year:2021,image:"2021_30016.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Gojiriya Roya (Original)[New,0.75% rate]","Kirunago Gosa[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30016.png",type:"character"},{year:2021,image:"2021_30017.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Neruyaro Roku[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30017.png",type:"character"},{year:2021,image:"2021_30018.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mihoyaka Zuya[New,0.75% rate]","Noneka Suto (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30018.png",type:"character"},{year:2021,image:"2021_30019.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yajinada Sanane[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30019.png",type:"character"},{year:2021,image:"2021_30020.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rune Gofu[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30020.png",type:"character"},{year:2021,image:"2021_30021.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Fumaru Hoya (Original)[New,0.75% rate]","Jina Kigozu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30021.png",type:"character"},{year:2021,image:"2021_30022.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nararo Sunone[New,0.75% rate]","Rigoyane Romigo[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30022.png",type:"character"},{year:2021,image:"2021_30023.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tada Honeka[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30023.png",type:"character"},{year:2021,image:"2021_30024.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kidaki Matora (Original)[New,0.75% rate]","Dakaku Norigo (Original)[New,0.75% rate]","Goronera Kune[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30024.png",type:"character"},{year:2021,image:"2021_30025.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Neyaya Naka[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30025.png",type:"character"},{year:2021,image:"2021_30026.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kuna Kujiki (Original)[New,0.75% rate]","Danetaro Sumi (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30026.png",type:"character"},{year:2021,image:"2021_30027.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rasuku Misa (Original)[New,0.75% rate]","Hokitosa Rara (Original)[New,0.75% rate]","Rotana Zugoho (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30027.png",type:"character"},{year:2021,image:"2021_30028.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Netakiji Naru[New,0.75% rate]","Nero Zukune[New,0.75% rate]","Tofu Toya (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30028.png",type:"character"},{year:2021,image:"2021_30029.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tadakara Kiki (Original)[New,0.75% rate]","Hofufu Yashi (Original)[New,0.75% rate]","Shiru Tanoho (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30029.png",type:"character"},{year:2021,image:"2021_30030.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zufu Togo (Original)[New,0.75% rate]","Rukiyasu Dajito[New,0.75% rate]","Gozu Surima (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30030.png",type:"character"},{year:2021,image:"2021_30031.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rayato Risata (Original)[New,0.75% rate]","Kisajito Karo (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30031.png",type:"character"},{year:2021,image:"2021_30032.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Noya Tori (Original)[New,0.75% rate]","Tato Fugo (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30032.png",type:"character"},{year:2021,image:"2021_30033.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Gomasa Jira[New,0.75% rate]","Hono Rikiku[New,0.75% rate]","Neshigo Gosu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30033.png",type:"character"},{year:2021,image:"2021_30034.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Suto Goka[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30034.png",type:"character"},{year:2021,image:"2021_30035.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Ratofu Rago (Original)[New,0.75% rate]","Jitoya Tohoku (Original)[New,0.75% rate]","Raruta Nari[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30035.png",type:"character"},{year:2021,image:"2021_30036.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kiru Kazu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30036.png",type:"character"},{year:2021,image:"2021_30037.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Riri Tatata (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30037.png",type:"character"},{year:2021,image:"2021_30038.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mikisa Hoto[New,0.75% rate]","Dashima Norosa (Original)[New,0.75% rate]","Kita Kamara[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30038.png",type:"character"},{year:2021,image:"2021_30039.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Hoya Zuji[New,0.75% rate]","Noyanosa Shiku (Original)[New,0.75% rate]","Rokahoho Ruto[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30039.png",type:"character"},{year:2021,image:"2021_30040.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Dazu Hotasa (Original)[New,0.75% rate]","Kashino Hoki (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30040.png",type:"character"},{year:2021,image:"2021_30041.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Miya Roya (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30041.png",type:"character"},{year:2021,image:"2021_30042.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tone Totone (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30042.png",type:"character"},{year:2021,image:"2021_30043.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rutafumi Daji[New,0.75% rate]","Rijiji Nene[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30043.png",type:"character"},{year:2021,image:"2021_30044.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yana Zuda[New,0.75% rate]","Totorato Mane[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30044.png",type:"character"},{year:2021,image:"2021_30045.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nosugoho Kata (Original)[New,0.75% rate]","Nosu Kudago[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30045.png",type:"character"},{year:2021,image:"2021_30046.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Sarida Rina[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30046.png",type:"character"},{year:2021,image:"2021_30047.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Fujizuri Tojima[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30047.png",type:"character"},{year:2021,image:"2021_30048.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mirina Mizu (Original)[New,0.75% rate]","Kanasu Rune (Original)[New,0.75% rate]","Shika Jina (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30048.png",type:"character"},{year:2021,image:"2021_30049.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Darashi Yayada (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30049.png",type:"character"},{year:2021,image:"2021_30050.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Negohoru Noshi[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30050.png",type:"character"},{year:2021,image:"2021_30051.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Taneji Notasa (Original)[New,0.75% rate]","Suma Jiyami[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30051.png",type:"character"},{year:2021,image:"2021_30052.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Dago Gorine[New,0.75% rate]","Shita Rota (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30052.png",type:"character"},{year:2021,image:"2021_30053.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nana Gojiri[New,0.75% rate]","Royatone Hotashi[New,0.75% rate]","Kinedana Ruyasu[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30053.png",type:"character"},{year:2021,image:"2021_30054.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Susu Kuruda[New,0.75% rate]","Kuneta Jikizu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30054.png",type:"character"},{year:2021,image:"2021_30055.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Notasu Datosa[New,0.75% rate]","Safumara Sajimi[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30055.png",type:"character"},{year:2021,image:"2021_30056.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kirutago Naru[New,0.75% rate]","Kafuhosu Kirori[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30056.png",type:"character"},{year:2021,image:"2021_30057.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Gomineta Kakuka (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30057.png",type:"character"},{year:2021,image:"2021_30058.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Hono Migogo[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30058.png",type:"character"},{year:2021,image:"2021_30059.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shinoka Kuta[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30059.png",type:"character"},{year:2021,image:"2021_30060.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Goto Kuya (Original)[New,0.75% rate]","Damishito Rine[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30060.png",type:"character"},{year:2021,image:"2021_30061.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yarosuta Nodaji[New,0.75% rate]","Suji Tayato[New,0.75% rate]","Suzuruka Shimima (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30061.png",type:"character"},{year:2021,image:"2021_30062.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kadafu Gokaho[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30062.png",type:"character"},{year:2021,image:"2021_30063.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Noru Kuhoshi (Original)[New,0.75% rate]","Futo Hoho[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30063.png",type:"character"},{year:2021,image:"2021_30064.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Naro Danaya[New,0.75% rate]","Fuzu Fugone (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30064.png",type:"character"},{year:2021,image:"2021_30065.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Noshi Noma (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30065.png",type:"character"},{year:2021,image:"2021_30066.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Gozuka Nenosu (Original)[New,0.75% rate]","Fusaku Yashisa (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30066.png",type:"character"},{year:2021,image:"2021_30067.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Najiyaya Rufu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30067.png",type:"character"},{year:2021,image:"2021_30068.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yasuhori Rasa (Original)[New,0.75% rate]","Hohokiya Nema (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30068.png",type:"character"},{year:2021,image:"2021_30069.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yasa Mitosu (Original)[New,0.75% rate]","Horuyago Mito[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30069.png",type:"character"},{year:2021,image:"2021_30070.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tomihoka Roki (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30070.png",type:"character"},{year:2021,image:"2021_30071.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Hozu Rane (Original)[New,0.75% rate]","Ronora Zuru (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30071.png",type:"character"},{year:2021,image:"2021_30072.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Sanena Shira (Original)[New,0.75% rate]","Mata Yaku[New,0.75% rate]","Mima Kana (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30072.png",type:"character"},{year:2021,image:"2021_30073.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Fuho Fufusa[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30073.png",type:"character"},{year:2021,image:"2021_30074.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rogo Sufu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30074.png",type:"character"},{year:2021,image:"2021_30075.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yazumiku Karu[New,0.75% rate]","Mishizuji Rita (Original)[New,0.75% rate]","Homa Datasa (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30075.png",type:"character"},{year:2021,image:"2021_30076.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Netoriho Suro[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30076.png",type:"character"},{year:2021,image:"2021_30077.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Furazuku Nemi (Original)[New,0.75% rate]","Rujita Funa (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30077.png",type:"character"},{year:2021,image:"2021_30078.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yarasaka Rijita[New,0.75% rate]","Sushino Fuda (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30078.png",type:"character"},{year:2021,image:"2021_30079.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Ruzu Roda[New,0.75% rate]","Hojimino Hotafu[New,0.75% rate]","Maro Fukaro (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30079.png",type:"character"},{year:2022,image:"2022_30080.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rosuto Shina[New,0.75% rate]","Suzufu Sazu[New,0.75% rate]","Tokijira Rama[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30080.png",type:"character"},{year:2022,image:"2022_30081.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kafuro Taneda (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30081.png",type:"character"},{year:2022,image:"2022_30082.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Miraji Yazu[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30082.png",type:"character"},{year:2022,image:"2022_30083.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zuma Kayana[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30083.png",type:"character"},{year:2022,image:"2022_30084.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Torukuji Nana (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30084.png",type:"character"},{year:2022,image:"2022_30085.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yama Zugo[New,0.75% rate]","Kiriro Nanogo[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30085.png",type:"character"},{year:2022,image:"2022_30086.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kuyaho Fusazu (Original)[New,0.75% rate]","Yashidasu Nasana (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30086.png",type:"character"},{year:2022,image:"2022_30087.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jinoshi Fukuru[New,0.75% rate]","Suri Kasuto[New,0.75% rate]","Sugosuki Todato (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30087.png",type:"character"},{year:2022,image:"2022_30088.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Netamaho Fusaru (Original)[New,0.75% rate]","Taramizu Mara (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30088.png",type:"character"},{year:2022,image:"2022_30089.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Honano Rimi[New,0.75% rate]","Toyaroku Tana (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30089.png",type:"character"},{year:2022,image:"2022_30090.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Fukiji Yaneda (Original)[New,0.75% rate]","Daro Miya[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30090.png",type:"character"},{year:2022,image:"2022_30091.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Gokusane Dataya (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30091.png",type:"character"},{year:2022,image:"2022_30092.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Ruji Mimashi[New,0.75% rate]","Todata Noki (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30092.png",type:"character"},{year:2022,image:"2022_30093.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Saho Sushiku[New,0.75% rate]","Rotasa Mita[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30093.png",type:"character"},{year:2022,image:"2022_30094.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kino Rinasu (Original)[New,0.75% rate]","Fuka Hoki[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30094.png",type:"character"},{year:2022,image:"2022_30095.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Totaka Noya (Original)[New,0.75% rate]","Damimi Shino (Original)[New,0.75% rate]","Gororu Riro (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30095.png",type:"character"},{year:2022,image:"2022_30096.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mato Toyaru (Original)[New,0.75% rate]","Tasushino Netofu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30096.png",type:"character"},{year:2022,image:"2022_30097.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rinomi Homigo (Original)[New,0.75% rate]","Fushi Toji (Original)[New,0.75% rate]","Takaku Kuya[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30097.png",type:"character"},{year:2022,image:"2022_30098.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nogoto Yarashi[New,0.75% rate]","Nefujino Homa (Original)[New,0.75% rate]","Kago Yari (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30098.png",type:"character"},{year:2022,image:"2022_30099.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zukizuki Torino[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30099.png",type:"character"},{year:2022,image:"2022_30100.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Sutanaji Kikasu[New,0.75% rate]","Ruhoma Naroda[New,0.75% rate]","Ratofushi Tomi (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30100.png",type:"character"},{year:2022,image:"2022_30101.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Sufu Yaruto (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30101.png",type:"character"},{year:2022,image:"2022_30102.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kukano Zutada[New,0.75% rate]","Karo Fugoro (Original)[New,0.75% rate]","Jito Kiri (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30102.png",type:"character"},{year:2022,image:"2022_30103.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kugo Jiyafu[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30103.png",type:"character"},{year:2022,image:"2022_30104.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Ruto Neraji[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30104.png",type:"character"},{year:2022,image:"2022_30105.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Togozura Rasa[New,0.75% rate]","Tokazu Runo (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30105.png",type:"character"},{year:2022,image:"2022_30106.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rizu Honesu[New,0.75% rate]","Zunama Maya (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30106.png",type:"character"},{year:2022,image:"2022_30107.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Suji Ririru (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30107.png",type:"character"},{year:2022,image:"2022_30108.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yato Tata[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30108.png",type:"character"},{year:2022,image:"2022_30109.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kanatada Gora (Original)[New,0.75% rate]","Kakikato Mida (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30109.png",type:"character"},{year:2022,image:"2022_30110.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Dana Nojiji[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30110.png",type:"character"},{year:2022,image:"2022_30111.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Matomiru Rafuna (Original)[New,0.75% rate]","Mafugosu Noka (Original)[New,0.75% rate]","Yayarano Neshiho[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30111.png",type:"character"},{year:2022,image:"2022_30112.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jira Masa[New,0.75% rate]","Yamiku Neshi (Original)[New,0.75% rate]","Yagosa Fuyazu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30112.png",type:"character"},{year:2022,image:"2022_30113.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Hoku Kamaya (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30113.png",type:"character"},{year:2022,image:"2022_30114.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zurukumi Rusa[New,0.75% rate]","Toya Rozuru (Original)[New,0.75% rate]","Kijisa Neshi[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30114.png",type:"character"},{year:2022,image:"2022_30115.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rirumama Zusuru[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30115.png",type:"character"},{year:2022,image:"2022_30116.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tonoka Nedano (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30116.png",type:"character"},{year:2022,image:"2022_30117.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kihonaro Fugo[New,0.75% rate]","Nosune Daroya[New,0.75% rate]","Mamafu Kikaho[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30117.png",type:"character"},{year:2022,image:"2022_30118.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kushifune Ranaki (Original)[New,0.75% rate]","Yagofuna Yasusa (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30118.png",type:"character"},{year:2022,image:"2022_30119.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Hotoku Maya (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30119.png",type:"character"},{year:2022,image:"2022_30120.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tazu Jiho[New,0.75% rate]","Rika Yamasa[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30120.png",type:"character"},{year:2022,image:"2022_30121.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rasu Netasu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30121.png",type:"character"},{year:2022,image:"2022_30122.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tanekuji Gono[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30122.png",type:"character"},{year:2022,image:"2022_30123.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zugokusa Zumi (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30123.png",type:"character"},{year:2022,image:"2022_30124.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Todayami Tasu[New,0.75% rate]","Fufu Danozu[New,0.75% rate]","Rino Sufu[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30124.png",type:"character"},{year:2022,image:"2022_30125.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nasu Homaru (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30125.png",type:"character"},{year:2022,image:"2022_30126.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jirihoku Fuka[New,0.75% rate]","Nanamaya Yaho (Original)[New,0.75% rate]","Toshikine Ruda[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30126.png",type:"character"},{year:2022,image:"2022_30127.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Ruruki Jigoku[New,0.75% rate]","Datato Tota (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30127.png",type:"character"},{year:2022,image:"2022_30128.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Hotoji Kirimi (Original)[New,0.75% rate]","Narifura Kutoho (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30128.png",type:"character"},{year:2022,image:"2022_30129.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yada Fuma[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30129.png",type:"character"},{year:2022,image:"2022_30130.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shimiro Funema (Original)[New,0.75% rate]","Gosada Tomana (Original)[New,0.75% rate]","Rorukine Tofuno (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30130.png",type:"character"},{year:2022,image:"2022_30131.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mirora Kanone[New,0.75% rate]","None Kusa[New,0.75% rate]","Jihoku Norona[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30131.png",type:"character"},{year:2022,image:"2022_30132.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kumida Mahori (Original)[New,0.75% rate]","Rara Nadana (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30132.png",type:"character"},{year:2022,image:"2022_30133.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Ritarogo Jiru[New,0.75% rate]","Funagori Rizura[New,0.75% rate]","Rotone Tago[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30133.png",type:"character"},{year:2022,image:"2022_30134.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mara Runama[New,0.75% rate]","Suho Ruki[New,0.75% rate]","Kunoriya Toruda[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30134.png",type:"character"},{year:2022,image:"2022_30135.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Goji Susuto (Original)[New,0.75% rate]","Jigo Mago (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30135.png",type:"character"},{year:2022,image:"2022_30136.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jitashika Shifu (Original)[New,0.75% rate]","Gofu Hosa (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30136.png",type:"character"},{year:2022,image:"2022_30137.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nesanogo Rurigo (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30137.png",type:"character"},{year:2022,image:"2022_30138.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jinoshi Dasu[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30138.png",type:"character"},{year:2022,image:"2022_30139.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Darakura Horo (Original)[New,0.75% rate]","Zutone Mizu (Original)[New,0.75% rate]","Sane Ratada[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30139.png",type:"character"},{year:2022,image:"2022_30140.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Samaya Safu (Original)[New,0.75% rate]","Minafuno Rigono[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30140.png",type:"character"},{year:2022,image:"2022_30141.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Furama Kishisu[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30141.png",type:"character"},{year:2022,image:"2022_30142.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Hodasa Tata (Original)[New,0.75% rate]","Gono Safufu (Original)[New,0.75% rate]","Dashishi Kunada[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30142.png",type:"character"},{year:2022,image:"2022_30143.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rahonona Manomi (Original)[New,0.75% rate]","Zutoshika Dara (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30143.png",type:"character"},{year:2022,image:"2022_30144.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Noku Fuka[New,0.75% rate]","Tasariji Shino[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30144.png",type:"character"},{year:2022,image:"2022_30145.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kashimiki Sano (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30145.png",type:"character"},{year:2022,image:"2022_30146.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nagokuro Rokaya (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30146.png",type:"character"},{year:2022,image:"2022_30147.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nakano Dayada (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30147.png",type:"character"},{year:2022,image:"2022_30148.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shine Nakuto (Original)[New,0.75% rate]","Ruraru Noka[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30148.png",type:"character"},{year:2022,image:"2022_30149.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tayata Sufu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30149.png",type:"character"},{year:2022,image:"2022_30150.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Karikaho Daraho (Original)[New,0.75% rate]","Ruka Roya[New,0.75% rate]","Suhoroshi Gogoshi[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30150.png",type:"character"},{year:2022,image:"2022_30151.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Sufusa Kuku (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30151.png",type:"character"},{year:2022,image:"2022_30152.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Toruta Kifugo[New,0.75% rate]","Zuro Kisuku[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30152.png",type:"character"},{year:2022,image:"2022_30153.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kiyakiro Rara[New,0.75% rate]","Miru Dafu[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30153.png",type:"character"},{year:2022,image:"2022_30154.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nezutoda Mihoma[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30154.png",type:"character"},{year:2022,image:"2022_30155.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Sutaneho Gorono[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30155.png",type:"character"},{year:2022,image:"2022_30156.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Safumi Shizuto[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30156.png",type:"character"},{year:2022,image:"2022_30157.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shinashita Nokago (Original)[New,0.75% rate]","Hojirori Nemi (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30157.png",type:"character"},{year:2022,image:"2022_30158.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mazu Tararu[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30158.png",type:"character"},{year:2022,image:"2022_30159.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Maya Jimi[New,0.75% rate]","Safu Rito (Original)[New,0.75% rate]","Radasa Sago (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2022_30159.png",type:"character"},{year:2023,image:"2023_30160.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kaho Ruya[New,0.75% rate]","Zutorasu Mina (Original)[New,0.75% rate]","Ranenafu Totaya[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30160.png",type:"character"},{year:2023,image:"2023_30161.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Fusurono Rushi (Original)[New,0.75% rate]","Noruruna Sutada (Original)[New,0.75% rate]","Kasu Noji[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30161.png",type:"character"},{year:2023,image:"2023_30162.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rimishi Horu[New,0.75% rate]","Nakugoho Zurato (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30162.png",type:"character"},{year:2023,image:"2023_30163.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Neki Kasa[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30163.png",type:"character"},{year:2023,image:"2023_30164.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rane Roshishi[New,0.75% rate]","Maro Ranoma (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30164.png",type:"character"},{year:2023,image:"2023_30165.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tozukiho Tajita[New,0.75% rate]","Rukine Naru (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30165.png",type:"character"},{year:2023,image:"2023_30166.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Surari Nasuki (Original)[New,0.75% rate]","Tosurona Kifu (Original)[New,0.75% rate]","Hoho Yakiji (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30166.png",type:"character"},{year:2023,image:"2023_30167.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jisaya Rojine[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30167.png",type:"character"},{year:2023,image:"2023_30168.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jigota Toshi (Original)[New,0.75% rate]","Raru Tara[New,0.75% rate]","Nokakuna Mamika[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30168.png",type:"character"},{year:2023,image:"2023_30169.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kugori Nakuno[New,0.75% rate]","Rato Nekima[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30169.png",type:"character"},{year:2023,image:"2023_30170.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rizunaku Kika[New,0.75% rate]","Goru Roruri (Original)[New,0.75% rate]","Gozu Tayano (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30170.png",type:"character"},{year:2023,image:"2023_30171.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rafukana Gorara[New,0.75% rate]","Jiru Kushishi[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30171.png",type:"character"},{year:2023,image:"2023_30172.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Namagona Shina (Original)[New,0.75% rate]","Saruro Zuro[New,0.75% rate]","Yamiri Gorusu[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30172.png",type:"character"},{year:2023,image:"2023_30173.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Furu Funeru[New,0.75% rate]","Ruyamasu Nazuji[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30173.png",type:"character"},{year:2023,image:"2023_30174.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Fuzuka Yara[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30174.png",type:"character"},{year:2023,image:"2023_30175.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Gomazuka Rurada[New,0.75% rate]","Miki Dashiro (Original)[New,0.75% rate]","Rika Mizuto[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30175.png",type:"character"},{year:2023,image:"2023_30176.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Gora Horu[New,0.75% rate]","Kito Dago (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30176.png",type:"character"},{year:2023,image:"2023_30177.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kanono Sazuji (Original)[New,0.75% rate]","Jikumita Saroji (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30177.png",type:"character"},{year:2023,image:"2023_30178.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Futo Tarusu[New,0.75% rate]","Shitotofu Hojisu (Original)[New,0.75% rate]","Hofu Safu[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30178.png",type:"character"},{year:2023,image:"2023_30179.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yanotofu Rotoshi[New,0.75% rate]","Nodanosa Kaya[New,0.75% rate]","Sama Kuyaya (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30179.png",type:"character"},{year:2023,image:"2023_30180.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Torumisa Rama (Original)[New,0.75% rate]","Kuma Nedashi[New,0.75% rate]","Fufuda Nokaho (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30180.png",type:"character"},{year:2023,image:"2023_30181.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Ruronago Mafu[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30181.png",type:"character"},{year:2023,image:"2023_30182.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kamaki Gofu[New,0.75% rate]","Nera Kaho[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30182.png",type:"character"},{year:2023,image:"2023_30183.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Runenora Nogo[New,0.75% rate]","Toto Rujita (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30183.png",type:"character"},{year:2023,image:"2023_30184.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Gozu Tadaho (Original)[New,0.75% rate]","Saho Taro (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30184.png",type:"character"},{year:2023,image:"2023_30185.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shiji Runasu (Original)[New,0.75% rate]","Rinoshira Fuyaro (Original)[New,0.75% rate]","Nomama Sutaka (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30185.png",type:"character"},{year:2023,image:"2023_30186.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shiruno Roruya (Original)[New,0.75% rate]","Kajino Rira[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30186.png",type:"character"},{year:2023,image:"2023_30187.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Katakano Kuya[New,0.75% rate]","Nozuruda Toraka (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30187.png",type:"character"},{year:2023,image:"2023_30188.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shimafu Jimi (Original)[New,0.75% rate]","Gosatari Rikaka (Original)[New,0.75% rate]","Kiku Sashi[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30188.png",type:"character"},{year:2023,image:"2023_30189.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zujimiri Kuya[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30189.png",type:"character"},{year:2023,image:"2023_30190.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yaho Dano[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30190.png",type:"character"},{year:2023,image:"2023_30191.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Dasaruka Nashi[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30191.png",type:"character"},{year:2023,image:"2023_30192.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rafu Dago[New,0.75% rate]","Rutakashi Kuki[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30192.png",type:"character"},{year:2023,image:"2023_30193.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kunesa Nari (Original)[New,0.75% rate]","Makishi Nohoya (Original)[New,0.75% rate]","Sasu Rizuri (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30193.png",type:"character"},{year:2023,image:"2023_30194.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Narohoshi Kishi[New,0.75% rate]","Zujikata Toya (Original)[New,0.75% rate]","Rano Rito (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30194.png",type:"character"},{year:2023,image:"2023_30195.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Saya Raneru[New,0.75% rate]","Kafu Zuki[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30195.png",type:"character"},{year:2023,image:"2023_30196.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rusasa Mana[New,0.75% rate]","Daku Kana[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30196.png",type:"character"},{year:2023,image:"2023_30197.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Taki Yarora[New,0.75% rate]","Kisa Noya[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30197.png",type:"character"},{year:2023,image:"2023_30198.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kafu Mihosa[New,0.75% rate]","Nahodaro Gonaka (Original)[New,0.75% rate]","Raro Toto[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30198.png",type:"character"},{year:2023,image:"2023_30199.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zuru Sunada (Original)[New,0.75% rate]","Kurikuzu Shitaji[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30199.png",type:"character"},{year:2023,image:"2023_30200.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shiho Nora[New,0.75% rate]","Kiru Taho[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30200.png",type:"character"},{year:2023,image:"2023_30201.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Dago Suma (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30201.png",type:"character"},{year:2023,image:"2023_30202.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rura Shikigo (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30202.png",type:"character"},{year:2023,image:"2023_30203.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kizu Kaya[New,0.75% rate]","Shitofune Ruto (Original)[New,0.75% rate]","Jirota Fukaho[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30203.png",type:"character"},{year:2023,image:"2023_30204.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shirikita Suta[New,0.75% rate]","Shirakito Ragota (Original)[New,0.75% rate]","Roku Mikada (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30204.png",type:"character"},{year:2023,image:"2023_30205.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Najino Ruka[New,0.75% rate]","Goma Gosushi (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30205.png",type:"character"},{year:2023,image:"2023_30206.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rino Dano (Original)[New,0.75% rate]","Nejikada Jigo (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30206.png",type:"character"},{year:2023,image:"2023_30207.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Sajimika Romasa[New,0.75% rate]","Rorafu Jisa (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30207.png",type:"character"},{year:2023,image:"2023_30208.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Darasazu Rikizu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30208.png",type:"character"},{year:2023,image:"2023_30209.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yaruya Suki[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30209.png",type:"character"},{year:2023,image:"2023_30210.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Darufuri Sahoto (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30210.png",type:"character"},{year:2023,image:"2023_30211.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rima Mafu[New,0.75% rate]","Mahoto Rokugo (Original)[New,0.75% rate]","Shita Suro (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30211.png",type:"character"},{year:2023,image:"2023_30212.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tasaji Kaji[New,0.75% rate]","Rokukita Futo[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30212.png",type:"character"},{year:2023,image:"2023_30213.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Funaka Jiyaya (Original)[New,0.75% rate]","Tama Jida (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30213.png",type:"character"},{year:2023,image:"2023_30214.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Danojiji Yayano (Original)[New,0.75% rate]","Zusahoku Tojisu[New,0.75% rate]","Darisune Fuku (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30214.png",type:"character"},{year:2023,image:"2023_30215.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kiji Yama (Original)[New,0.75% rate]","Ragorano Shisa[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30215.png",type:"character"},{year:2023,image:"2023_30216.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mifunaru Noya (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30216.png",type:"character"},{year:2023,image:"2023_30217.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Narida Nesu[New,0.75% rate]","Nokuna Kifu (Original)[New,0.75% rate]","Hori Mari[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30217.png",type:"character"},{year:2023,image:"2023_30218.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Runoji Tohoshi (Original)[New,0.75% rate]","Kino Rigora[New,0.75% rate]","Zukaneshi Mito[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30218.png",type:"character"},{year:2023,image:"2023_30219.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kamiya Maraho (Original)[New,0.75% rate]","Kamiyata Yashine (Original)[New,0.75% rate]","Yato Kami (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30219.png",type:"character"},{year:2023,image:"2023_30220.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Dananaro Raji[New,0.75% rate]","Horo Kaku[New,0.75% rate]","Rishi Fuhori[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30220.png",type:"character"},{year:2023,image:"2023_30221.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Fudaho Rokazu[New,0.75% rate]","Sano Raneri (Original)[New,0.75% rate]","Yasa Jiroshi[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30221.png",type:"character"},{year:2023,image:"2023_30222.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zutoka Zuji (Original)[New,0.75% rate]","Fusu Goki[New,0.75% rate]","Sazumi Kutafu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30222.png",type:"character"},{year:2023,image:"2023_30223.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Sutasu Nezu (Original)[New,0.75% rate]","Minara Kuruho[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30223.png",type:"character"},{year:2023,image:"2023_30224.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Dafuku Funoku (Original)[New,0.75% rate]","Fugo Kuri[New,0.75% rate]","Zuzuru Darari[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30224.png",type:"character"},{year:2023,image:"2023_30225.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shira Gorimi (Original)[New,0.75% rate]","Ranatashi Dago (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30225.png",type:"character"},{year:2023,image:"2023_30226.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Toya Yada[New,0.75% rate]","Roru Tato (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30226.png",type:"character"},{year:2023,image:"2023_30227.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jimishi Jine (Original)[New,0.75% rate]","Nozu Kushi (Original)[New,0.75% rate]","Rano Kudashi (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30227.png",type:"character"},{year:2023,image:"2023_30228.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jito Sasa[New,0.75% rate]","Kumasago Negogo[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30228.png",type:"character"},{year:2023,image:"2023_30229.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Saka Mane (Original)[New,0.75% rate]","Toku Marika[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30229.png",type:"character"},{year:2023,image:"2023_30230.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Saka Mamaru[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30230.png",type:"character"},{year:2023,image:"2023_30231.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tayane Hoka (Original)[New,0.75% rate]","Susu Kishiku (Original)[New,0.75% rate]","Miku Mika[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30231.png",type:"character"},{year:2023,image:"2023_30232.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Ruyariru Shikiri[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30232.png",type:"character"},{year:2023,image:"2023_30233.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nasukaro Zuji (Original)[New,0.75% rate]","Zuda Zuru[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30233.png",type:"character"},{year:2023,image:"2023_30234.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Marifu Naho (Original)[New,0.75% rate]","Riruta Kasa[New,0.75% rate]","Rono Suro[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30234.png",type:"character"},{year:2023,image:"2023_30235.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nezufu Noku[New,0.75% rate]","Nekida Kira[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30235.png",type:"character"},{year:2023,image:"2023_30236.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Furu Gozu[New,0.75% rate]","Kishigo Zuro (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30236.png",type:"character"},{year:2023,image:"2023_30237.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mashimara Suda[New,0.75% rate]","Totazu Mana (Original)[New,0.75% rate]","Ritofu Yaru[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30237.png",type:"character"},{year:2023,image:"2023_30238.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Noma Sura[New,0.75% rate]","Runesu Zukuri (Original)[New,0.75% rate]","Daku Shikashi[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30238.png",type:"character"},{year:2023,image:"2023_30239.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Dadashi Gonaru (Original)[New,0.75% rate]","Zushitoru Ruzu[New,0.75% rate]","Shisumato Nomada (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2023_30239.png",type:"character"},{year:2024,image:"2024_30240.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yaka Tane (Original)[New,0.75% rate]","Ranesu Kaho[New,0.75% rate]","Mida Mira (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30240.png",type:"character"},{year:2024,image:"2024_30241.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Daya Jinafu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30241.png",type:"character"},{year:2024,image:"2024_30242.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zukika Sufu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30242.png",type:"character"},{year:2024,image:"2024_30243.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mayakaho Nana[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30243.png",type:"character"},{year:2024,image:"2024_30244.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kuzukizu Shigono[New,0.75% rate]","Zunasuka Tano (Original)[New,0.75% rate]","Rurori Dato[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30244.png",type:"character"},{year:2024,image:"2024_30245.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Gofuraru Fune (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30245.png",type:"character"},{year:2024,image:"2024_30246.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Magoro Ruzu[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30246.png",type:"character"},{year:2024,image:"2024_30247.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tazu Mamaji[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30247.png",type:"character"},{year:2024,image:"2024_30248.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tomi Zugo[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30248.png",type:"character"},{year:2024,image:"2024_30249.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Miho Tana[New,0.75% rate]","Fuho Ruji[New,0.75% rate]","Masa Jisuho (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30249.png",type:"character"},{year:2024,image:"2024_30250.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yaromi Shikusu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30250.png",type:"character"},{year:2024,image:"2024_30251.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Sunada Toruta (Original)[New,0.75% rate]","Daki Kifu[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30251.png",type:"character"},{year:2024,image:"2024_30252.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tono Nakisu (Original)[New,0.75% rate]","Kuneku Noji (Original)[New,0.75% rate]","Kufuri Nomana (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30252.png",type:"character"},{year:2024,image:"2024_30253.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mino Miyaya[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30253.png",type:"character"},{year:2024,image:"2024_30254.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Ririsuri Jitoto (Original)[New,0.75% rate]","Gokisa Roda[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30254.png",type:"character"},{year:2024,image:"2024_30255.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yasashiru Kushi (Original)[New,0.75% rate]","Kuzu Sataro (Original)[New,0.75% rate]","Noji Nona (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30255.png",type:"character"},{year:2024,image:"2024_30256.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Todaka Sadami (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30256.png",type:"character"},{year:2024,image:"2024_30257.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Norimi Miri (Original)[New,0.75% rate]","Kusuka Fugoto (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30257.png",type:"character"},{year:2024,image:"2024_30258.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tosago Raku (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30258.png",type:"character"},{year:2024,image:"2024_30259.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Taro Miru (Original)[New,0.75% rate]","Susa Toya (Original)[New,0.75% rate]","Rikaruru Kagoji (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30259.png",type:"character"},{year:2024,image:"2024_30260.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tagosa Fusami (Original)[New,0.75% rate]","Narukito Jikiki[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30260.png",type:"character"},{year:2024,image:"2024_30261.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yashirono Gorigo[New,0.75% rate]","Gohoshito Roto[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30261.png",type:"character"},{year:2024,image:"2024_30262.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rota Dafuto[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30262.png",type:"character"},{year:2024,image:"2024_30263.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rararizu Yafune[New,0.75% rate]","Rona Tono (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30263.png",type:"character"},{year:2024,image:"2024_30264.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Mara Shinoro[New,0.75% rate]","Surosu Nori[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30264.png",type:"character"},{year:2024,image:"2024_30265.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jijishisa Kidane (Original)[New,0.75% rate]","Suhosa Goho (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30265.png",type:"character"},{year:2024,image:"2024_30266.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Naro Zunaya[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30266.png",type:"character"},{year:2024,image:"2024_30267.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Samajisa Goto (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30267.png",type:"character"},{year:2024,image:"2024_30268.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kisune Nono[New,0.75% rate]","Maka Kisago[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30268.png",type:"character"},{year:2024,image:"2024_30269.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Noya Horara (Original)[New,0.75% rate]","Naridaki Suku (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30269.png",type:"character"},{year:2024,image:"2024_30270.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zumiki Tomaki (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30270.png",type:"character"},{year:2024,image:"2024_30271.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tosu Tama (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30271.png",type:"character"},{year:2024,image:"2024_30272.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rukiji Fuyami[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30272.png",type:"character"},{year:2024,image:"2024_30273.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Yagokiki Kishine (Original)[New,0.75% rate]","Kafune Goji[New,0.75% rate]","Zuyamira Kushi (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30273.png",type:"character"},{year:2024,image:"2024_30274.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Roki Misuna (Original)[New,0.75% rate]","Sudashi Raku[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30274.png",type:"character"},{year:2024,image:"2024_30275.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zuka Surika (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30275.png",type:"character"},{year:2024,image:"2024_30276.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shinarami Marito (Original)[New,0.75% rate]","Honeshigo Rikara (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30276.png",type:"character"},{year:2024,image:"2024_30277.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rukuriki Romi[New,0.75% rate]","Sugoyano Noroto[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30277.png",type:"character"},{year:2024,image:"2024_30278.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Daneno Gomi[New,0.75% rate]","Zusa Rufuto[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30278.png",type:"character"},{year:2024,image:"2024_30279.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Runosana Mifu (Original)[New,0.75% rate]","Nakushi Rokaka (Original)[New,0.75% rate]","Fuhota Nenada[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30279.png",type:"character"},{year:2024,image:"2024_30280.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Goku Shino (Original)[New,0.75% rate]","Fuda Nema[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30280.png",type:"character"},{year:2024,image:"2024_30281.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kata Mara[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30281.png",type:"character"},{year:2024,image:"2024_30282.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tazuru Ruru (Original)[New,0.75% rate]","Rufurofu Zuto (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30282.png",type:"character"},{year:2024,image:"2024_30283.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kuta Hoki[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30283.png",type:"character"},{year:2024,image:"2024_30284.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kuho Kinane[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30284.png",type:"character"},{year:2024,image:"2024_30285.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Najino Risaku (Original)[New,0.75% rate]","Mimaka Zuno (Original)[New,0.75% rate]","Ramaro Saki (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30285.png",type:"character"},{year:2024,image:"2024_30286.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Futaho Kuru[New,0.75% rate]","Gogona Yaji (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30286.png",type:"character"},{year:2024,image:"2024_30287.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Minenoya Ruyato (Original)[New,0.75% rate]","Rakiku Rufuku (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30287.png",type:"character"},{year:2024,image:"2024_30288.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Zuda Yaraka (Original)[New,0.75% rate]","Raya Naka (Original)[New,0.75% rate]","Gozugo Shifune[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30288.png",type:"character"},{year:2024,image:"2024_30289.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Rukuji Rosuki (Original)[New,0.75% rate]","Yaro Kiru[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30289.png",type:"character"},{year:2024,image:"2024_30290.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Gosanane Suki (Original)[New,0.75% rate]","Fufusami Saku[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30290.png",type:"character"},{year:2024,image:"2024_30291.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kiranora Kano[New,0.75% rate]","Misano Gota[New,0.75% rate]","Funaneku Suno[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30291.png",type:"character"},{year:2024,image:"2024_30292.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Jiraka Hoto[New,0.75% rate]","Nonano Goma (Original)[New,0.75% rate]","Yaho Kigo (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30292.png",type:"character"},{year:2024,image:"2024_30293.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Goro Kasuru (Original)[New,0.75% rate]","Toku Daka[New,0.75% rate]","Homa Kato (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30293.png",type:"character"},{year:2024,image:"2024_30294.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nezuro Fuyato[New,0.75% rate]","Mida Kifu[New,0.75% rate]","Raru Hofu (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30294.png",type:"character"},{year:2024,image:"2024_30295.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Shiru Zuzuji (Original)[New,0.75% rate]","Zukiya Daruno[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30295.png",type:"character"},{year:2024,image:"2024_30296.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Notano Nekiru (Original)[New,0.75% rate]","Dari Hoshika (Original)[New,0.75% rate]","Rita Tada[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30296.png",type:"character"},{year:2024,image:"2024_30297.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Nayari Sari[New,0.75% rate]","Shisa Rigoda[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30297.png",type:"character"},{year:2024,image:"2024_30298.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Kishikiri Gofune (Original)[New,0.75% rate]","Kuyanaku Daru (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30298.png",type:"character"},{year:2024,image:"2024_30299.png",start_date:"1 Jan 2026, 5:00",pickup_characters:["Tazuki Zuzu (Original)[New,0.75% rate]","Hofu Kana (Original)[New,0.75% rate]","Nenaya Shine[New,0.75% rate]"],image_path:"assets/images/character/banner/2024_30299.png",type:"character"}];export{Bn as TimelineComponent};
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""Load generator: N dashboards polling /api/events.
+
+Each simulated dashboard keeps one HTTP/1.1 keep-alive connection and polls
+`/api/events` every `--interval` seconds (with jitter; 0 polls back to back).
+A `--conditional` fraction of them send `If-None-Match` with the last ETag,
+like a browser revalidating. Optionally a refresh is triggered part-way
+through, so serving latency during refresh work can be compared with idle:
+
+    python bench/loadgen.py --dashboards 50 --interval 1 --duration 30
+    python bench/loadgen.py --dashboards 20 --interval 0 --conditional 0.5 --refresh-at 5
+
+Reports throughput and p50/p95/p99 latency overall, per request kind
+(conditional / unconditional) and per phase (idle / refreshing). Uses only the
+standard library so it runs on the Pi itself.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from urllib.parse import urlsplit
+
+
+class _Connection:
+    """Minimal keep-alive HTTP/1.1 client (Content-Length and chunked bodies)."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def request(self, method: str, path: str, headers: dict | None = None) -> tuple[int, dict, bytes]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", "Connection: keep-alive"]
+        lines += [f"{k}: {v}" for k, v in (headers or {}).items()]
+        if method != "GET":
+            lines.append("Content-Length: 0")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed")
+        status = int(status_line.split()[1])
+        resp_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            resp_headers[name.strip().lower()] = value.strip()
+
+        if "content-length" in resp_headers:
+            body = await self.reader.readexactly(int(resp_headers["content-length"]))
+        elif resp_headers.get("transfer-encoding", "").lower() == "chunked":
+            parts = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                parts.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            body = b"".join(parts)
+        else:
+            body = b""
+        if resp_headers.get("connection", "").lower() == "close":
+            await self.close()
+        return status, resp_headers, body
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except Exception:
+                pass
+        self.reader = self.writer = None
+
+
+class _Phase:
+    """Wall-clock windows during which a refresh was running."""
+
+    def __init__(self):
+        self.windows: list[list[float]] = []
+
+    def at(self, ts: float) -> str:
+        for start, end in self.windows:
+            if start <= ts and (end is None or ts <= end):
+                return "refreshing"
+        return "idle"
+
+
+async def _dashboard(conn: _Connection, args, conditional: bool, deadline: float, results: list, phase: _Phase, rnd):
+    etag = ""
+    # Spread the first polls so N dashboards don't fire in lockstep.
+    if args.interval:
+        await asyncio.sleep(rnd.uniform(0, args.interval))
+    while time.monotonic() < deadline:
+        headers = {"If-None-Match": etag} if conditional and etag else {}
+        started = time.monotonic()
+        try:
+            status, resp_headers, body = await conn.request("GET", "/api/events", headers)
+            etag = resp_headers.get("etag", etag)
+        except Exception:
+            status, body = "error", b""
+            await conn.close()
+        latency = time.monotonic() - started
+        results.append({
+            "status": status,
+            "latency": latency,
+            "bytes": len(body),
+            "kind": "conditional" if headers else "unconditional",
+            "phase": phase.at(started),
+        })
+        if args.interval:
+            await asyncio.sleep(max(0.0, args.interval * rnd.uniform(0.9, 1.1) - latency))
+    await conn.close()
+
+
+async def _trigger_refresh(args, host: str, port: int, phase: _Phase) -> None:
+    await asyncio.sleep(args.refresh_at)
+    conn = _Connection(host, port)
+    window = [time.monotonic(), None]
+    phase.windows.append(window)
+    try:
+        _, _, body = await conn.request("POST", "/api/refresh")
+        refresh_id = json.loads(body).get("refresh_id")
+        print(f"refresh {refresh_id} started at t={args.refresh_at:.1f}s", flush=True)
+        # The trace appears when the refresh finishes.
+        while refresh_id:
+            status, _, _ = await conn.request("GET", f"/api/refresh/{refresh_id}/trace")
+            if status == 200:
+                break
+            await asyncio.sleep(0.25)
+    finally:
+        window[1] = time.monotonic()
+        await conn.close()
+    print(f"refresh finished after {window[1] - window[0]:.1f}s", flush=True)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(results: list[dict], elapsed: float) -> dict:
+    def stats(rows: list[dict]) -> dict:
+        lat = sorted(r["latency"] for r in rows if r["status"] != "error")
+        statuses: dict[str, int] = {}
+        for r in rows:
+            statuses[str(r["status"])] = statuses.get(str(r["status"]), 0) + 1
+        return {
+            "requests": len(rows),
+            "statuses": statuses,
+            "bytes": sum(r["bytes"] for r in rows),
+            "p50_ms": _percentile(lat, 50) * 1000,
+            "p95_ms": _percentile(lat, 95) * 1000,
+            "p99_ms": _percentile(lat, 99) * 1000,
+            "max_ms": (lat[-1] if lat else 0.0) * 1000,
+        }
+
+    out = {"elapsed_s": elapsed, "throughput_rps": len(results) / elapsed if elapsed else 0.0, "all": stats(results)}
+    for key in ("kind", "phase"):
+        for value in sorted({r[key] for r in results}):
+            out[value] = stats([r for r in results if r[key] == value])
+    return out
+
+
+def _print_summary(summary: dict) -> None:
+    print(f"\n{summary['throughput_rps']:.1f} req/s over {summary['elapsed_s']:.1f}s")
+    print(f"{'':<14} {'requests':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}  statuses")
+    for name, s in summary.items():
+        if not isinstance(s, dict):
+            continue
+        print(
+            f"{name:<14} {s['requests']:>9} {s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f} {s['p99_ms']:>9.1f} "
+            f"{s['max_ms']:>9.1f}  {s['statuses']}"
+        )
+
+
+async def run(args) -> dict:
+    parts = urlsplit(args.url)
+    host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    rnd = random.Random(args.seed)
+    phase = _Phase()
+    results: list[dict] = []
+
+    n_conditional = int(round(args.dashboards * args.conditional))
+    started = time.monotonic()
+    deadline = started + args.duration
+    tasks = [
+        _dashboard(_Connection(host, port), args, i < n_conditional, deadline, results, phase, random.Random(rnd.random()))
+        for i in range(args.dashboards)
+    ]
+    if args.refresh_at is not None:
+        tasks.append(_trigger_refresh(args, host, port, phase))
+    await asyncio.gather(*tasks)
+    return summarize(results, time.monotonic() - started)
+
+
+def main_cli() -> None:
+    parser = argparse.ArgumentParser(description="Simulate dashboards polling /api/events.")
+    parser.add_argument("--url", default="http://127.0.0.1:8003", help="tracker base URL")
+    parser.add_argument("--dashboards", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between polls per dashboard (0 = back to back)")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds to run")
+    parser.add_argument("--conditional", type=float, default=0.0, help="fraction of dashboards sending If-None-Match")
+    parser.add_argument("--refresh-at", type=float, default=None, help="trigger POST /api/refresh after this many seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", default="", help="also write the summary to this file")
+    args = parser.parse_args()
+
+    summary = asyncio.run(run(args))
+    _print_summary(summary)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main_cli()
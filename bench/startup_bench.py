@@ -0,0 +1,139 @@
+"""Cold-start benchmark: how long until a fresh `python main.py` answers /api/events.
+
+Starts the fake upstream in-process (so the startup refresh runs offline),
+then launches the tracker `--runs` times and reports per run the wall time
+from spawn to the first 200 from /api/events plus the phases the tracker
+measured itself (uma_startup_seconds: imports, module body, startup hook,
+process age at the first response). Also lists the slowest top-level imports
+of `import main` (python -X importtime) and whether the scraping stack was
+among them. Exits non-zero when the median misses the target:
+
+    python bench/startup_bench.py --runs 5 --target 3
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(HERE, "..")
+sys.path.insert(0, HERE)
+
+import crawl_bench  # noqa: E402
+
+SCRAPING_MODULES = ("requests", "bs4", "uvicorn")
+
+
+def _env(base_url: str, state_dir: str) -> dict:
+    return {
+        **os.environ,
+        "UMA_UPSTREAM_BASE_URL": base_url,
+        "UMA_TRACE_FILE": "",
+        "UMA_STATE_DB": os.path.join(state_dir, "state.sqlite3"),
+        "UMA_ASSET_CACHE_DIR": "",
+    }
+
+
+def _get(url: str, timeout: float = 1.0) -> tuple[int, bytes]:
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, b""
+
+
+def import_times(env: dict) -> tuple[list[tuple[str, float]], set[str]]:
+    """Modules main.py imports directly, slowest first (cumulative seconds), and every module it pulled in."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    # -X importtime prints children before their parent, indented two spaces per level.
+    block: list[tuple[str, float]] = []
+    for line in out.stderr.splitlines():
+        m = re.match(r"import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)$", line)
+        if not m:
+            continue
+        name, depth, seconds = m.group(3), len(m.group(2)) // 2, int(m.group(1)) / 1e6
+        if depth == 0:
+            if name == "main":
+                direct = [(n, s) for n, s, d in block if d == 1]
+                return sorted(direct, key=lambda r: -r[1]), {n for n, _, _ in block}
+            block = []
+        else:
+            block.append((name, seconds, depth))
+    raise RuntimeError("`import main` failed:\n" + out.stderr[-2000:])
+
+
+def run_once(env: dict, port: int, timeout: float) -> dict:
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "main.py", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"main.py exited with {proc.returncode}")
+            if time.perf_counter() - started > timeout:
+                raise RuntimeError(f"no response within {timeout:.0f}s")
+            try:
+                status, _ = _get(f"http://127.0.0.1:{port}/api/events", timeout=0.5)
+            except OSError:
+                status = 0
+            if status == 200:
+                break
+            time.sleep(0.01)
+        wall = time.perf_counter() - started
+        _, metrics = _get(f"http://127.0.0.1:{port}/metrics")
+        phases = {
+            m.group(1): float(m.group(2))
+            for m in re.finditer(r'^uma_startup_seconds\{phase="(\w+)"\} (\S+)$', metrics.decode(), re.M)
+        }
+        return {"wall": wall, **phases}
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def main_cli() -> None:
+    parser = argparse.ArgumentParser(description="Time from launching main.py to its first /api/events response.")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--target", type=float, default=float(os.environ.get("UMA_STARTUP_TARGET_SECONDS", "3")),
+                        help="seconds to the first response (default UMA_STARTUP_TARGET_SECONDS or 3)")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--top", type=int, default=8, help="slowest top-level imports to list")
+    args = parser.parse_args()
+
+    server, base_url = crawl_bench.start_server({}, None)
+    with tempfile.TemporaryDirectory() as state_dir:
+        env = _env(base_url, state_dir)
+        direct, loaded = import_times(env)
+        print("slowest imports of main.py:")
+        for name, seconds in direct[:args.top]:
+            print(f"  {name:<28} {seconds * 1000:8.1f} ms")
+        scraping = [m for m in SCRAPING_MODULES if m in loaded]
+        print(f"scraping stack imported by `import main`: {', '.join(scraping) or 'none'}\n")
+
+        results = []
+        for i in range(args.runs):
+            res = run_once(env, crawl_bench._free_port(), args.timeout)
+            results.append(res)
+            phases = ", ".join(f"{k} {v:.3f}s" for k, v in res.items() if k != "wall")
+            print(f"run {i}: first response after {res['wall']:.2f}s ({phases})")
+    server.should_exit = True
+
+    median = statistics.median(r["wall"] for r in results)
+    verdict = "ok" if median <= args.target else "MISSED"
+    print(f"\nmedian time to first response {median:.2f}s, target {args.target:g}s: {verdict}")
+    sys.exit(0 if median <= args.target else 1)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,347 @@
+"""Synthetic upstream documents shaped like GameTora, Game8 and uma.moe pages.
+
+Every generator takes a `scale` factor; scale 1 roughly matches the size of the
+live pages (about 120 event slugs, 30 Game8 rows, 60 story events / 40 Champions
+Meetings / 300 character banners in the uma.moe chunk, 150 character and 250
+support cards per region). Output is deterministic for a given scale and seed.
+
+The checked-in files under bench/fixtures/ are scale-1 output of these
+generators; regenerate them with:
+
+    python bench/synthetic.py --write-fixtures
+"""
+
+import argparse
+import json
+import os
+import random
+import struct
+import zlib
+from datetime import datetime, timedelta, timezone
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Fixed reference time so generated dates don't drift between runs.
+BASE_TS = int(datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp())
+
+_SYLLABLES = [
+    "ka", "ki", "sa", "to", "no", "mi", "ya", "ta", "ri", "su", "zu", "ra",
+    "ma", "na", "ho", "shi", "ro", "da", "ku", "ne", "go", "ru", "fu", "ji",
+]
+_TRACKS = ["Tokyo", "Nakayama", "Hanshin", "Kyoto", "Chukyo", "Sapporo", "Hakodate", "Niigata", "Fukushima", "Kokura"]
+_DISTANCES = ["1200m", "1400m", "1600m", "1800m", "2000m", "2200m", "2400m", "2500m", "3000m", "3200m"]
+_CONDITIONS = ["Turf / Good", "Turf / Firm", "Turf / Soft", "Dirt / Good", "Dirt / Heavy"]
+_SIGNS = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
+
+def _name(rnd: random.Random) -> str:
+    first = "".join(rnd.choice(_SYLLABLES) for _ in range(rnd.randint(2, 4))).title()
+    last = "".join(rnd.choice(_SYLLABLES) for _ in range(rnd.randint(2, 3))).title()
+    return f"{first} {last}"
+
+
+def _next_data_script(page_props: dict) -> str:
+    payload = {"props": {"pageProps": page_props}, "page": "/", "query": {}, "buildId": "bench"}
+    return f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(payload)}</script>'
+
+
+def _page(body: str, head: str = "") -> str:
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"{head}</head><body><div id=\"__next\">{body}</div></body></html>"
+    )
+
+
+def _human_date(ts: int) -> str:
+    # uma.moe style: "30 May 2025, 5:00" (September is written "Sept")
+    dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+    month = dt.strftime("%b")
+    if month == "Sep":
+        month = "Sept"
+    return f"{dt.day} {month} {dt.year}, 5:00"
+
+
+# --- GameTora -------------------------------------------------------------------
+
+def gacha_props(scale: int = 1, seed: int = 1, regions: tuple[str, ...] = ("ja", "en", "ko", "zh_tw")) -> dict:
+    """__NEXT_DATA__ pageProps of /umamusume/gacha."""
+    rnd = random.Random(seed)
+    char_n = 150 * scale
+    support_n = 250 * scale
+    props: dict = {"charCardData": {}, "supportCardData": {}, "currentCharBanners": {}, "currentSupportBanners": {}}
+    for region in regions:
+        chars = [
+            {"id": 100000 + i, "name": _name(rnd), "rarity": rnd.randint(1, 3), "char_id": 1000 + i % 120}
+            for i in range(char_n)
+        ]
+        supports = [
+            {
+                "id": 200000 + i,
+                "name": _name(rnd),
+                "rarity": rnd.randint(1, 3),
+                "type": rnd.choice(["speed", "stamina", "power", "guts", "wisdom", "friend"]),
+            }
+            for i in range(support_n)
+        ]
+        props["charCardData"][region] = chars
+        props["supportCardData"][region] = supports
+        props["currentCharBanners"][region] = [
+            {
+                "id": 30000 + i,
+                "start": BASE_TS - 86400 * 3,
+                "end": BASE_TS + 86400 * (7 + i),
+                "pickups": [[chars[rnd.randrange(char_n)]["id"], 0.75] for _ in range(rnd.randint(1, 3))],
+            }
+            for i in range(2 * scale)
+        ]
+        props["currentSupportBanners"][region] = [
+            {
+                "id": 40000 + i,
+                "start": BASE_TS - 86400 * 3,
+                "end": BASE_TS + 86400 * (7 + i),
+                "pickups": [[supports[rnd.randrange(support_n)]["id"], 0.75] for _ in range(rnd.randint(1, 3))],
+            }
+            for i in range(2 * scale)
+        ]
+    return props
+
+
+def gacha_html(scale: int = 1, seed: int = 1) -> str:
+    nav = "".join(f'<a href="/umamusume/gacha/history?page={i}">History {i}</a>' for i in range(20))
+    return _page(f"<main><h1>Gacha</h1>{nav}</main>{_next_data_script(gacha_props(scale, seed))}")
+
+
+def event_slugs(scale: int = 1, seed: int = 2) -> list[str]:
+    rnd = random.Random(seed)
+    out = []
+    seen = set()
+    while len(out) < 120 * scale:
+        slug = "-".join(rnd.choice(_SYLLABLES) + rnd.choice(_SYLLABLES) for _ in range(rnd.randint(2, 4)))
+        if slug not in seen:
+            seen.add(slug)
+            out.append(slug)
+    return out
+
+
+def story_list_html(scale: int = 1, seed: int = 2) -> str:
+    """/umamusume/events/story-events: a grid of links to each event page."""
+    cards = "".join(
+        f'<div class="event-card"><a href="/umamusume/events/{slug}"><img src="/images/umamusume/events/thumb_{i}.png">'
+        f"<span>{slug.replace('-', ' ').title()}</span></a></div>"
+        for i, slug in enumerate(event_slugs(scale, seed))
+    )
+    nav = '<a href="/umamusume/events">Events</a><a href="/umamusume/events/story-events">Story Events</a>'
+    return _page(f"<nav>{nav}</nav><main>{cards}</main>")
+
+
+def event_page_html(slug: str, index: int = 0, seed: int = 3) -> str:
+    """/umamusume/events/{slug}: eventData in __NEXT_DATA__ plus the banner image."""
+    rnd = random.Random(f"{seed}:{slug}")
+    # Spread events around BASE_TS: most in the past, a few current/upcoming.
+    start = BASE_TS + 86400 * (index * -7 + 21)
+    end = start + 86400 * rnd.randint(7, 14)
+    banner = f"/images/umamusume/events/{2025 + index % 2}/{slug.replace('-', '_')}_banner.png"
+    missions = "".join(f"<li>Mission {i}: clear {rnd.randint(1, 20)} races</li>" for i in range(15))
+    props = {
+        "eventData": {
+            "id": 1000 + index,
+            "start": start,
+            "end": end,
+            "name_en": slug.replace("-", " ").title(),
+            "name_jp": "イベント",
+            "rewards": [{"item": rnd.randint(1, 500), "count": rnd.randint(1, 50)} for _ in range(20)],
+        }
+    }
+    head = f'<meta property="og:image" content="https://gametora.com{banner}">'
+    return _page(f'<main><img src="{banner}"><ul>{missions}</ul></main>{_next_data_script(props)}', head)
+
+
+def home_html(scale: int = 1, seed: int = 4) -> str:
+    """/umamusume: the "Current Mission Events" section is all we read."""
+    rnd = random.Random(seed)
+    items = "".join(
+        f'<div><a href="/umamusume/missions/{i}"><img src="/images/umamusume/missions/m_{i}.png">Mission Event {i}</a>'
+        f'<div class="text-small">Ends {rnd.randint(1, 28)} Jan 2026, 22:00</div></div>'
+        for i in range(3 * scale)
+    )
+    filler = "".join(f"<p>News item {i}</p>" for i in range(100 * scale))
+    return _page(f"<h2>News</h2>{filler}<h2>Current Mission Events</h2><div>{items}</div><h2>Other</h2>")
+
+
+def champions_meeting_html() -> str:
+    return _page('<main><img src="/images/umamusume/events/champions_meeting_banner.png"></main>')
+
+
+def banner_png(path: str, width: int = 1024, height: int = 256) -> bytes:
+    """A banner-sized PNG whose colours depend on `path` (what the image URLs serve)."""
+    rnd = random.Random(path)
+    row = b"\x00" + bytes(rnd.randrange(256) for _ in range(3)) * width
+    raw = zlib.compress(row * height, 6)
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", raw) + chunk(b"IEND", b"")
+
+
+# --- Game8 ----------------------------------------------------------------------
+
+def game8_date_strings(scale: int = 1, seed: int = 5) -> list[str]:
+    rnd = random.Random(seed)
+    out = []
+    for _ in range(100 * scale):
+        dt = datetime.fromtimestamp(BASE_TS + 86400 * rnd.randint(-60, 240), tz=timezone.utc)
+        end = dt + timedelta(days=rnd.randint(7, 12))
+        kind = rnd.randrange(4)
+        if kind == 0:
+            out.append(f"{dt.strftime('%b')}. {dt.day} - {end.strftime('%b')}. {end.day}, {end.year}")
+        elif kind == 1:
+            out.append(f"{dt.strftime('%b')}. {dt.day}, {dt.year} - {end.strftime('%b')}. {end.day}, {end.year}")
+        elif kind == 2:
+            out.append(f"{rnd.choice(['Early', 'Mid', 'Late'])} {dt.strftime('%B')} {dt.year}")
+        else:
+            out.append(f"{dt.strftime('%B')} {dt.year}")
+    return out
+
+
+def game8_html(scale: int = 1, seed: int = 5) -> str:
+    """Game8 banner schedule: month tables plus the "Expected Banner Schedule" table."""
+    rnd = random.Random(seed)
+    dates = game8_date_strings(scale, seed)
+    sections = []
+    per_table = 10
+    months = 2 * scale
+    for m in range(months):
+        dt = datetime.fromtimestamp(BASE_TS + 86400 * 30 * m, tz=timezone.utc)
+        rows = "".join(
+            f"<tr><td>{_name(rnd)}</td><td>{dates[(m * per_table + r) % len(dates)]}</td></tr>"
+            for r in range(per_table)
+        )
+        sections.append(
+            f"<h2>{dt.strftime('%B %Y')} Banners</h2>"
+            f"<table><tr><th>Banner</th><th>Availability (UTC)</th></tr>{rows}</table>"
+        )
+    expected = "".join(
+        f"<tr><td>{_name(rnd)}</td><td>{_name(rnd)}</td><td>{rnd.choice(['Early', 'Mid', 'Late'])} "
+        f"{datetime.fromtimestamp(BASE_TS + 86400 * 30 * (r + 3), tz=timezone.utc).strftime('%B %Y')}</td></tr>"
+        for r in range(per_table * scale)
+    )
+    sections.append(
+        "<h2>Expected Banner Schedule</h2>"
+        f"<table><tr><th>Character</th><th>Support Cards</th><th>Est. Release Date</th></tr>{expected}</table>"
+    )
+    filler = "".join(f"<p>Guide paragraph {i}</p>" for i in range(200 * scale))
+    return _page(f"<article>{filler}{''.join(sections)}</article>")
+
+
+# --- uma.moe --------------------------------------------------------------------
+
+def uma_timeline_html() -> str:
+    return _page("<app-root></app-root>", '<script src="main-BENCH1234.js" type="module"></script>')
+
+
+def uma_main_js() -> str:
+    routes = ",".join(f'{{path:"p{i}",loadComponent:()=>import("./chunk-P{i:04d}.js")}}' for i in range(30))
+    return f'var routes=[{routes},{{path:"timeline",loadComponent:()=>import("./chunk-TIMELINE1.js")}}];'
+
+
+def uma_chunk_js(scale: int = 1, seed: int = 6) -> str:
+    """The Timeline component chunk: launch constants, confirmed-date maps and datasets."""
+    rnd = random.Random(seed)
+    jp_launch = datetime(2021, 2, 24, tzinfo=timezone.utc)
+
+    story = []
+    story_confirmed = []
+    for i in range(60 * scale):
+        jp = jp_launch + timedelta(days=14 * i)
+        image = f"story_{i:04d}.png"
+        story.append(
+            f'{{event_name:"{_name(rnd)} Story",image:"{image}",'
+            f'start_date:"{_human_date(int(jp.timestamp()))}",end_date:"{_human_date(int((jp + timedelta(days=9)).timestamp()))}"}}'
+        )
+        if i < 20 * scale:
+            gl = datetime(2025, 6, 26, 22, tzinfo=timezone.utc) + timedelta(days=9 * i)
+            story_confirmed.append(f'["{image}",new Date(Date.UTC({gl.year},{gl.month - 1},{gl.day},22,0,0))]')
+
+    cms = []
+    cm_confirmed = []
+    for i in range(40 * scale):
+        jp = jp_launch + timedelta(days=30 * i + 60)
+        cms.append(
+            f'{{name:"{rnd.choice(_SIGNS)} Cup",start_date:"{_human_date(int(jp.timestamp()))}",'
+            f'end_date:"{_human_date(int((jp + timedelta(days=6)).timestamp()))}",track:"{rnd.choice(_TRACKS)}",'
+            f'distance:"{rnd.choice(_DISTANCES)}",conditions:"{rnd.choice(_CONDITIONS)}"}}'
+        )
+        if i < 10 * scale:
+            gl = datetime(2025, 8, 1, 22, tzinfo=timezone.utc) + timedelta(days=20 * i)
+            cm_confirmed.append(
+                f'["champions_meeting_{i}",new Date(Date.UTC({gl.year},{gl.month - 1},{gl.day},22,0,0))]'
+            )
+
+    banners = []
+    for i in range(300 * scale):
+        year = 2021 + i // 80
+        image = f"{year}_{30000 + i}.png"
+        pickups = ",".join(
+            f'"{_name(rnd)}{" (Original)" if rnd.random() < 0.5 else ""}[New,0.75% rate]"'
+            for _ in range(rnd.randint(1, 3))
+        )
+        banners.append(
+            f'{{year:{year},image:"{image}",start_date:"{_human_date(BASE_TS)}",'
+            f'pickup_characters:[{pickups}],image_path:"assets/images/character/banner/{image}",type:"character"}}'
+        )
+
+    # Minified component code in between, like the real chunk.
+    filler = ";".join(f"function f{i}(t){{return t.map(e=>e*{i}).filter(Boolean)}}" for i in range(400 * scale))
+    return (
+        f"import{{a as t}}from\"./chunk-CORE.js\";{filler};"
+        "var ee=new Date(Date.UTC(2021,1,24)),_e=new Date(Date.UTC(2025,5,26)),me=1.6;"
+        f"var Qt=new Map([{','.join(story_confirmed)}]);"
+        f"var Xt=new Map([{','.join(cm_confirmed)}]);"
+        f"var Vt=[{','.join(story)}];"
+        f"var jt=[{','.join(cms)}];"
+        f"var Bn=[{','.join(banners)}];"
+        "export{Bn as TimelineComponent};"
+    )
+
+
+# --- Fixture files --------------------------------------------------------------
+
+def fixture_documents() -> dict[str, str]:
+    """File name -> content of the scale-1 fixture set."""
+    docs = {
+        "gametora_home.html": home_html(),
+        "gametora_gacha.html": gacha_html(),
+        "gametora_story_events.html": story_list_html(),
+        "gametora_event.html": event_page_html(event_slugs()[0]),
+        "gametora_champions_meeting.html": champions_meeting_html(),
+        "game8_banners.html": game8_html(),
+        "uma_moe_timeline.html": uma_timeline_html(),
+        "uma_moe_main.js": uma_main_js(),
+        "uma_moe_timeline_chunk.js": uma_chunk_js(),
+    }
+    return docs
+
+
+def write_fixtures(directory: str = FIXTURES_DIR) -> None:
+    os.makedirs(directory, exist_ok=True)
+    for name, content in fixture_documents().items():
+        with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+            f.write(content)
+        print(f"wrote {name} ({len(content.encode('utf-8')):,} bytes)")
+
+
+def read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic upstream documents.")
+    parser.add_argument("--write-fixtures", action="store_true", help="(re)write the scale-1 files in bench/fixtures/")
+    args = parser.parse_args()
+    if args.write_fixtures:
+        write_fixtures()
+    else:
+        parser.print_help()
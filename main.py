@@ -1,16 +1,67 @@
-import uvicorn
-from fastapi import FastAPI, HTTPException
+import time
+
+# Taken before the heavy imports; see the startup report below.
+_STARTUP_T0 = time.perf_counter()
+
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-import requests
-from bs4 import BeautifulSoup
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import BaseModel
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+import argparse
+import asyncio
+import bisect
+import gzip
+import hashlib
+import hmac
+import sys
+import tempfile
 import threading
-import time
 import json
+import cProfile
+import io
+import itertools
+import marshal
+import math
+import pstats
 import os
+import random
 from datetime import datetime, timedelta, timezone
 import logging
+import logging.handlers
 import re
+import sqlite3
+import statistics
+import struct
+import uuid
+import contextvars
+from collections import OrderedDict
+from contextlib import contextmanager
+import tracemalloc
+import unicodedata
+from array import array
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from threading import Lock
+from typing import TYPE_CHECKING
+
+# The scraping stack (requests, bs4) is imported where it is used, so serving
+# /api/events never loads it; the first refresh does.
+if TYPE_CHECKING:
+    import requests
+    from bs4 import BeautifulSoup
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+try:
+    from PIL import Image
+except ImportError:  # Optional: only needed for downscaled /api/assets variants
+    Image = None
+
+_STARTUP_IMPORTED = time.perf_counter()
 
 # Configure logging
 logging.basicConfig(
@@ -36,16 +87,689 @@ events_cache = {
     "events": [],
     "upcoming_banners": [],
     "upcoming_events": [],
-    "last_updated": None
+    "last_updated": None,
+    "version": 0,
+    # Current banners per GameTora region ("en" is Global, same as "banners").
+    "region_banners": {},
 }
 
 _uma_char_banner_image_cache: dict[str, object] = {
     "map": {},
+    "matcher": None,
+    # Banner ID -> {"imageUrl", "pickups": [(name, rate)]}, for /api/banners/{id}/simulate.
+    "rates": {},
     "fetched_at": 0,
 }
 
 _refresh_lock = Lock()
-_refresh_in_progress = False
+
+# Refresh memory budget. The Pi has little RAM, so a refresh can be told to stay
+# under a resident-set-size budget (MiB, 0 disables). When the budget is
+# approached, page fetches run with fewer workers and low-priority work
+# (best-effort image lookups) is skipped for that refresh.
+REFRESH_RSS_BUDGET_MB = int(os.environ.get("UMA_REFRESH_RSS_BUDGET_MB", "0") or 0)
+REFRESH_MAX_WORKERS = max(1, int(os.environ.get("UMA_REFRESH_MAX_WORKERS", "4") or 4))
+# tracemalloc adds noticeable overhead on the Pi, so Python-level allocation
+# peaks are only tracked when explicitly enabled.
+REFRESH_TRACEMALLOC = os.environ.get("UMA_REFRESH_TRACEMALLOC", "") == "1"
+# Items kept per upcoming section; /api/events clients can ask for fewer with ?limit=.
+UPCOMING_ITEMS = max(1, int(os.environ.get("UMA_UPCOMING_ITEMS", "5") or 5))
+
+_last_refresh_memory: dict = {}
+
+
+def _current_rss_bytes() -> int:
+    """Current resident set size of this process (0 when unknown)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    if resource is None:
+        return 0
+    try:
+        # Not the current RSS but the process peak; the best we can do off Linux.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KiB on Linux and bytes on macOS.
+        return int(peak) if os.uname().sysname == "Darwin" else int(peak) * 1024
+    except Exception:
+        return 0
+
+
+# tracemalloc is process-wide but used by refresh memory tracking and by
+# profile sessions that can overlap, so starts/stops are reference counted:
+# whoever releases last stops it (unless it was already tracing on its own).
+_tracemalloc_lock = Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+
+
+def _tracemalloc_acquire(nframes: int = 1) -> None:
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(nframes)
+            _tracemalloc_owned = True
+        _tracemalloc_users += 1
+
+
+def _tracemalloc_release() -> None:
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        _tracemalloc_users = max(0, _tracemalloc_users - 1)
+        if _tracemalloc_users == 0 and _tracemalloc_owned:
+            tracemalloc.stop()
+            _tracemalloc_owned = False
+
+
+class _RefreshMemory:
+    """Tracks memory across one refresh and answers budget questions for it."""
+
+    def __init__(self, budget_mb: int = 0, trace: bool = False):
+        self.budget_bytes = max(0, int(budget_mb)) * 1024 * 1024
+        self.trace = trace
+        self.traced = False
+        self.start_rss = _current_rss_bytes()
+        self.peak_rss = self.start_rss
+        self.stages: dict[str, int] = {}
+        self.deferred: list[str] = []
+        self._lock = Lock()
+
+    def start(self) -> None:
+        if self.trace:
+            _tracemalloc_acquire()
+            self.traced = True
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+    def stop(self) -> dict:
+        """Ends tracking and returns the refresh's memory report."""
+        self.sample("done")
+        report = self.report()
+        if self.traced:
+            self.traced = False
+            _tracemalloc_release()
+        return report
+
+    def sample(self, stage: str = "") -> int:
+        rss = _current_rss_bytes()
+        with self._lock:
+            if rss > self.peak_rss:
+                self.peak_rss = rss
+            if stage:
+                self.stages[stage] = max(self.stages.get(stage, 0), rss)
+        return rss
+
+    def near_budget(self, fraction: float = 0.85) -> bool:
+        if not self.budget_bytes:
+            return False
+        return self.sample() >= self.budget_bytes * fraction
+
+    def workers(self, wanted: int) -> int:
+        """Worker count for the next batch of fetches, lowered near the budget."""
+        if self.near_budget(0.85):
+            return 1
+        if self.near_budget(0.7):
+            return max(1, wanted // 2)
+        return max(1, wanted)
+
+    def defer(self, what: str) -> bool:
+        """Returns True if low-priority work should be skipped for this refresh."""
+        if not self.near_budget(0.85):
+            return False
+        with self._lock:
+            self.deferred.append(what)
+        logger.info(f"Deferring '{what}': RSS near budget")
+        return True
+
+    def report(self) -> dict:
+        mib = 1024 * 1024
+        out = {
+            "start_rss_mb": round(self.start_rss / mib, 1),
+            "peak_rss_mb": round(self.peak_rss / mib, 1),
+            "budget_mb": round(self.budget_bytes / mib, 1) if self.budget_bytes else None,
+            "stages_rss_mb": {k: round(v / mib, 1) for k, v in self.stages.items()},
+            "deferred": list(self.deferred),
+        }
+        if tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            out["tracemalloc_peak_mb"] = round(peak / mib, 1)
+        return out
+
+
+# Memory tracker of the refresh currently running (None outside a refresh).
+_refresh_memory: _RefreshMemory | None = None
+
+
+def _refresh_workers(wanted: int | None = None) -> int:
+    if wanted is None:
+        wanted = REFRESH_MAX_WORKERS
+    if _profile_armed.get("refresh", {}).get("status") == "running" and _profile_armed["refresh"]["cpu"]:
+        # cProfile only sees the thread it runs on; keep page fetches on it.
+        return 1
+    mem = _refresh_memory
+    return mem.workers(wanted) if mem else max(1, wanted)
+
+
+def _refresh_defer(what: str) -> bool:
+    mem = _refresh_memory
+    return mem.defer(what) if mem else False
+
+
+def _refresh_sample(stage: str) -> None:
+    mem = _refresh_memory
+    if mem:
+        mem.sample(stage)
+
+
+# Prometheus metrics. Sources are "gametora", "game8" and "uma.moe"; stages name
+# the page or document within a source (e.g. "story_page", "chunk").
+_UPSTREAM_REQUESTS = Counter(
+    "uma_upstream_requests_total", "Upstream HTTP requests made by refreshes.", ["source", "stage", "status"]
+)
+_UPSTREAM_BYTES = Counter(
+    "uma_upstream_response_bytes_total", "Upstream response body bytes.", ["source", "stage"]
+)
+_UPSTREAM_SECONDS = Histogram(
+    "uma_upstream_request_seconds", "Upstream HTTP request latency.", ["source", "stage"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+_PARSE_SECONDS = Histogram(
+    "uma_parse_seconds", "Time spent parsing upstream documents.", ["source", "stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+_CACHE_LOOKUPS = Counter("uma_cache_lookups_total", "Internal cache lookups.", ["cache", "result"])
+_ITEMS_PRODUCED = Gauge(
+    "uma_items_produced", "Items each source contributed to the last refresh.", ["source", "section"]
+)
+_REFRESHES = Counter("uma_refreshes_total", "Completed refreshes.", ["result"])
+_REFRESH_SECONDS = Histogram(
+    "uma_refresh_duration_seconds", "Wall time of a full refresh.",
+    buckets=(10, 30, 60, 120, 300, 600, 1200, 2400, 3600),
+)
+_REFRESH_PEAK_RSS = Gauge("uma_refresh_peak_rss_bytes", "Peak RSS observed during the last refresh.")
+_REFRESH_LAST_SUCCESS = Gauge(
+    "uma_refresh_last_success_timestamp_seconds", "Unix time the cache was last refreshed successfully."
+)
+_REFRESH_LAST_SUCCESS_AGE = Gauge(
+    "uma_refresh_last_success_age_seconds", "Seconds since the cache was last refreshed successfully."
+)
+_REFRESH_LAST_SUCCESS_AGE.set_function(
+    lambda: (time.time() - _last_refresh_success_ts) if _last_refresh_success_ts else float("nan")
+)
+_last_refresh_success_ts = 0.0
+_WEBHOOK_DELIVERIES = Counter("uma_webhook_deliveries_total", "Webhook batch deliveries.", ["result"])
+_SSE_CLIENTS = Gauge("uma_sse_clients", "Open /api/events/stream connections.")
+_STARTUP_SECONDS = Gauge("uma_startup_seconds", "Startup phase durations; first_response is the process age then.", ["phase"])
+_CARD_INDEX_BYTES = Gauge("uma_card_index_bytes", "Approximate memory held by the /api/cards index.")
+_API_SECONDS = Histogram(
+    "uma_api_request_seconds", "Latency of API handlers.", ["endpoint"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1),
+)
+
+
+# Refresh traces. Every refresh gets a trace ID and a tree of spans
+# (refresh -> source stage -> fetch/parse/extract). Finished traces are appended
+# to a rotating JSONL file (one span per line) and the last few are kept in
+# memory for /api/refresh/{id}/trace.
+TRACE_FILE = os.environ.get("UMA_TRACE_FILE", "refresh-traces.jsonl")
+TRACE_FILE_MAX_BYTES = int(os.environ.get("UMA_TRACE_FILE_MAX_BYTES", str(5 * 1024 * 1024)) or 0)
+TRACE_FILE_BACKUPS = int(os.environ.get("UMA_TRACE_FILE_BACKUPS", "3") or 0)
+TRACE_KEEP = max(1, int(os.environ.get("UMA_TRACE_KEEP", "10") or 10))
+
+_current_trace: contextvars.ContextVar[dict | None] = contextvars.ContextVar("uma_trace", default=None)
+_current_span: contextvars.ContextVar[dict | None] = contextvars.ContextVar("uma_span", default=None)
+_recent_traces: "OrderedDict[str, dict]" = OrderedDict()
+_recent_traces_lock = Lock()
+_trace_logger: logging.Logger | None = None
+
+
+def _get_trace_logger() -> logging.Logger | None:
+    global _trace_logger
+    if _trace_logger is None and TRACE_FILE:
+        try:
+            handler = logging.handlers.RotatingFileHandler(
+                TRACE_FILE, maxBytes=TRACE_FILE_MAX_BYTES, backupCount=TRACE_FILE_BACKUPS, encoding="utf-8"
+            )
+        except OSError as e:
+            logger.warning(f"Trace file {TRACE_FILE} not writable: {e}")
+            return None
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        tl = logging.getLogger("umamusume-tracker.trace")
+        tl.setLevel(logging.INFO)
+        tl.propagate = False
+        tl.addHandler(handler)
+        _trace_logger = tl
+    return _trace_logger
+
+
+@contextmanager
+def _trace(trace_id: str | None = None):
+    """Collect a trace for the code run inside (a whole refresh)."""
+    trace = {
+        "trace_id": trace_id or uuid.uuid4().hex[:16],
+        "started_at": time.time(),
+        "spans": [],
+        "lock": Lock(),
+    }
+    token = _current_trace.set(trace)
+    try:
+        with _span("refresh"):
+            yield trace
+    finally:
+        _current_trace.reset(token)
+        _finish_trace(trace)
+
+
+@contextmanager
+def _span(name: str, **attrs):
+    """Record a span under the current one. Outside a trace this does nothing."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    parent = _current_span.get()
+    span = {
+        "trace_id": trace["trace_id"],
+        "span_id": uuid.uuid4().hex[:16],
+        "parent_id": parent["span_id"] if parent else None,
+        "name": name,
+        "start": time.time(),
+        "attrs": attrs,
+    }
+    token = _current_span.set(span)
+    t0 = time.perf_counter()
+    try:
+        yield span
+    except Exception as e:
+        span["attrs"]["error"] = repr(e)
+        raise
+    finally:
+        span["duration_ms"] = round((time.perf_counter() - t0) * 1000, 3)
+        _current_span.reset(token)
+        with trace["lock"]:
+            trace["spans"].append(span)
+
+
+def _span_attrs(**attrs) -> None:
+    """Add attributes to the current span (no-op outside a trace)."""
+    span = _current_span.get()
+    if span is not None:
+        span["attrs"].update(attrs)
+
+
+def _in_current_context(fn):
+    """Bind fn to a copy of the caller's context, so pool workers inherit the current span."""
+    ctx = contextvars.copy_context()
+    return lambda *args, **kwargs: ctx.run(fn, *args, **kwargs)
+
+
+def _finish_trace(trace: dict) -> None:
+    trace.pop("lock", None)
+    trace["spans"].sort(key=lambda sp: sp["start"])
+    with _recent_traces_lock:
+        _recent_traces[trace["trace_id"]] = trace
+        while len(_recent_traces) > TRACE_KEEP:
+            _recent_traces.popitem(last=False)
+    tl = _get_trace_logger()
+    if tl is None:
+        return
+    try:
+        for sp in trace["spans"]:
+            tl.info(json.dumps(sp, default=str))
+    except Exception as e:
+        logger.warning(f"Failed to write trace {trace['trace_id']}: {e}")
+
+
+def _trace_tree(trace: dict) -> dict:
+    """Nest a trace's flat span list into a tree."""
+    nodes = {sp["span_id"]: {**sp, "children": []} for sp in trace["spans"]}
+    roots = []
+    for node in nodes.values():
+        parent = nodes.get(node["parent_id"]) if node["parent_id"] else None
+        (parent["children"] if parent else roots).append(node)
+    return {"trace_id": trace["trace_id"], "started_at": trace["started_at"], "spans": roots}
+
+
+def _trace_folded(trace: dict) -> str:
+    """Collapsed-stack lines ("a;b;c <self µs>") for flamegraph.pl / speedscope."""
+    by_id = {sp["span_id"]: sp for sp in trace["spans"]}
+    child_ms: dict[str, float] = {}
+    for sp in trace["spans"]:
+        if sp["parent_id"]:
+            child_ms[sp["parent_id"]] = child_ms.get(sp["parent_id"], 0.0) + sp.get("duration_ms", 0.0)
+
+    totals: dict[str, int] = {}
+    for sp in trace["spans"]:
+        path = []
+        node = sp
+        while node:
+            path.append(node["name"].replace(";", ":").replace(" ", "_"))
+            node = by_id.get(node["parent_id"]) if node["parent_id"] else None
+        stack = ";".join(reversed(path))
+        # Children fetched on a thread pool can add up to more than the parent.
+        self_us = int(max(0.0, sp.get("duration_ms", 0.0) - child_ms.get(sp["span_id"], 0.0)) * 1000)
+        totals[stack] = totals.get(stack, 0) + self_us
+    return "\n".join(f"{stack} {us}" for stack, us in totals.items() if us > 0) + "\n"
+
+
+# On-demand profiling. An admin arms a session for the next refresh or the next
+# N /api/events requests; the session records cProfile stats and/or tracemalloc
+# allocation diffs and is kept for a while afterwards. When nothing is armed the
+# request path only checks that `_profile_armed` is empty.
+ADMIN_TOKEN = os.environ.get("UMA_ADMIN_TOKEN", "")
+PROFILE_KEEP = 10
+
+_profile_armed: dict[str, dict] = {}  # target -> armed/running session
+_profile_sessions: "OrderedDict[str, dict]" = OrderedDict()
+_profile_lock = Lock()
+
+
+def _arm_profile(target: str, requests_n: int, cpu: bool, alloc: bool) -> dict:
+    with _profile_lock:
+        if target in _profile_armed:
+            raise HTTPException(status_code=409, detail=f"A {target} profile is already armed")
+        session = {
+            "id": uuid.uuid4().hex[:12],
+            "target": target,
+            "status": "armed",
+            "armed_at": time.time(),
+            "finished_at": None,
+            "requests": requests_n if target == "events" else 1,
+            "claimed": 0,
+            "completed": 0,
+            "cpu": cProfile.Profile() if cpu else None,
+            "alloc": alloc,
+            "tracing": False,
+            "snapshot_before": None,
+            "report": None,
+            "pstats": None,
+            "run_lock": Lock(),
+        }
+        _profile_armed[target] = session
+        _profile_sessions[session["id"]] = session
+        while len(_profile_sessions) > PROFILE_KEEP:
+            _profile_sessions.popitem(last=False)
+    return session
+
+
+def _claim_profile(target: str) -> dict | None:
+    with _profile_lock:
+        session = _profile_armed.get(target)
+        if session is None or session["claimed"] >= session["requests"]:
+            return None
+        session["claimed"] += 1
+        if session["status"] == "armed":
+            session["status"] = "running"
+            if session["alloc"]:
+                _tracemalloc_acquire(10)
+                session["tracing"] = True
+                session["snapshot_before"] = tracemalloc.take_snapshot()
+        return session
+
+
+def _run_profiled(target: str, fn, *args, **kwargs):
+    """Run fn, profiling it if a session for target is armed."""
+    session = _claim_profile(target)
+    if session is None:
+        return fn(*args, **kwargs)
+    # Requests served concurrently share one cProfile object, which is not thread-safe.
+    with session["run_lock"]:
+        prof = session["cpu"]
+        if prof is not None:
+            prof.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            if prof is not None:
+                prof.disable()
+            session["completed"] += 1
+            if session["completed"] >= session["requests"]:
+                _finish_profile(session)
+
+
+def _finish_profile(session: dict) -> None:
+    report: dict = {"target": session["target"], "requests": session["completed"]}
+    try:
+        # Snapshot first, so building the CPU report doesn't show up in the allocation diff.
+        if session["alloc"] and session["snapshot_before"] is not None:
+            if tracemalloc.is_tracing():
+                after = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                report["alloc_peak_bytes"] = peak
+                report["alloc_top"] = [str(stat) for stat in after.compare_to(session["snapshot_before"], "lineno")[:25]]
+            else:
+                report["alloc_error"] = "tracemalloc was stopped while the session ran"
+            session["snapshot_before"] = None
+
+        prof = session.pop("cpu", None)
+        session["cpu"] = prof is not None
+        if prof is not None:
+            buf = io.StringIO()
+            stats = pstats.Stats(prof, stream=buf)
+            stats.sort_stats("cumulative").print_stats(40)
+            report["cpu"] = buf.getvalue()
+            session["pstats"] = marshal.dumps(stats.stats)
+    except Exception as e:
+        logger.warning(f"Failed to build profile report {session['id']}: {e}")
+        report["error"] = str(e)
+    finally:
+        if session["tracing"]:
+            session["tracing"] = False
+            _tracemalloc_release()
+        session["report"] = report
+        session["status"] = "done"
+        session["finished_at"] = time.time()
+        with _profile_lock:
+            if _profile_armed.get(session["target"]) is session:
+                del _profile_armed[session["target"]]
+    logger.info(f"Profile {session['id']} ({session['target']}) finished")
+
+
+class _HttpArchive:
+    """Content-addressed archive of upstream responses for record/replay.
+
+    Layout of an archive directory:
+
+        index.jsonl            one line per recorded fetch (url, status, sha256, refresh_id, ...)
+        blobs/ab/abcd....gz    gzip-compressed response bodies, named by their SHA-256
+
+    Identical bodies are stored once. When replaying, the latest entry per URL
+    is served (optionally only entries of one refresh), and the clock is frozen
+    at the start of the newest recorded refresh so current/upcoming splits match.
+    """
+
+    def __init__(self, path: str, mode: str, refresh_id: str | None = None):
+        self.path = path
+        self.mode = mode
+        self._lock = Lock()
+        self._index: dict[str, dict] = {}
+        self.now_ts: int | None = None
+        os.makedirs(os.path.join(path, "blobs"), exist_ok=True)
+        if mode == "replay":
+            self._load_index(refresh_id)
+
+    def _load_index(self, refresh_id: str | None) -> None:
+        index_path = os.path.join(self.path, "index.jsonl")
+        if not os.path.exists(index_path):
+            raise FileNotFoundError(f"No index.jsonl in archive {self.path}")
+        # refresh_id -> first recorded_at; a URL only seen in an older refresh
+        # must not pull the clock back to that refresh's day.
+        refresh_starts: dict[str | None, float] = {}
+        with open(index_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if refresh_id and entry.get("refresh_id") != refresh_id:
+                    continue
+                self._index[entry["url"]] = entry
+                rid = entry.get("refresh_id")
+                refresh_starts[rid] = min(refresh_starts.get(rid, entry["recorded_at"]), entry["recorded_at"])
+        if not self._index:
+            raise ValueError(f"Archive {self.path} has no entries" + (f" for refresh {refresh_id}" if refresh_id else ""))
+        self.now_ts = int(max(refresh_starts.values()))
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.path, "blobs", digest[:2], f"{digest}.gz")
+
+    def replay(self, url: str) -> "requests.Response":
+        import requests
+
+        entry = self._index.get(url)
+        if entry is None:
+            raise requests.ConnectionError(f"{url} is not in the replay archive")
+        with gzip.open(self._blob_path(entry["sha256"]), "rb") as f:
+            body = f.read()
+        resp = requests.Response()
+        resp.status_code = int(entry["status"])
+        resp._content = body
+        resp.url = url
+        resp.encoding = entry.get("encoding")
+        if entry.get("content_type"):
+            resp.headers["Content-Type"] = entry["content_type"]
+        return resp
+
+    def record(self, url: str, resp: "requests.Response") -> None:
+        body = resp.content
+        digest = hashlib.sha256(body).hexdigest()
+        blob = self._blob_path(digest)
+        trace = _current_trace.get()
+        entry = {
+            "url": url,
+            "status": resp.status_code,
+            "sha256": digest,
+            "bytes": len(body),
+            "content_type": resp.headers.get("Content-Type", ""),
+            "encoding": resp.encoding,
+            "recorded_at": time.time(),
+            "refresh_id": trace["trace_id"] if trace else None,
+        }
+        with self._lock:
+            if not os.path.exists(blob):
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                tmp = f"{blob}.tmp"
+                with gzip.open(tmp, "wb") as f:
+                    f.write(body)
+                os.replace(tmp, blob)
+            with open(os.path.join(self.path, "index.jsonl"), "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+
+_http_archive: _HttpArchive | None = None
+
+# Point all upstream fetches at one base URL (e.g. bench/fake_upstream.py):
+# https://gametora.com/umamusume becomes <base>/gametora.com/umamusume. Item
+# URLs in the payload keep the real hosts.
+UPSTREAM_BASE_URL = os.environ.get("UMA_UPSTREAM_BASE_URL", "").rstrip("/")
+HTTP_TIMEOUT = float(os.environ.get("UMA_HTTP_TIMEOUT", "30") or 30)
+# Retries for 429/5xx and connection errors, with exponential backoff (honouring Retry-After).
+HTTP_RETRIES = max(0, int(os.environ.get("UMA_HTTP_RETRIES", "2") or 0))
+HTTP_BACKOFF_SECONDS = float(os.environ.get("UMA_HTTP_BACKOFF_SECONDS", "1.0") or 0)
+HTTP_BACKOFF_MAX_SECONDS = 30.0
+
+
+# Upstream fetches that ended in an error, collected per refresh source (fetchers
+# are best-effort and return empty results instead of raising).
+_upstream_errors: contextvars.ContextVar[list | None] = contextvars.ContextVar("upstream_errors", default=None)
+
+
+def _note_upstream_error(url: str, error: str) -> None:
+    errors = _upstream_errors.get()
+    if errors is not None:
+        errors.append(f"{url}: {error}")
+
+
+def _upstream_url(url: str) -> str:
+    if not UPSTREAM_BASE_URL:
+        return url
+    m = re.match(r"https?://([^/]+)(/.*)?$", url)
+    if not m:
+        return url
+    return f"{UPSTREAM_BASE_URL}/{m.group(1)}{m.group(2) or '/'}"
+
+
+def _retry_delay(attempt: int, resp: "requests.Response | None") -> float:
+    if resp is not None:
+        retry_after = resp.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), HTTP_BACKOFF_MAX_SECONDS)
+    return min(HTTP_BACKOFF_SECONDS * (2 ** attempt), HTTP_BACKOFF_MAX_SECONDS)
+
+
+def _now_ts() -> int:
+    """Current time for deciding what is current/upcoming (frozen while replaying)."""
+    if _http_archive is not None and _http_archive.now_ts is not None:
+        return _http_archive.now_ts
+    return int(time.time())
+
+
+def _http_get(url: str, *, source: str, stage: str, headers: dict | None = None, timeout: float | None = None) -> "requests.Response":
+    """requests.get for upstream pages, recording per-source/stage metrics and a fetch span.
+
+    429/5xx responses and connection errors are retried up to HTTP_RETRIES
+    times; every attempt is counted. With a record archive open every response
+    is also stored; with a replay archive open responses come from the archive
+    and nothing touches the network.
+    """
+    import requests
+
+    archive = _http_archive
+    with _span(f"fetch {stage}", source=source, url=url) as span:
+        if archive is not None and archive.mode == "replay":
+            resp = archive.replay(url)
+            _UPSTREAM_REQUESTS.labels(source, stage, str(resp.status_code)).inc()
+            if span is not None:
+                span["attrs"].update(replayed=True, status=resp.status_code, bytes=len(resp.content))
+            return resp
+
+        target = _upstream_url(url)
+        attempt = 0
+        while True:
+            t0 = time.perf_counter()
+            resp = None
+            try:
+                resp = requests.get(target, headers=headers, timeout=timeout or HTTP_TIMEOUT)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= HTTP_RETRIES:
+                    _note_upstream_error(url, repr(e))
+                    raise
+            finally:
+                _UPSTREAM_SECONDS.labels(source, stage).observe(time.perf_counter() - t0)
+                _UPSTREAM_REQUESTS.labels(source, stage, str(resp.status_code) if resp is not None else "error").inc()
+                if resp is not None:
+                    _UPSTREAM_BYTES.labels(source, stage).inc(len(resp.content))
+            retryable = resp is None or resp.status_code == 429 or resp.status_code >= 500
+            if not retryable or attempt >= HTTP_RETRIES:
+                break
+            delay = _retry_delay(attempt, resp)
+            logger.warning(
+                f"{source} {stage}: {resp.status_code if resp is not None else 'connection error'} for {url}, "
+                f"retrying in {delay:.1f}s ({attempt + 1}/{HTTP_RETRIES})"
+            )
+            time.sleep(delay)
+            attempt += 1
+
+        if span is not None:
+            span["attrs"].update(status=resp.status_code, bytes=len(resp.content), attempts=attempt + 1)
+        if resp.status_code >= 400:
+            _note_upstream_error(url, f"HTTP {resp.status_code}")
+        if archive is not None:
+            try:
+                archive.record(url, resp)
+            except Exception as e:
+                logger.warning(f"Failed to record {url}: {e}")
+        return resp
+
+
+def _parse_html(content, *, source: str, stage: str) -> "BeautifulSoup":
+    from bs4 import BeautifulSoup
+
+    with _span(f"parse {stage}", source=source, bytes=len(content)):
+        with _PARSE_SECONDS.labels(source, stage).time():
+            return BeautifulSoup(content, 'html.parser')
 
 
 def _format_dt(ts_seconds: int | None) -> str:
@@ -59,7 +783,7 @@ def _format_dt(ts_seconds: int | None) -> str:
         return ""
 
 
-def _parse_next_data(page_soup: BeautifulSoup) -> dict:
+def _parse_next_data(page_soup: "BeautifulSoup") -> dict:
     script = page_soup.find('script', id='__NEXT_DATA__')
     if not script or not script.string:
         return {}
@@ -70,7 +794,7 @@ def _parse_next_data(page_soup: BeautifulSoup) -> dict:
         return {}
 
 
-def _extract_event_banner_image_url(event_page_soup: BeautifulSoup) -> str:
+def _extract_event_banner_image_url(event_page_soup: "BeautifulSoup") -> str:
     # Prefer OG/Twitter image when present (more stable than CSS-rendered images).
     for sel in [
         lambda: event_page_soup.find('meta', attrs={'property': 'og:image'}),
@@ -100,28 +824,8 @@ def _extract_event_banner_image_url(event_page_soup: BeautifulSoup) -> str:
     return f"https://gametora.com{src}"
 
 
-def fetch_story_events(limit: int = 5) -> tuple[list[dict], list[dict]]:
-    """Returns (current_events, upcoming_events) for the EN site.
-
-    GameTora's Story Event list is server-rendered enough to enumerate event URLs.
-    Each event page contains eventData (start/end/name_en) in __NEXT_DATA__.
-    """
-
-    list_url = "https://gametora.com/umamusume/events/story-events"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-    }
-
-    try:
-        resp = requests.get(list_url, headers=headers, timeout=30)
-        resp.raise_for_status()
-    except Exception as e:
-        logger.warning(f"Failed to fetch story events list: {e}")
-        return [], []
-
-    soup = BeautifulSoup(resp.content, 'html.parser')
-
-    # Collect unique event slugs from links
+def _extract_event_slugs(soup: "BeautifulSoup") -> list[str]:
+    """Unique event slugs linked from a GameTora event list page, in page order."""
     slugs: list[str] = []
     seen: set[str] = set()
     for a in soup.find_all('a', href=True):
@@ -135,47 +839,217 @@ def fetch_story_events(limit: int = 5) -> tuple[list[dict], list[dict]]:
             continue
         seen.add(slug)
         slugs.append(slug)
+    return slugs
+
+
+# Event detail (/api/events/{slug}). Event pages parsed during a refresh are
+# kept as serialized records in a byte- and TTL-bounded LRU; a miss fetches the
+# page once, however many requests are waiting for that slug. Slugs GameTora
+# doesn't know are cached too (as an empty body, for a shorter TTL), so clients
+# probing made-up slugs don't cost an upstream fetch each.
+EVENT_DETAIL_CACHE_BYTES = int(os.environ.get("UMA_EVENT_DETAIL_CACHE_BYTES", str(2 * 1024 * 1024)) or 0)
+# Long enough for records from the daily refresh to last until the next one.
+EVENT_DETAIL_TTL_SECONDS = int(os.environ.get("UMA_EVENT_DETAIL_TTL_SECONDS", str(25 * 3600)) or 0)
+EVENT_DETAIL_MISSING_TTL_SECONDS = int(os.environ.get("UMA_EVENT_DETAIL_MISSING_TTL_SECONDS", "600") or 0)
+
+_event_detail_lock = Lock()
+_event_detail_cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+_event_detail_bytes = 0
+_event_detail_inflight: dict[str, Future] = {}
+
+
+def _event_detail_body(slug: str, page_url: str, ev: dict, image_url: str) -> bytes:
+    record = {
+        "slug": slug,
+        "url": page_url,
+        "name": (ev.get('name_en') or "").strip() or (ev.get('name_jp') or "").strip() or slug.replace('-', ' ').title(),
+        "start": int(ev.get('start') or 0) or None,
+        "end": int(ev.get('end') or 0) or None,
+        "imageUrl": image_url,
+        "eventData": ev,
+    }
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _event_detail_store(slug: str, body: bytes) -> None:
+    """Cache a serialized record; an empty body records that the slug doesn't exist."""
+    global _event_detail_bytes
+    if len(slug) + len(body) > EVENT_DETAIL_CACHE_BYTES:
+        return
+    with _event_detail_lock:
+        old = _event_detail_cache.pop(slug, None)
+        if old is not None:
+            _event_detail_bytes -= len(slug) + len(old[1])
+        _event_detail_cache[slug] = (time.time(), body)
+        _event_detail_bytes += len(slug) + len(body)
+        while _event_detail_bytes > EVENT_DETAIL_CACHE_BYTES:
+            evicted_slug, (_, evicted) = _event_detail_cache.popitem(last=False)
+            _event_detail_bytes -= len(evicted_slug) + len(evicted)
+
+
+def _event_detail_lookup_locked(slug: str) -> bytes | None:
+    """Cached body (b"" for a known-missing slug), or None on a miss."""
+    global _event_detail_bytes
+    entry = _event_detail_cache.get(slug)
+    if entry is None:
+        return None
+    ttl = EVENT_DETAIL_TTL_SECONDS if entry[1] else EVENT_DETAIL_MISSING_TTL_SECONDS
+    if ttl and time.time() - entry[0] > ttl:
+        del _event_detail_cache[slug]
+        _event_detail_bytes -= len(slug) + len(entry[1])
+        return None
+    _event_detail_cache.move_to_end(slug)
+    return entry[1]
 
-    now_ts = int(time.time())
-    current: list[dict] = []
-    upcoming: list[dict] = []
 
-    # Cap requests to avoid hammering the site.
-    # The list is fairly complete; scanning the first ~120 is usually enough.
-    for slug in slugs[:120]:
-        page_url = f"https://gametora.com/umamusume/events/{slug}"
-        try:
-            ev_resp = requests.get(page_url, headers=headers, timeout=30)
-            ev_resp.raise_for_status()
-            ev_soup = BeautifulSoup(ev_resp.content, 'html.parser')
+def _fetch_event_detail(slug: str) -> bytes | None:
+    """Fetch and serialize one event page; None when GameTora has no such event."""
+    page_url = f"https://gametora.com/umamusume/events/{slug}"
+    resp = _http_get(page_url, source="gametora", stage="event_detail", headers=_GAMETORA_HEADERS)
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
+    soup = _parse_html(resp.content, source="gametora", stage="event_detail")
+    del resp
+    ev = _parse_next_data(soup).get('eventData')
+    if not isinstance(ev, dict) or not ev:
+        return None
+    return _event_detail_body(slug, page_url, ev, _extract_event_banner_image_url(soup))
+
+
+def _event_detail(slug: str) -> bytes | None:
+    """Serialized event record from the cache, or from a single shared fetch on a miss."""
+    with _event_detail_lock:
+        body = _event_detail_lookup_locked(slug)
+        if body is not None:
+            _CACHE_LOOKUPS.labels("event_detail", "hit").inc()
+            return body or None
+        fut = _event_detail_inflight.get(slug)
+        leader = fut is None
+        if leader:
+            fut = _event_detail_inflight[slug] = Future()
+    if not leader:
+        _CACHE_LOOKUPS.labels("event_detail", "shared").inc()
+        return fut.result()
+
+    _CACHE_LOOKUPS.labels("event_detail", "miss").inc()
+    try:
+        body = _fetch_event_detail(slug)
+        _event_detail_store(slug, body if body is not None else b"")
+        fut.set_result(body)
+        return body
+    except Exception as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with _event_detail_lock:
+            _event_detail_inflight.pop(slug, None)
+
+
+def _fetch_story_event_record(slug: str, headers: dict) -> dict | None:
+    """Fetch one GameTora event page and reduce it to a small record.
+
+    The parsed page is dropped before returning so only the record stays alive.
+    """
+    page_url = f"https://gametora.com/umamusume/events/{slug}"
+    try:
+        ev_resp = _http_get(page_url, source="gametora", stage="story_page", headers=headers)
+        ev_resp.raise_for_status()
+        ev_soup = _parse_html(ev_resp.content, source="gametora", stage="story_page")
+        with _span("extract story_page", source="gametora", slug=slug):
             pp = _parse_next_data(ev_soup)
             ev = pp.get('eventData') or {}
             if not isinstance(ev, dict):
-                continue
+                return None
 
-            start = int(ev.get('start') or 0)
-            end = int(ev.get('end') or 0)
-            name = (ev.get('name_en') or "").strip() or (ev.get('name_jp') or "").strip() or slug.replace('-', ' ').title()
             image_url = _extract_event_banner_image_url(ev_soup)
-
-            item = {
-                "title": name,
-                "subtitle": "",
+            if ev:
+                _event_detail_store(slug, _event_detail_body(slug, page_url, ev, image_url))
+            return {
+                "slug": slug,
                 "url": page_url,
+                "start": int(ev.get('start') or 0),
+                "end": int(ev.get('end') or 0),
+                "name": (ev.get('name_en') or "").strip() or (ev.get('name_jp') or "").strip() or slug.replace('-', ' ').title(),
                 "imageUrl": image_url,
             }
+    except Exception:
+        return None
 
-            if start and end and start <= now_ts <= end:
-                item["subtitle"] = f"Ends {_format_dt(end)}"
-                item["_sort"] = end
-                current.append(item)
-            elif start and start > now_ts:
-                item["subtitle"] = f"Starts {_format_dt(start)}"
-                item["_sort"] = start
-                upcoming.append(item)
 
-        except Exception:
-            continue
+def fetch_story_events(limit: int = 5, seen: list[dict] | None = None) -> tuple[list[dict], list[dict]]:
+    """Returns (current_events, upcoming_events) for the EN site.
+
+    GameTora's Story Event list is server-rendered enough to enumerate event URLs.
+    Each event page contains eventData (start/end/name_en) in __NEXT_DATA__.
+    If `seen` is given, every dated event (past ones too) is appended to it.
+    """
+
+    list_url = "https://gametora.com/umamusume/events/story-events"
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    }
+
+    try:
+        resp = _http_get(list_url, source="gametora", stage="story_list", headers=headers)
+        resp.raise_for_status()
+    except Exception as e:
+        logger.warning(f"Failed to fetch story events list: {e}")
+        return [], []
+
+    soup = _parse_html(resp.content, source="gametora", stage="story_list")
+    slugs = _extract_event_slugs(soup)
+
+    # Reduce the list page to slugs and drop it before the event pages are fetched.
+    del soup
+    _refresh_sample("story_events:list")
+
+    now_ts = _now_ts()
+    current: list[dict] = []
+    upcoming: list[dict] = []
+
+    # Cap requests to avoid hammering the site.
+    # The list is fairly complete; scanning the first ~120 is usually enough.
+    slugs = slugs[:120]
+    records: list[dict] = []
+    pos = 0
+    while pos < len(slugs):
+        # Re-check the memory budget between batches; each worker holds one parsed page.
+        workers = _refresh_workers()
+        batch = slugs[pos:pos + workers * 4]
+        pos += len(batch)
+        if workers == 1:
+            results = [_fetch_story_event_record(slug, headers) for slug in batch]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_in_current_context(_fetch_story_event_record), slug, headers) for slug in batch]
+                results = [f.result() for f in futures]
+        records.extend(r for r in results if r)
+    _refresh_sample("story_events:pages")
+
+    for rec in records:
+        start = rec["start"]
+        end = rec["end"]
+        item = {
+            "title": rec["name"],
+            "subtitle": "",
+            "url": rec["url"],
+            "imageUrl": rec["imageUrl"],
+            "_start": start or None,
+            "_end": end or None,
+            "_kind": "story_event",
+        }
+        if seen is not None and start:
+            seen.append(dict(item))
+
+        if start and end and start <= now_ts <= end:
+            item["subtitle"] = f"Ends {_format_dt(end)}"
+            item["_sort"] = end
+            current.append(item)
+        elif start and start > now_ts:
+            item["subtitle"] = f"Starts {_format_dt(start)}"
+            item["_sort"] = start
+            upcoming.append(item)
 
     current.sort(key=lambda x: x.get('_sort') or 0)
     upcoming.sort(key=lambda x: x.get('_sort') or 0)
@@ -254,26 +1128,8 @@ def _parse_game8_utc_date_range(text: str) -> tuple[int | None, int | None, str]
     return None, None, raw
 
 
-def fetch_game8_upcoming_banners(limit: int = 5) -> list[dict]:
-    """Scrape Game8's upcoming banner list (Global/EN oriented).
-
-    Note: Game8 explicitly states parts of the schedule are estimates based on JP.
-    We'll surface the dates as-is and treat only exact date ranges as hard.
-    """
-    url = "https://game8.co/games/Umamusume-Pretty-Derby/archives/537125"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
-    }
-
-    try:
-        resp = requests.get(url, headers=headers, timeout=30)
-        resp.raise_for_status()
-    except Exception as e:
-        logger.warning(f"Failed to fetch Game8 upcoming banners: {e}")
-        return []
-
-    soup = BeautifulSoup(resp.content, 'html.parser')
-
+def _parse_game8_banner_rows(soup: "BeautifulSoup", url: str, now_ts: int) -> list[dict]:
+    """Reduce the Game8 banner page to upcoming banner rows, sorted by start."""
     # Game8 periodically changes the month heading (e.g., "January 2026 Banners"),
     # so avoid hard-coding a single month. Collect all banner schedule tables
     # (month/year headings) plus the "Expected Banner Schedule" table.
@@ -314,7 +1170,6 @@ def fetch_game8_upcoming_banners(limit: int = 5) -> list[dict]:
             tables.append(t)
 
     rows: list[dict] = []
-    now_ts = int(time.time())
 
     def _iter_table_rows(t):
         for tr in t.find_all("tr"):
@@ -390,30 +1245,61 @@ def fetch_game8_upcoming_banners(limit: int = 5) -> list[dict]:
                 "subtitle": subtitle,
                 "url": url,
                 "imageUrl": "",
+                "_start": start_ts,
+                "_end": end_ts,
+                "_kind": "banner",
                 "_sort": sort_ts or (now_ts + 10**9),
             })
 
     rows.sort(key=lambda x: x.get("_sort") or 0)
     for r in rows:
         r.pop("_sort", None)
+    return rows
+
+
+def fetch_game8_upcoming_banners(limit: int = 5) -> list[dict]:
+    """Scrape Game8's upcoming banner list (Global/EN oriented).
+
+    Note: Game8 explicitly states parts of the schedule are estimates based on JP.
+    We'll surface the dates as-is and treat only exact date ranges as hard.
+    """
+    url = "https://game8.co/games/Umamusume-Pretty-Derby/archives/537125"
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    }
 
-    # Best-effort: attach images for character banners using uma.moe banner images.
     try:
-        image_map = _get_uma_moe_character_banner_image_map()
-    except Exception:
-        image_map = {}
+        resp = _http_get(url, source="game8", stage="banners", headers=headers)
+        resp.raise_for_status()
+    except Exception as e:
+        logger.warning(f"Failed to fetch Game8 upcoming banners: {e}")
+        return []
 
-    if image_map:
-        keys = list(image_map.keys())
+    soup = _parse_html(resp.content, source="game8", stage="banners")
+
+    rows = _parse_game8_banner_rows(soup, url, _now_ts())
+
+    # The page is fully reduced to rows; drop the tree before the uma.moe chunk is loaded.
+    del soup
+    _refresh_sample("game8:page")
+
+    # Best-effort: attach images for character banners using uma.moe banner images.
+    image_map: dict[str, str] = {}
+    matcher = None
+    if not _refresh_defer("game8:banner_images"):
+        try:
+            with _span("banner_images", source="uma.moe"):
+                image_map, matcher = _get_uma_moe_character_banner_image_matcher()
+        except Exception:
+            image_map, matcher = {}, None
+
+    if image_map and matcher:
         for r in rows:
             if (r.get("imageUrl") or "").strip():
                 continue
             title_l = (r.get("title") or "").lower()
             title_l = re.sub(r"\s+", " ", title_l).strip()
-            best_key = ""
-            for k in keys:
-                if k and k in title_l and len(k) > len(best_key):
-                    best_key = k
+            best_key = matcher.longest(title_l)
             if best_key:
                 r["imageUrl"] = str(image_map.get(best_key) or "")
 
@@ -441,13 +1327,25 @@ def _get_uma_moe_character_banner_image_map(ttl_seconds: int = 24 * 3600) -> dic
     cached_at = int(_uma_char_banner_image_cache.get("fetched_at") or 0)
     cached_map = _uma_char_banner_image_cache.get("map")
     if isinstance(cached_map, dict) and cached_map and (now_ts - cached_at) < ttl_seconds:
+        _CACHE_LOOKUPS.labels("uma_banner_images", "hit").inc()
+        _span_attrs(cache_hit=True)
         return {str(k): str(v) for k, v in cached_map.items()}
+    _CACHE_LOOKUPS.labels("uma_banner_images", "miss").inc()
+    _span_attrs(cache_hit=False)
 
     headers = {"User-Agent": "Mozilla/5.0"}
     chunk_url = _get_uma_moe_timeline_chunk_url()
     if not chunk_url:
         return {}
-    js = requests.get(chunk_url, headers=headers, timeout=30).text
+    js = _http_get(chunk_url, source="uma.moe", stage="chunk", headers=headers).text
+    # Only the (pickups, image_path) pairs are needed; release the chunk right away.
+    with _PARSE_SECONDS.labels("uma.moe", "banner_images").time():
+        pairs = re.findall(
+            r"pickup_characters:\[(.*?)\],image_path:\"(assets/images/character/banner/[^\"]+)\"",
+            js,
+            re.S,
+        )
+    del js
 
     def _norm_name(s: str) -> str:
         t = (s or "").strip().lower()
@@ -455,26 +1353,31 @@ def _get_uma_moe_character_banner_image_map(ttl_seconds: int = 24 * 3600) -> dic
         return t
 
     out: dict[str, str] = {}
+    rates: dict[int, dict] = {}
 
     # Extract objects that include pickup_characters + image_path.
     # Example object fields (minified):
     # {year:2021,image:"2021_30004.png",...,pickup_characters:["TM Opera O (Original)[New,0.75% rate]"],image_path:"assets/images/character/banner/2021_30004.png",...}
-    for pickups_blob, image_path in re.findall(
-        r"pickup_characters:\[(.*?)\],image_path:\"(assets/images/character/banner/[^\"]+)\"",
-        js,
-        re.S,
-    ):
+    for pickups_blob, image_path in pairs:
         names = re.findall(r"\"(.*?)\"", pickups_blob, re.S)
         clean = []
+        pickup_rates = []
         for n in names:
-            base = (n or "").split("[", 1)[0].strip()
+            base, _, tags = (n or "").partition("[")
+            base = base.strip()
             if base:
                 clean.append(base)
+                rate = re.search(r"([\d.]+)\s*%", tags)
+                if rate:
+                    pickup_rates.append((base, float(rate.group(1)) / 100))
         if not clean:
             continue
         img_url = _abs_uma_moe_asset(image_path)
         if not img_url:
             continue
+        banner_id = re.search(r"_(\d+)\.\w+$", image_path)
+        if banner_id and pickup_rates:
+            rates[int(banner_id.group(1))] = {"imageUrl": img_url, "pickups": pickup_rates}
         for base in clean:
             norm = _norm_name(base)
             out[norm] = img_url
@@ -485,10 +1388,159 @@ def _get_uma_moe_character_banner_image_map(ttl_seconds: int = 24 * 3600) -> dic
                     out[alias] = img_url
 
     _uma_char_banner_image_cache["map"] = out
+    _uma_char_banner_image_cache["rates"] = rates
+    _uma_char_banner_image_cache["matcher"] = _NameMatcher(out.keys())
     _uma_char_banner_image_cache["fetched_at"] = now_ts
     return out
 
 
+def _get_uma_moe_character_banner_image_matcher(ttl_seconds: int = 24 * 3600) -> tuple[dict[str, str], "_NameMatcher | None"]:
+    """Return (name -> image map, matcher over its names).
+
+    The matcher is built once whenever the image map is refreshed.
+    """
+    image_map = _get_uma_moe_character_banner_image_map(ttl_seconds)
+    matcher = _uma_char_banner_image_cache.get("matcher")
+    if image_map and not isinstance(matcher, _NameMatcher):
+        matcher = _NameMatcher(image_map.keys())
+        _uma_char_banner_image_cache["matcher"] = matcher
+    return image_map, matcher if isinstance(matcher, _NameMatcher) else None
+
+
+class _NameMatcher:
+    """Aho-Corasick automaton that finds the longest known name inside a text.
+
+    Built once from a fixed set of names, then each lookup is a single pass over
+    the text regardless of how many names there are. Ties between equally long
+    names go to the name that was added first, like the plain substring scan it
+    replaces.
+    """
+
+    __slots__ = ("_goto", "_fail", "_out", "_names")
+
+    def __init__(self, names):
+        self._names: list[str] = []
+        self._goto: list[dict[str, int]] = [{}]
+        # Index (into _names) of the longest name that ends in each state, or -1.
+        self._out: list[int] = [-1]
+
+        for name in names:
+            if not name:
+                continue
+            state = 0
+            for ch in name:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._out.append(-1)
+                state = nxt
+            if self._out[state] == -1:
+                self._out[state] = len(self._names)
+            self._names.append(name)
+
+        # Failure links in BFS order. A state's own name is always longer than
+        # anything reachable through its failure link, so it only inherits the
+        # failure state's output when it has none of its own.
+        self._fail: list[int] = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                if self._out[nxt] == -1:
+                    self._out[nxt] = self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def longest(self, text: str) -> str:
+        """Longest name occurring in text ("" when none does)."""
+        goto, fail, out, names = self._goto, self._fail, self._out, self._names
+        state = 0
+        best = -1
+        best_len = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            idx = out[state]
+            if idx != -1:
+                n = len(names[idx])
+                if n > best_len or (n == best_len and idx < best):
+                    best = idx
+                    best_len = n
+        return names[best] if best != -1 else ""
+
+
+# Pull-cost simulator (/api/banners/{id}/simulate). Monte Carlo over the pickup
+# rates uma.moe lists per character banner. Runs are inline: sampling the gap
+# to the next target hit keeps even the largest run well under a second, less
+# than a spawned worker takes to import this module. Results are cached per
+# banner, rates and parameters.
+SIMULATE_DEFAULT_TRIALS = 10_000
+SIMULATE_MAX_TRIALS = 200_000
+SIMULATE_MAX_PULLS = 100_000
+SIMULATE_CACHE_SIZE = 256
+
+_simulate_lock = Lock()
+_simulate_cache: OrderedDict[tuple, dict] = OrderedDict()
+
+
+def _simulate_pulls(rates: tuple[float, ...], spark: int, trials: int, seed: int) -> array:
+    """Pulls needed to get every target, for `trials` independent runs.
+
+    Only pulls that hit a target matter, so rather than drawing every pull the
+    gap to the next target hit is drawn from its geometric distribution (one
+    random number per hit, not per pull) and the hit is assigned to a target in
+    proportion to its rate. With `spark`, every `spark` pulls can be exchanged
+    for a missing target, so a run also ends at the first multiple of `spark`
+    where the exchanges cover what is still missing. Runs are capped at
+    SIMULATE_MAX_PULLS.
+    """
+    rand = random.Random(seed).random
+    log = math.log
+    bisect_right = bisect.bisect_right
+    k = len(rates)
+    p_any = sum(rates)
+    inv_log_miss = 1.0 / math.log1p(-p_any)
+    cumulative = list(itertools.accumulate(rates))
+    cumulative[-1] = p_any * 2  # never index past the last target
+    cap = SIMULATE_MAX_PULLS
+    spark_cap = spark or cap
+    out = array("I", [0]) * trials
+    for n in range(trials):
+        got = have = t = 0
+        while True:
+            t += int(log(1.0 - rand()) * inv_log_miss) + 1
+            if (k - have) * spark_cap <= t:
+                t = min((k - have) * spark_cap, cap)
+                break
+            if t >= cap:
+                t = cap
+                break
+            bit = 1 << bisect_right(cumulative, rand() * p_any)
+            if got & bit:
+                continue
+            got |= bit
+            have += 1
+            if have + t // spark_cap >= k:
+                break
+        out[n] = t
+    return out
+
+
+def _simulate(rates: tuple[float, ...], spark: int, trials: int, seed: int) -> list[int]:
+    """Sorted pull counts of `trials` runs."""
+    return sorted(_simulate_pulls(rates, spark, trials, seed))
+
+
 def _abs_uma_moe_asset(path: str) -> str:
     p = (path or "").strip()
     if not p:
@@ -558,8 +1610,9 @@ def _uma_moe_extract_map(js: str, var_name: str) -> dict[str, datetime]:
     """Extract a Map literal like: Qt=new Map([["x",new Date(Date.UTC(...))], ...])"""
     out: dict[str, datetime] = {}
     # Matches: Qt=new Map([ ["k",new Date(Date.UTC(...))], ... ])
-    # i.e. the whole thing ends with "]])".
-    pattern = re.escape(var_name) + r"=new Map\(\[(.*?)\]\]\)"
+    # i.e. the whole thing ends with "]])". The first "]" closes the last entry
+    # and belongs to the blob, otherwise that entry would be dropped.
+    pattern = re.escape(var_name) + r"=new Map\(\[(.*?\])\]\)"
     m = re.search(pattern, js, re.S)
     if not m:
         return out
@@ -664,14 +1717,14 @@ def _uma_moe_calculate_global_date(
 def _get_uma_moe_timeline_chunk_url() -> str:
     """Resolve the current Timeline JS chunk URL from the uma.moe timeline page."""
     headers = {"User-Agent": "Mozilla/5.0"}
-    html = requests.get("https://uma.moe/timeline", headers=headers, timeout=30).text
+    html = _http_get("https://uma.moe/timeline", source="uma.moe", stage="timeline", headers=headers).text
     main_scripts = re.findall(r'<script[^>]+src="([^"]*main-[^"]+\.js)"', html, re.I)
     if not main_scripts:
         return ""
     main_src = main_scripts[0]
     if not main_src.startswith("http"):
         main_src = "https://uma.moe/" + main_src.lstrip("/")
-    main_js = requests.get(main_src, headers=headers, timeout=30).text
+    main_js = _http_get(main_src, source="uma.moe", stage="main_js", headers=headers).text
     # Extract the TimelineComponent chunk import like: import("./chunk-XXXX.js")
     m = re.search(r'path:"timeline".*?import\("\./(chunk-[A-Z0-9]+\.js)"\)', main_js)
     if not m:
@@ -679,24 +1732,69 @@ def _get_uma_moe_timeline_chunk_url() -> str:
     return "https://uma.moe/" + m.group(1)
 
 
-def fetch_uma_moe_upcoming(limit_banners: int = 5, limit_events: int = 5) -> tuple[list[dict], list[dict]]:
+def _uma_moe_extract_timeline(js: str) -> dict | None:
+    """Reduce the uma.moe Timeline chunk to the constants and raw rows we use.
+
+    Returns None when the launch dates / catch-up rate can't be found.
+    """
+    jp_launch = _uma_moe_extract_utc_date(js, "ee")
+    global_launch = _uma_moe_extract_utc_date(js, "_e")
+    catchup_rate = _uma_moe_extract_number(js, "me")
+    if not (jp_launch and global_launch and catchup_rate):
+        return None
+
+    story_m = re.search(r"var Vt=\[(.*?)\];", js, re.S)
+    story_rows = []
+    if story_m:
+        story_rows = re.findall(
+            r'\{event_name:"(.*?)",image:"(.*?)",start_date:"(.*?)",end_date:"(.*?)"\}',
+            story_m.group(1),
+            re.S,
+        )
+
+    cm_m = re.search(r"var jt=\[(.*?)\];", js, re.S)
+    cm_rows = []
+    if cm_m:
+        cm_rows = re.findall(
+            r'\{name:"(.*?)",start_date:"(.*?)",end_date:"(.*?)",track:"(.*?)",distance:"(.*?)",conditions:"(.*?)"\}',
+            cm_m.group(1),
+            re.S,
+        )
+
+    return {
+        "jp_launch": jp_launch,
+        "global_launch": global_launch,
+        "catchup_rate": catchup_rate,
+        "story_confirmed": _uma_moe_extract_map(js, "Qt"),
+        "champions_confirmed": _uma_moe_extract_map(js, "Xt"),
+        "story_rows": story_rows,
+        "cm_rows": cm_rows,
+        "has_cm": cm_m is not None,
+    }
+
+
+def fetch_uma_moe_upcoming(
+    limit_banners: int = 5, limit_events: int = 5, champions_meetings: list[dict] | None = None
+) -> tuple[list[dict], list[dict]]:
     """Upcoming items from uma.moe timeline.
 
     uma.moe embeds JP timelines (story events, champions meetings, etc.) and
     calculates estimated *Global* dates client-side. This function ports the same
     mapping logic so we can list upcoming items relative to *Global* dates.
+    If `champions_meetings` is given, the full record of every Champions Meeting
+    (past ones too) is appended to it.
     """
     headers = {"User-Agent": "Mozilla/5.0"}
     try:
         chunk_url = _get_uma_moe_timeline_chunk_url()
         if not chunk_url:
             return [], []
-        js = requests.get(chunk_url, headers=headers, timeout=30).text
+        js = _http_get(chunk_url, source="uma.moe", stage="chunk", headers=headers).text
     except Exception as e:
         logger.warning(f"Failed to fetch uma.moe timeline chunk: {e}")
         return [], []
 
-    now_ts = int(time.time())
+    now_ts = _now_ts()
     upcoming_banners: list[dict] = []
     upcoming_events: list[dict] = []
 
@@ -718,35 +1816,26 @@ def fetch_uma_moe_upcoming(limit_banners: int = 5, limit_events: int = 5) -> tup
             return ""
 
         try:
-            idx_html = requests.get("https://gametora.com/umamusume/events", headers=headers, timeout=30).text
-            idx_soup = BeautifulSoup(idx_html, 'html.parser')
+            idx_html = _http_get("https://gametora.com/umamusume/events", source="gametora", stage="event_index", headers=headers).text
+            idx_soup = _parse_html(idx_html, source="gametora", stage="event_index")
         except Exception:
             return ""
 
-        slugs: list[str] = []
-        seen: set[str] = set()
-        for a in idx_soup.find_all('a', href=True):
-            href = a.get('href') or ""
-            if not href.startswith('/umamusume/events/'):
-                continue
-            if href in ('/umamusume/events', '/umamusume/events/story-events'):
-                continue
-            slug = href.split('/umamusume/events/', 1)[1].split('?', 1)[0].strip('/')
-            if not slug or slug in seen:
-                continue
-            seen.add(slug)
-            slugs.append(slug)
+        slugs = _extract_event_slugs(idx_soup)
+        del idx_soup
 
         # Cap work to avoid hammering the site. This runs on a daily schedule.
         for slug in slugs[:80]:
             page_url = f"https://gametora.com/umamusume/events/{slug}"
             try:
-                ev_html = requests.get(page_url, headers=headers, timeout=30).text
-                ev_soup = BeautifulSoup(ev_html, 'html.parser')
+                ev_html = _http_get(page_url, source="gametora", stage="event_image_page", headers=headers).text
+                ev_soup = _parse_html(ev_html, source="gametora", stage="event_image_page")
                 pp = _parse_next_data(ev_soup)
                 ev = pp.get('eventData') or {}
                 if not isinstance(ev, dict):
                     continue
+                if ev:
+                    _event_detail_store(slug, _event_detail_body(slug, page_url, ev, _extract_event_banner_image_url(ev_soup)))
                 name = (ev.get('name_en') or "").strip() or (ev.get('name_jp') or "").strip()
                 got = _normalize_event_title(name)
                 if not got:
@@ -762,8 +1851,8 @@ def fetch_uma_moe_upcoming(limit_banners: int = 5, limit_events: int = 5) -> tup
 
     def _get_gametora_champions_meeting_image() -> str:
         try:
-            html = requests.get("https://gametora.com/umamusume/events/champions-meeting", headers=headers, timeout=30).text
-            soup = BeautifulSoup(html, 'html.parser')
+            html = _http_get("https://gametora.com/umamusume/events/champions-meeting", source="gametora", stage="cm_page", headers=headers).text
+            soup = _parse_html(html, source="gametora", stage="cm_page")
             img = soup.find('img', src=lambda s: s and '/images/umamusume/events/' in s)
             if not img:
                 return ""
@@ -776,25 +1865,26 @@ def fetch_uma_moe_upcoming(limit_banners: int = 5, limit_events: int = 5) -> tup
         except Exception:
             return ""
 
-    jp_launch = _uma_moe_extract_utc_date(js, "ee")
-    global_launch = _uma_moe_extract_utc_date(js, "_e")
-    catchup_rate = _uma_moe_extract_number(js, "me")
-    if not (jp_launch and global_launch and catchup_rate):
+    with _span("extract timeline", source="uma.moe"), _PARSE_SECONDS.labels("uma.moe", "timeline").time():
+        timeline = _uma_moe_extract_timeline(js)
+    if not timeline:
         return [], []
-
-    story_confirmed = _uma_moe_extract_map(js, "Qt")
-    champions_confirmed = _uma_moe_extract_map(js, "Xt")
+    jp_launch = timeline["jp_launch"]
+    global_launch = timeline["global_launch"]
+    catchup_rate = timeline["catchup_rate"]
+    story_confirmed = timeline["story_confirmed"]
+    champions_confirmed = timeline["champions_confirmed"]
+    story_rows = timeline["story_rows"]
+    cm_rows = timeline["cm_rows"]
+    has_cm = timeline["has_cm"]
+
+    # Everything needed has been extracted; release the multi-megabyte chunk
+    # before any further requests are made.
+    del js, timeline
+    _refresh_sample("uma_moe:chunk")
 
     # --- Upcoming Story Events (compute Global start dates) ---
-    story_m = re.search(r"var Vt=\[(.*?)\];", js, re.S)
-    if story_m:
-        story_blob = story_m.group(1)
-        story_rows = re.findall(
-            r'\{event_name:"(.*?)",image:"(.*?)",start_date:"(.*?)",end_date:"(.*?)"\}',
-            story_blob,
-            re.S,
-        )
-
+    if story_rows:
         story_items = []
         story_pairs = []
         for name, image, start_s, end_s in story_rows:
@@ -802,7 +1892,13 @@ def fetch_uma_moe_upcoming(limit_banners: int = 5, limit_events: int = 5) -> tup
             if not start_ts:
                 continue
             jp_start = datetime.fromtimestamp(start_ts, tz=timezone.utc)
-            story_items.append({"name": (name or "").strip(), "image": image.strip(), "jp_start": jp_start})
+            end_ts = _parse_uma_moe_human_dt_to_ts(end_s)
+            story_items.append({
+                "name": (name or "").strip(),
+                "image": image.strip(),
+                "jp_start": jp_start,
+                "jp_days": ((end_ts - start_ts) // 86400) if end_ts and end_ts > start_ts else None,
+            })
 
         story_items.sort(key=lambda x: x["jp_start"].timestamp())
         for it in story_items:
@@ -820,32 +1916,32 @@ def fetch_uma_moe_upcoming(limit_banners: int = 5, limit_events: int = 5) -> tup
                 "subtitle": f"Starts {_format_dt(global_ts)} (est)",
                 "url": "https://uma.moe/timeline",
                 "imageUrl": _abs_uma_moe_asset(f"assets/images/story/{it['image']}"),
+                "_start": global_ts,
+                # Assume the Global run lasts as many days as the JP one did.
+                "_end": global_ts + it["jp_days"] * 86400 if it["jp_days"] else None,
+                "_kind": "story_event",
                 "_sort": global_ts,
             })
 
     # --- Upcoming Champions Meetings (compute Global start dates) ---
-    cm_m = re.search(r"var jt=\[(.*?)\];", js, re.S)
     cm_image = ""
-    if cm_m:
+    if has_cm:
         cm_image = _get_gametora_champions_meeting_image()
-        cm_blob = cm_m.group(1)
-        cm_rows = re.findall(
-            r'\{name:"(.*?)",start_date:"(.*?)",end_date:"(.*?)",track:"(.*?)",distance:"(.*?)",conditions:"(.*?)"\}',
-            cm_blob,
-            re.S,
-        )
         cm_items = []
         for name, start_s, end_s, track, distance, conditions in cm_rows:
             start_ts = _parse_uma_moe_human_dt_to_ts(start_s)
             if not start_ts:
                 continue
             jp_start = datetime.fromtimestamp(start_ts, tz=timezone.utc)
+            end_ts = _parse_uma_moe_human_dt_to_ts(end_s)
             cm_items.append({
                 "name": (name or "").strip(),
                 "track": (track or "").strip(),
                 "distance": (distance or "").strip(),
                 "conditions": (conditions or "").strip(),
                 "jp_start": jp_start,
+                "jp_end": end_ts,
+                "jp_days": ((end_ts - start_ts) // 86400) if end_ts and end_ts > start_ts else None,
             })
 
         cm_items.sort(key=lambda x: x["jp_start"].timestamp())
@@ -855,9 +1951,13 @@ def fetch_uma_moe_upcoming(limit_banners: int = 5, limit_events: int = 5) -> tup
             if global_dt:
                 cm_pairs.append({"jp": it["jp_start"], "global": global_dt})
 
-        for it in cm_items:
+        for idx, it in enumerate(cm_items):
             global_dt = _uma_moe_calculate_global_date(it["jp_start"], cm_pairs, jp_launch, global_launch, catchup_rate)
             global_ts = int(global_dt.timestamp())
+            if champions_meetings is not None:
+                champions_meetings.append(
+                    _champions_meeting_record(it, global_ts, f"champions_meeting_{idx}" in champions_confirmed)
+                )
             if global_ts < now_ts:
                 continue
             upcoming_events.append({
@@ -865,11 +1965,17 @@ def fetch_uma_moe_upcoming(limit_banners: int = 5, limit_events: int = 5) -> tup
                 "subtitle": f"Starts {_format_dt(global_ts)} (est)",
                 "url": "https://uma.moe/timeline",
                 "imageUrl": cm_image,
+                "_start": global_ts,
+                "_end": global_ts + it["jp_days"] * 86400 if it["jp_days"] else None,
+                "_kind": "champions_meeting",
                 "_sort": global_ts,
             })
 
     # Best-effort: fill missing images (e.g., Champions Meeting) using GameTora.
+    # Each lookup scans up to 80 event pages, so this is the first work dropped near the RSS budget.
     missing = [ev for ev in upcoming_events if not (ev.get('imageUrl') or '').strip()]
+    if missing and _refresh_defer("uma_moe:event_images"):
+        missing = []
     for ev in missing[:5]:
         img = _try_resolve_gametora_event_image(ev.get('title') or '')
         if img:
@@ -895,260 +2001,2618 @@ def fetch_uma_moe_upcoming(limit_banners: int = 5, limit_events: int = 5) -> tup
 
     return upcoming_banners[:limit_banners], deduped_events
 
-def fetch_gametora_data():
-    """Scrapes GameTora for current banners and events."""
+# Champions Meeting schedule (/api/champions-meetings). Every CM in uma.moe's
+# timeline with its course and projected Global dates, ordered by Global start,
+# with posting lists per track, distance class, surface and ground.
+CM_DISTANCE_CLASSES = (("sprint", 1400), ("mile", 1800), ("medium", 2400), ("long", 10**6))
+CM_FACETS = ("track", "distance_class", "surface", "ground")
+
+
+def _champions_meeting_record(it: dict, global_ts: int, confirmed: bool) -> dict:
+    """Full CM record from a parsed jt row and its (projected or confirmed) Global start."""
+    metres = re.search(r"\d+", it["distance"])
+    metres = int(metres.group(0)) if metres else None
+    surface, _, ground = it["conditions"].partition("/")
+    return {
+        "name": it["name"],
+        "track": it["track"],
+        "distance": it["distance"],
+        "distance_m": metres,
+        "distance_class": next((c for c, limit in CM_DISTANCE_CLASSES if metres <= limit), None) if metres else None,
+        "surface": surface.strip().lower() or None,
+        "ground": ground.strip().lower() or None,
+        "conditions": it["conditions"],
+        "jp_start": int(it["jp_start"].timestamp()),
+        "jp_end": it["jp_end"],
+        "start": global_ts,
+        "end": global_ts + it["jp_days"] * 86400 if it["jp_days"] else None,
+        "estimated": not confirmed,
+    }
+
+
+class _ChampionsMeetingIndex:
+    """Read-only index over CM records.
+
+    Records are sorted by Global start, so a date range is a slice found by
+    bisecting `starts`, and each facet value maps to an ascending list of
+    record positions. A query walks the shortest posting list inside the date
+    range and checks the others with set lookups.
+    """
+
+    __slots__ = ("records", "starts", "_postings", "built_at")
+
+    def __init__(self, records: list[dict]):
+        self.records = sorted(records, key=lambda r: (r["start"], r["name"]))
+        self.starts = [r["start"] for r in self.records]
+        self._postings: dict[tuple[str, str], list[int]] = {}
+        for pos, r in enumerate(self.records):
+            for facet in CM_FACETS:
+                if r[facet]:
+                    self._postings.setdefault((facet, r[facet].lower()), []).append(pos)
+        self.built_at = _now_ts()
+
+    def values(self, facet: str) -> list[str]:
+        return sorted(v for f, v in self._postings if f == facet)
+
+    def query(self, filters: dict[str, str], since: int | None = None, until: int | None = None) -> list[dict]:
+        """Records matching every facet filter whose Global start is in [since, until], in date order."""
+        lo = bisect.bisect_left(self.starts, since) if since is not None else 0
+        hi = bisect.bisect_right(self.starts, until) if until is not None else len(self.records)
+        lists = []
+        for facet, value in filters.items():
+            ps = self._postings.get((facet, value.lower()))
+            if not ps:
+                return []
+            lists.append(ps[bisect.bisect_left(ps, lo):bisect.bisect_left(ps, hi)])
+        if not lists:
+            return self.records[lo:hi]
+        lists.sort(key=len)
+        others = [set(ps) for ps in lists[1:]]
+        return [self.records[pos] for pos in lists[0] if all(pos in o for o in others)]
+
+
+_champions_meetings = _ChampionsMeetingIndex([])
+
+
+def _update_champions_meetings(records: list[dict]) -> None:
+    global _champions_meetings
+    _champions_meetings = _ChampionsMeetingIndex(records)
+
+
+# Tokens that say what kind of item something is rather than which one it is.
+# They are ignored when deciding whether two titles name the same thing.
+_ENTITY_GENERIC_TOKENS = {
+    "a", "an", "and", "the", "of", "to",
+    "banner", "banners", "gacha", "character", "support", "card", "cards",
+    "event", "events", "story", "champions", "meeting", "cup",
+    "new", "rerun", "original", "est", "estimate",
+}
+
+
+def _entity_tokens(title: str) -> list[str]:
+    t = (title or "").lower()
+    t = re.sub(r"[^a-z0-9]+", " ", t)
+    return [tok for tok in t.split() if tok not in _ENTITY_GENERIC_TOKENS]
+
+
+def _entity_trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _EntityIndex:
+    """Token/trigram index that merges the same banner or event across sources.
+
+    Sources are added one at a time, most trusted first. Each item of a source
+    is looked up through the inverted indexes (so only entities sharing a
+    distinctive token are scored), and either joins the best-scoring entity or
+    starts a new one. Items never merge with an entity that already has an item
+    from the same source, and items whose time windows don't overlap are never
+    considered the same.
+    """
+
+    def __init__(self, threshold: float = 0.75, slack_seconds: int = 7 * 86400):
+        self.threshold = threshold
+        self.slack_seconds = slack_seconds
+        self.entities: list[dict] = []
+        self._by_token: dict[str, set[int]] = {}
+        self._by_trigram: dict[str, set[int]] = {}
+
+    def add(self, source: str, items: list[dict]) -> None:
+        """Resolve all items of one source against the index."""
+        for item in items:
+            tokens = _entity_tokens(item.get("title") or "")
+            key = " ".join(tokens)
+            trigrams = _entity_trigrams(key) if key else set()
+            eid, score = self._resolve(source, item, set(tokens), trigrams)
+            if eid is None:
+                self._new_entity(source, item, tokens, key, trigrams)
+            else:
+                self._attach(eid, source, item, score)
+
+    def items(self) -> list[dict]:
+        """Merged display items, each with its per-source provenance."""
+        out = []
+        for ent in self.entities:
+            item = dict(ent["item"])
+            item["_start"] = ent["start"]
+            item["_end"] = ent["end"]
+            item["sources"] = [{"source": m["source"], "confidence": m["confidence"]} for m in ent["members"]]
+            out.append(item)
+        return out
+
+    def _resolve(self, source: str, item: dict, tokens: set[str], trigrams: set[str]) -> tuple[int | None, float]:
+        if not tokens:
+            return None, 0.0
+        candidates: set[int] = set()
+        for tok in tokens:
+            candidates |= self._by_token.get(tok, set())
+        if not candidates:
+            # No shared word: fall back to entities sharing most trigrams
+            # (spelling variants such as "Mihono Bourbon" / "Mihono Bourbone").
+            hits: dict[int, int] = {}
+            for tri in trigrams:
+                for eid in self._by_trigram.get(tri, ()):
+                    hits[eid] = hits.get(eid, 0) + 1
+            need = len(trigrams) / 2
+            candidates = {eid for eid, n in hits.items() if n >= need}
+
+        best_id = None
+        best_score = 0.0
+        for eid in candidates:
+            ent = self.entities[eid]
+            if source in ent["source_names"]:
+                continue
+            if not self._windows_overlap(ent, item):
+                continue
+            shared = len(tokens & ent["tokens"])
+            containment = shared / min(len(tokens), len(ent["tokens"]))
+            both = len(trigrams) + len(ent["trigrams"])
+            dice = (2 * len(trigrams & ent["trigrams"]) / both) if both else 0.0
+            score = max(0.6 * containment + 0.4 * dice, dice)
+            if score > best_score or (score == best_score and best_id is not None and eid < best_id):
+                best_id = eid
+                best_score = score
+
+        if best_id is None or best_score < self.threshold:
+            return None, 0.0
+        return best_id, round(best_score, 3)
+
+    def _windows_overlap(self, ent: dict, item: dict) -> bool:
+        a_start, a_end = ent["start"], ent["end"]
+        b_start, b_end = item.get("_start"), item.get("_end")
+        if not (a_start or a_end) or not (b_start or b_end):
+            # Unknown timing on either side can't rule a match out.
+            return True
+        a_lo = (a_start or a_end) - self.slack_seconds
+        a_hi = (a_end or a_start) + self.slack_seconds
+        b_lo = b_start or b_end
+        b_hi = b_end or b_start
+        return a_lo <= b_hi and b_lo <= a_hi
+
+    def _new_entity(self, source: str, item: dict, tokens: list[str], key: str, trigrams: set[str]) -> None:
+        eid = len(self.entities)
+        self.entities.append({
+            "item": {k: v for k, v in item.items() if not k.startswith("_")},
+            "tokens": set(tokens),
+            "trigrams": trigrams,
+            "start": item.get("_start"),
+            "end": item.get("_end"),
+            "source_names": {source},
+            "members": [{"source": source, "title": item.get("title") or "", "confidence": 1.0}],
+        })
+        for tok in set(tokens):
+            self._by_token.setdefault(tok, set()).add(eid)
+        for tri in trigrams:
+            self._by_trigram.setdefault(tri, set()).add(eid)
+
+    def _attach(self, eid: int, source: str, item: dict, score: float) -> None:
+        ent = self.entities[eid]
+        ent["source_names"].add(source)
+        ent["members"].append({"source": source, "title": item.get("title") or "", "confidence": score})
+        # The first (most trusted) source keeps its fields; later ones only fill gaps.
+        for field in ("imageUrl", "url", "subtitle"):
+            if not (ent["item"].get(field) or "").strip() and (item.get(field) or "").strip():
+                ent["item"][field] = item[field]
+        if not ent["start"] and item.get("_start"):
+            ent["start"] = item["_start"]
+        if not ent["end"] and item.get("_end"):
+            ent["end"] = item["_end"]
+
+
+def _merge_sources(sources: list[tuple[str, list[dict]]], limit: int | None = None, sort: bool = False) -> list[dict]:
+    """Merge per-source item lists into deduplicated entities.
+
+    `sources` is ordered from most to least trusted. With `sort`, entities are
+    ordered by start time (undated ones last); otherwise the order items were
+    first seen is kept.
+    """
+    index = _EntityIndex()
+    for name, items in sources:
+        index.add(name, items)
+    merged = index.items()
+    if sort:
+        merged.sort(key=lambda x: x.get("_start") or float("inf"))
+    return merged[:limit] if limit is not None else merged
+
+
+def _public_items(items: list[dict]) -> list[dict]:
+    """Strip internal helper keys (`_start`, `_end`, ...) before publishing."""
+    return [{k: v for k, v in it.items() if not k.startswith("_")} for it in items]
+
+
+_GAMETORA_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+}
+
+
+def fetch_gametora_mission_events() -> list[dict]:
+    """Current mission events from the GameTora home page.
+
+    The home page is parsed and reduced to records immediately, so its tree is
+    not kept alive while the rest of the refresh runs.
+    """
     url = "https://gametora.com/umamusume"
+    logger.info(f"Fetching data from {url}...")
+    response = _http_get(url, source="gametora", stage="home", headers=_GAMETORA_HEADERS)
+    response.raise_for_status()
+
+    soup = _parse_html(response.content, source="gametora", stage="home")
+    del response
+
+    events: list[dict] = []
+    event_header = soup.find(lambda tag: tag.name == "h2" and "Current Mission Events" in tag.text)
+    if not event_header:
+        return events
+    container = event_header.find_next_sibling('div')
+    if not container:
+        return events
+
+    for item_div in container.find_all('div', recursive=False):
+        link_tag = item_div.find('a')
+        if not link_tag:
+            continue
+
+        link = link_tag.get('href')
+        if not link.startswith('http'):
+            link = f"https://gametora.com{link}"
+
+        # Title is often in the link text or a sibling span/div
+        title = link_tag.get_text(strip=True)
+
+        img = link_tag.find('img')
+        image_url = ""
+        if img:
+            image_url = img.get('src')
+            if not image_url.startswith('http'):
+                image_url = f"https://gametora.com{image_url}"
+
+        # Date
+        text_div = item_div.find('div', class_=lambda x: x and 'text' in x)
+        time_text = ""
+        if text_div:
+            time_text = text_div.get_text(strip=True)
+
+        if not title and time_text:
+            title = "Mission Event"
+
+        events.append({
+            "title": title,
+            "imageUrl": image_url,
+            "url": link,
+            "subtitle": time_text,
+            "_kind": "mission_event",
+        })
+
+    return events
+
+
+def fetch_gametora_banners() -> dict[str, list[dict]]:
+    """Current gacha banners for every region on GameTora's gacha page.
+
+    GameTora is a Next.js app. The server-rendered HTML defaults to JP, and switching to Global
+    happens client-side (JS). Since this service doesn't execute JS, we read __NEXT_DATA__,
+    which carries the banners and card data of all regions; one fetch and parse serves them all.
+    "en" is the Global server.
+    """
     gacha_url = "https://gametora.com/umamusume/gacha"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-    }
-    
+
+    gacha_resp = _http_get(gacha_url, source="gametora", stage="gacha", headers=_GAMETORA_HEADERS)
+    gacha_resp.raise_for_status()
+    gacha_soup = _parse_html(gacha_resp.content, source="gametora", stage="gacha")
+    del gacha_resp
+    gacha_props = _parse_next_data(gacha_soup)
+    del gacha_soup
+
     try:
-        logger.info(f"Fetching data from {url}...")
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        new_data = {
-            "banners": [],
-            "events": []
+        _update_card_index(gacha_props)
+    except Exception as e:
+        logger.warning(f"Failed to update card index: {e}")
+
+    return _build_gacha_banners_all(gacha_props, gacha_url)
+
+
+# /api/events?region= aliases for GameTora's region keys.
+GACHA_REGION_ALIASES = {"jp": "ja", "global": "en", "kr": "ko", "tw": "zh_tw"}
+
+
+def _gacha_regions(gacha_props: dict) -> list[str]:
+    regions = set()
+    for key in ("currentCharBanners", "currentSupportBanners"):
+        regions.update((gacha_props.get(key) or {}).keys())
+    return sorted(regions)
+
+
+def _gacha_card_names(gacha_props: dict, key: str) -> dict:
+    """Card ID -> {region: name} for one catalogue (charCardData / supportCardData), all regions at once."""
+    names: dict = {}
+    for region, cards in (gacha_props.get(key) or {}).items():
+        for c in cards or []:
+            if isinstance(c, dict) and c.get('id') is not None and c.get('name'):
+                nm = re.sub(r"\s+", " ", str(c['name'])).strip()
+                if nm:
+                    names.setdefault(c['id'], {})[region] = nm
+    return names
+
+
+def _build_gacha_banners_all(gacha_props: dict, gacha_url: str = "https://gametora.com/umamusume/gacha") -> dict[str, list[dict]]:
+    """Banner items for every region in the gacha props, sharing one card lookup."""
+    char_names = _gacha_card_names(gacha_props, 'charCardData')
+    support_names = _gacha_card_names(gacha_props, 'supportCardData')
+    return {
+        region: _build_gacha_banners(gacha_props, region, gacha_url, card_names=(char_names, support_names))
+        for region in _gacha_regions(gacha_props)
+    }
+
+
+def _build_gacha_banners(
+    gacha_props: dict,
+    region: str,
+    gacha_url: str = "https://gametora.com/umamusume/gacha",
+    card_names: tuple[dict, dict] | None = None,
+) -> list[dict]:
+    """Build banner items for one region from the gacha page's __NEXT_DATA__ props.
+
+    `card_names` are the (character, support) lookups from _gacha_card_names, when
+    building several regions. A card without a name in `region` uses its EN name,
+    or any other region's.
+    """
+    banners: list[dict] = []
+
+    if card_names is None:
+        card_names = (_gacha_card_names(gacha_props, 'charCardData'), _gacha_card_names(gacha_props, 'supportCardData'))
+    char_cards, support_cards = card_names
+
+    char_banners = (gacha_props.get('currentCharBanners', {}).get(region) or [])
+    support_banners = (gacha_props.get('currentSupportBanners', {}).get(region) or [])
+
+    def _pickup_names(pickups, cards_by_id):
+        ids = []
+        for p in pickups or []:
+            if isinstance(p, (list, tuple)) and p:
+                ids.append(p[0])
+        names = []
+        for pid in ids:
+            by_region = cards_by_id.get(pid) or {}
+            nm = by_region.get(region) or by_region.get('en') or next(iter(by_region.values()), "")
+            if nm:
+                names.append(nm)
+        # keep unique order
+        seen = set()
+        uniq = []
+        for n in names:
+            if n in seen:
+                continue
+            seen.add(n)
+            uniq.append(n)
+        return uniq
+
+    def _add_banner(banner_id: int, start_ts: int | None, end_ts: int | None, kind: str, pickups, cards_by_id):
+        names = _pickup_names(pickups, cards_by_id)
+        title = kind
+        if names:
+            # Put names first so truncated UIs still show something useful.
+            title = " / ".join(names[:2])
+
+        banners.append({
+            "imageUrl": f"https://gametora.com/images/umamusume/gacha/img_bnr_gacha_{banner_id}.png",
+            "url": gacha_url,
+            "title": title,
+            "subtitle": f"{kind} · Ends {_format_dt(end_ts)}" if end_ts else kind,
+            "_start": int(start_ts) if start_ts else None,
+            "_end": int(end_ts) if end_ts else None,
+            "_kind": "character_banner" if cards_by_id is char_cards else "support_banner",
+            "_banner_id": banner_id,
+            "_pickups": names,
+        })
+
+    for b in char_banners:
+        if isinstance(b, dict) and b.get('id'):
+            _add_banner(int(b['id']), b.get('start'), b.get('end'), "Character Gacha", b.get('pickups'), char_cards)
+
+    for b in support_banners:
+        if isinstance(b, dict) and b.get('id'):
+            _add_banner(int(b['id']), b.get('start'), b.get('end'), "Support Card Gacha", b.get('pickups'), support_cards)
+
+    return banners
+
+
+# Card catalogue search (/api/cards). The gacha page carries every character
+# and support card of every region; they are kept as slotted records with
+# interned strings, plus a trigram index over the folded names.
+CARD_SEARCH_MAX = 100
+_CARD_CATALOGUES = {"charCardData": "character", "supportCardData": "support"}
+
+
+def _fold_card_name(name: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", name).casefold().split())
+
+
+class _Card:
+    """One card. `regions` and `names` are parallel; cards released in the same regions share one `regions` tuple."""
+
+    __slots__ = ("id", "kind", "rarity", "type", "char_id", "regions", "names", "folded")
+
+    def __init__(self, card_id: int, kind: str, rarity: int, card_type: str | None, char_id: int | None, regions: tuple, names: tuple):
+        self.id = card_id
+        self.kind = kind
+        self.rarity = rarity
+        self.type = card_type
+        self.char_id = char_id
+        self.regions = regions
+        self.names = names
+        self.folded = tuple(dict.fromkeys(sys.intern(_fold_card_name(nm)) for nm in names))
+
+    def name(self, region: str = "") -> str:
+        for wanted in (region, "en"):
+            if wanted in self.regions:
+                return self.names[self.regions.index(wanted)]
+        return self.names[0]
+
+    def public(self, region: str = "") -> dict:
+        out = {
+            "id": self.id,
+            "kind": self.kind,
+            "rarity": self.rarity,
+            "name": self.name(region),
+            "names": dict(zip(self.regions, self.names)),
         }
+        if self.type:
+            out["type"] = self.type
+        if self.char_id is not None:
+            out["char_id"] = self.char_id
+        return out
 
-        # IMPORTANT:
-        # GameTora is a Next.js app. The server-rendered HTML defaults to JP, and switching to Global
-        # happens client-side (JS). Since this service doesn't execute JS, we must read __NEXT_DATA__
-        # and explicitly select the EN (Global) region.
 
-        try:
-            gacha_resp = requests.get(gacha_url, headers=headers, timeout=30)
-            gacha_resp.raise_for_status()
-            gacha_soup = BeautifulSoup(gacha_resp.content, 'html.parser')
-            gacha_props = _parse_next_data(gacha_soup)
-
-            region = "en"  # Global server / English
-
-            char_cards = {c.get('id'): c for c in (gacha_props.get('charCardData', {}).get(region) or []) if isinstance(c, dict)}
-            support_cards = {c.get('id'): c for c in (gacha_props.get('supportCardData', {}).get(region) or []) if isinstance(c, dict)}
-
-            char_banners = (gacha_props.get('currentCharBanners', {}).get(region) or [])
-            support_banners = (gacha_props.get('currentSupportBanners', {}).get(region) or [])
-
-            def _pickup_names(pickups, cards_by_id):
-                ids = []
-                for p in pickups or []:
-                    if isinstance(p, (list, tuple)) and p:
-                        ids.append(p[0])
-                names = []
-                for pid in ids:
-                    card = cards_by_id.get(pid) or {}
-                    nm = card.get('name')
-                    if nm:
-                        nm = re.sub(r"\s+", " ", str(nm)).strip()
-                        if nm:
-                            names.append(nm)
-                # keep unique order
-                seen = set()
-                uniq = []
-                for n in names:
-                    if n in seen:
-                        continue
-                    seen.add(n)
-                    uniq.append(n)
-                return uniq
-
-            def _add_banner(banner_id: int, end_ts: int | None, kind: str, pickups, cards_by_id):
-                names = _pickup_names(pickups, cards_by_id)
-                title = kind
-                if names:
-                    # Put names first so truncated UIs still show something useful.
-                    title = " / ".join(names[:2])
-
-                new_data["banners"].append({
-                    "imageUrl": f"https://gametora.com/images/umamusume/gacha/img_bnr_gacha_{banner_id}.png",
-                    "url": gacha_url,
-                    "title": title,
-                    "subtitle": f"{kind} · Ends {_format_dt(end_ts)}" if end_ts else kind,
-                })
+def _gacha_card_fingerprint(gacha_props: dict) -> bytes:
+    """Digest of every named card's kind, ID, region, name, rarity and type; the index is rebuilt when it changes."""
+    keys = []
+    for key, kind in _CARD_CATALOGUES.items():
+        for region, cards in (gacha_props.get(key) or {}).items():
+            for c in cards or []:
+                if isinstance(c, dict) and c.get("id") is not None and c.get("name"):
+                    keys.append(f"{kind}|{c['id']}|{region}|{c['name']}|{c.get('rarity')}|{c.get('type')}|{c.get('char_id')}")
+    return hashlib.blake2b("\n".join(sorted(keys)).encode(), digest_size=16).digest()
+
+
+def _gacha_cards(gacha_props: dict, reuse: dict | None = None) -> list[_Card]:
+    """Card records for both catalogues; records in `reuse` that are unchanged are kept as is."""
+    reuse = reuse or {}
+    region_tuples: dict[tuple, tuple] = {}
+    cards = []
+    for key, kind in _CARD_CATALOGUES.items():
+        names = _gacha_card_names(gacha_props, key)
+        details: dict = {}
+        for region in sorted((gacha_props.get(key) or {}).keys()):
+            for c in gacha_props[key][region] or []:
+                if isinstance(c, dict) and c.get("id") in names:
+                    details.setdefault(c["id"], c)
+        for card_id, by_region in names.items():
+            regions = tuple(sorted(by_region))
+            regions = region_tuples.setdefault(regions, tuple(sys.intern(r) for r in regions))
+            c = details[card_id]
+            try:
+                rarity = int(c.get("rarity") or 0)
+            except (TypeError, ValueError):
+                rarity = 0
+            card_type = sys.intern(str(c["type"]).lower()) if c.get("type") else None
+            char_id = c.get("char_id") if isinstance(c.get("char_id"), int) else None
+            card_names = tuple(sys.intern(by_region[r]) for r in regions)
+            old = reuse.get((kind, card_id))
+            if (
+                old is not None and old.regions == regions and old.names == card_names
+                and old.rarity == rarity and old.type == card_type and old.char_id == char_id
+            ):
+                cards.append(old)
+                continue
+            cards.append(_Card(card_id, kind, rarity, card_type, char_id, regions, card_names))
+    return cards
+
+
+class _CardIndex:
+    """Read-only search index over card records.
+
+    Records are ordered by rarity (highest first), kind and ID, so a record's
+    position is also its default rank and every posting list is a sorted
+    `array("I")` of positions. Queries of three or more characters intersect
+    the posting lists of their trigrams and check the substring on what is
+    left; shorter queries match word prefixes through a sorted word list.
+    Filters intersect per-value posting lists. Once built the index is never
+    mutated, so lookups need no lock; updates build a new one and swap it in.
+    """
+
+    __slots__ = (
+        "fingerprint", "cards", "regions", "_trigrams", "_words", "_word_pos", "_names", "_name_pos", "_facets",
+        "built_at", "build_ms", "memory_bytes",
+    )
+
+    def __init__(self, fingerprint: bytes, cards: list[_Card]):
+        started = time.perf_counter()
+        self.fingerprint = fingerprint
+        self.cards = sorted(cards, key=lambda c: (-c.rarity, c.kind, c.id))
+        self.regions = sorted({r for c in self.cards for r in c.regions})
+
+        postings: dict[str, list[int]] = {}
+        facets: dict[tuple, list[int]] = {}
+        words: set[tuple[str, int]] = set()
+        names: set[tuple[str, int]] = set()
+        for pos, card in enumerate(self.cards):
+            grams = set()
+            for folded in card.folded:
+                grams.update(folded[i:i + 3] for i in range(len(folded) - 2))
+                words.update((w, pos) for w in folded.split())
+                names.add((folded, pos))
+            for g in grams:
+                postings.setdefault(g, []).append(pos)
+            for facet in (("kind", card.kind), ("rarity", card.rarity), ("type", card.type)):
+                facets.setdefault(facet, []).append(pos)
+            for r in card.regions:
+                facets.setdefault(("region", r), []).append(pos)
+        self._trigrams = {sys.intern(g): array("I", ps) for g, ps in postings.items()}
+        self._facets = {facet: array("I", ps) for facet, ps in facets.items()}
+        words_sorted = sorted(words)
+        self._words = [sys.intern(w) for w, _ in words_sorted]
+        self._word_pos = array("I", (pos for _, pos in words_sorted))
+        names_sorted = sorted(names)
+        self._names = [nm for nm, _ in names_sorted]
+        self._name_pos = array("I", (pos for _, pos in names_sorted))
+
+        self.built_at = _now_ts()
+        self.build_ms = round((time.perf_counter() - started) * 1000, 2)
+        self.memory_bytes = self._measure()
+
+    def _measure(self) -> int:
+        """Bytes held by the records, strings and postings (each object counted once)."""
+        seen: set[int] = set()
+
+        def size(*objs) -> int:
+            total = 0
+            for o in objs:
+                if id(o) not in seen:
+                    seen.add(id(o))
+                    total += sys.getsizeof(o)
+            return total
+
+        total = size(self, self.fingerprint, self.cards, self.regions, self._trigrams, self._facets)
+        total += size(self._words, self._word_pos, self._names, self._name_pos)
+        for c in self.cards:
+            total += size(c, c.id, c.rarity, c.type, c.char_id, c.regions, c.names, c.folded)
+            total += size(*c.regions, *c.names, *c.folded)
+        for g, ps in self._trigrams.items():
+            total += size(g, ps)
+        for facet, ps in self._facets.items():
+            total += size(facet, *facet, ps)
+        total += size(*self._words)
+        return total
+
+    @staticmethod
+    def _prefix_range(keys: list[str], positions: array, prefix: str) -> array:
+        lo = bisect.bisect_left(keys, prefix)
+        hi = bisect.bisect_left(keys, prefix + "\U0010ffff", lo)
+        return positions[lo:hi]
+
+    def _candidates(self, q: str) -> set[int] | None:
+        """Positions whose names match `q`; None means every card."""
+        if not q:
+            return None
+        if len(q) < 3:
+            return set(self._prefix_range(self._words, self._word_pos, q))
+        lists = []
+        for g in {q[i:i + 3] for i in range(len(q) - 2)}:
+            ps = self._trigrams.get(g)
+            if ps is None:
+                return set()
+            lists.append(ps)
+        lists.sort(key=len)
+        found = set(lists[0])
+        for ps in lists[1:]:
+            found.intersection_update(ps)
+            if not found:
+                break
+        if len(q) == 3:
+            return found
+        return {pos for pos in found if any(q in f for f in self.cards[pos].folded)}
+
+    def search(
+        self, q: str = "", kind: str = "", rarity: int | None = None, card_type: str = "", region: str = "", limit: int = 20
+    ) -> tuple[int, list[_Card]]:
+        """Total matches and the best `limit`: exact name, then name prefix, word prefix, substring."""
+        q = _fold_card_name(q)
+        found = self._candidates(q)
+        for facet in (("kind", kind), ("rarity", rarity), ("type", card_type.lower()), ("region", region)):
+            if facet[1] in ("", None):
+                continue
+            ps = self._facets.get(facet, ())
+            if found is None:
+                found = set(ps)
+            else:
+                found.intersection_update(ps)
+        if found is None:
+            return len(self.cards), self.cards[:limit]
+
+        picked: list[int] = []
+        if q:
+            # Tiers in rank order: exact name, name prefix, word prefix; the rest are substring matches.
+            lo = bisect.bisect_left(self._names, q)
+            hi = bisect.bisect_left(self._names, q + "\U0010ffff", lo)
+            eq = bisect.bisect_right(self._names, q, lo, hi)
+            tiers = (self._name_pos[lo:eq], self._name_pos[eq:hi], self._prefix_range(self._words, self._word_pos, q))
+            taken: set[int] = set()
+            for tier in tiers:
+                for pos in sorted(found.intersection(tier) - taken):
+                    if len(picked) >= limit:
+                        break
+                    picked.append(pos)
+                    taken.add(pos)
+            if len(picked) < limit:
+                picked += sorted(found - taken)[:limit - len(picked)]
+        else:
+            picked = sorted(found)[:limit]
+        return len(found), [self.cards[pos] for pos in picked]
+
+    def stats(self) -> dict:
+        return {
+            "cards": len(self.cards),
+            "regions": self.regions,
+            "trigrams": len(self._trigrams),
+            "memory_bytes": self.memory_bytes,
+            "built_at": self.built_at,
+            "build_ms": self.build_ms,
+        }
+
+
+_card_index: _CardIndex | None = None
+
+
+def _update_card_index(gacha_props: dict) -> bool:
+    """Rebuild the card index when any card (or its names, rarity or type) changed; unchanged records are reused."""
+    global _card_index
+    fingerprint = _gacha_card_fingerprint(gacha_props)
+    current = _card_index
+    if current is not None and current.fingerprint == fingerprint:
+        return False
+    reuse = {(c.kind, c.id): c for c in current.cards} if current is not None else None
+    index = _CardIndex(fingerprint, _gacha_cards(gacha_props, reuse))
+    _card_index = index
+    _CARD_INDEX_BYTES.set(index.memory_bytes)
+    logger.info(
+        f"Card index rebuilt: {len(index.cards)} cards, {len(index._trigrams)} trigrams, "
+        f"{index.memory_bytes / 1024:.0f} KiB in {index.build_ms:.1f} ms"
+    )
+    return True
+
+
+# Image cache (/api/assets). Images referenced by the published items are
+# fetched once in the background into a content-addressed directory
+# (<dir>/<sha256[:2]>/<sha256>.<ext>) with LRU eviction by total size, and
+# /api/events points imageUrl at the local copy once it is there. Downscaled
+# variants (?w=) need Pillow; without it the original is served.
+ASSET_CACHE_DIR = os.environ.get("UMA_ASSET_CACHE_DIR", "asset-cache")
+ASSET_CACHE_MAX_BYTES = int(os.environ.get("UMA_ASSET_CACHE_MAX_MB", "200") or 0) * 1024 * 1024
+ASSET_MAX_IMAGE_BYTES = 10 * 1024 * 1024
+ASSET_WIDTHS = (160, 320, 640)
+PUBLIC_BASE_URL = os.environ.get("UMA_PUBLIC_BASE_URL", "http://raspberrypi.local:8003").rstrip("/")
+_ASSET_EXTENSIONS = {"image/png": ".png", "image/jpeg": ".jpg", "image/webp": ".webp", "image/gif": ".gif"}
+_ASSET_SOURCES = {"gametora.com": "gametora", "uma.moe": "uma.moe", "game8.co": "game8"}
+
+_asset_lock = Lock()
+_asset_loaded = False
+# Upstream URL -> content hash, and hash -> {"ext", "size" (with variants), "used", "variants"}.
+_asset_urls: dict[str, str] = {}
+_asset_files: dict[str, dict] = {}
+_asset_bytes = 0
+# Bumped whenever URLs gain or lose a local copy, so cached /api/events bodies are rebuilt.
+_asset_generation = 0
+_asset_pending: set[str] = set()
+_asset_wakeup = threading.Event()
+_asset_prefetcher: threading.Thread | None = None
+
+
+def _asset_path(digest: str, ext: str, width: int = 0) -> str:
+    name = f"{digest}_w{width}{ext}" if width else f"{digest}{ext}"
+    return os.path.join(ASSET_CACHE_DIR, digest[:2], name)
+
+
+def _asset_load_locked() -> None:
+    """Read the index written by the prefetcher, keeping only files that still exist."""
+    global _asset_loaded, _asset_bytes
+    if _asset_loaded:
+        return
+    _asset_loaded = True
+    try:
+        with open(os.path.join(ASSET_CACHE_DIR, "index.json"), encoding="utf-8") as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable asset index: {e}")
+        return
+    for digest, meta in (index.get("files") or {}).items():
+        if os.path.exists(_asset_path(digest, meta["ext"])):
+            meta["variants"] = [w for w in meta.get("variants", []) if os.path.exists(_asset_path(digest, meta["ext"], w))]
+            _asset_files[digest] = meta
+            _asset_bytes += int(meta.get("size") or 0)
+    _asset_urls.update({url: digest for url, digest in (index.get("urls") or {}).items() if digest in _asset_files})
 
-            for b in char_banners:
-                if isinstance(b, dict) and b.get('id'):
-                    _add_banner(int(b['id']), b.get('end'), "Character Gacha", b.get('pickups'), char_cards)
 
-            for b in support_banners:
-                if isinstance(b, dict) and b.get('id'):
-                    _add_banner(int(b['id']), b.get('end'), "Support Card Gacha", b.get('pickups'), support_cards)
+def _asset_save_locked() -> None:
+    path = os.path.join(ASSET_CACHE_DIR, "index.json")
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"urls": _asset_urls, "files": _asset_files}, f, separators=(",", ":"))
+    os.replace(tmp, path)
 
+
+def _asset_write(path: str, write) -> None:
+    """Create `path` atomically: `write(file)` fills a unique temp file next to it, which is then renamed.
+
+    Concurrent writers of the same path each use their own temp file, and the last rename wins.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _asset_evict_locked() -> None:
+    """Drop least recently used images (and their variants) until under the size budget."""
+    global _asset_bytes, _asset_generation
+    if _asset_bytes <= ASSET_CACHE_MAX_BYTES:
+        return
+    for digest in sorted(_asset_files, key=lambda d: _asset_files[d]["used"]):
+        if _asset_bytes <= ASSET_CACHE_MAX_BYTES:
+            break
+        meta = _asset_files.pop(digest)
+        for width in [0] + meta["variants"]:
+            try:
+                os.remove(_asset_path(digest, meta["ext"], width))
+            except FileNotFoundError:
+                pass
+        _asset_bytes -= meta["size"]
+        for url in [u for u, d in _asset_urls.items() if d == digest]:
+            del _asset_urls[url]
+        _asset_generation += 1
+
+
+def _asset_store(url: str) -> bool:
+    """Fetch one image and add it to the cache; False when it is not a usable image."""
+    global _asset_bytes, _asset_generation
+    host = (re.match(r"https?://(?:www\.)?([^/]+)", url) or [None, ""])[1]
+    resp = _http_get(url, source=_ASSET_SOURCES.get(host, host or "other"), stage="asset", timeout=HTTP_TIMEOUT)
+    ext = _ASSET_EXTENSIONS.get((resp.headers.get("Content-Type") or "").split(";", 1)[0].strip().lower())
+    if resp.status_code != 200 or ext is None or not resp.content or len(resp.content) > ASSET_MAX_IMAGE_BYTES:
+        return False
+    digest = hashlib.sha256(resp.content).hexdigest()
+    path = _asset_path(digest, ext)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _asset_write(path, lambda f: f.write(resp.content))
+    with _asset_lock:
+        if digest not in _asset_files:
+            _asset_files[digest] = {"ext": ext, "size": len(resp.content), "used": time.time(), "variants": []}
+            _asset_bytes += len(resp.content)
+        _asset_urls[url] = digest
+        _asset_generation += 1
+    return True
+
+
+def _asset_prefetch_loop() -> None:
+    while True:
+        _asset_wakeup.wait()
+        _asset_wakeup.clear()
+        with _asset_lock:
+            urls = sorted(_asset_pending)
+            _asset_pending.clear()
+        stored, generation = 0, _asset_generation
+        for url in urls:
+            try:
+                stored += _asset_store(url)
+            except Exception as e:
+                logger.warning(f"Failed to cache image {url}: {e}")
+        try:
+            with _asset_lock:
+                _asset_evict_locked()
+                _asset_save_locked()
         except Exception as e:
-            logger.warning(f"Failed to build EN/Global banners from gacha data: {e}")
-
-        # Current + Upcoming story events (best-effort)
-        current_events, upcoming_events = fetch_story_events(limit=5)
-        new_data["events"] = current_events
-        new_data["upcoming_events"] = upcoming_events
-
-        # Upcoming banners: GameTora doesn't expose future banners in __NEXT_DATA__.
-        # Use Game8 as a best-effort fallback source.
-        upcoming_banners = fetch_game8_upcoming_banners(limit=5)
-
-        # If we still have gaps (or for upcoming events), use uma.moe timeline as an additional estimate source.
-        uma_banners, uma_events = fetch_uma_moe_upcoming(limit_banners=10, limit_events=10)
-
-        # Fill upcoming events if GameTora couldn't provide any.
-        if not new_data["upcoming_events"]:
-            new_data["upcoming_events"] = uma_events[:5]
-
-        # Extend upcoming banners with uma.moe if needed.
-        if len(upcoming_banners) < 5 and uma_banners:
-            want = 5 - len(upcoming_banners)
-            seen = {((b.get('title') or '').strip().lower()) for b in upcoming_banners}
-            for b in uma_banners:
-                key = ((b.get('title') or '').strip().lower())
-                if not key or key in seen:
+            logger.warning(f"Failed to save asset index: {e}")
+        if urls:
+            logger.info(f"Cached {stored} of {len(urls)} new images ({_asset_bytes / 1048576:.1f} MiB in cache)")
+        if _asset_generation != generation:
+            # SSE clients got this version's payload with upstream image URLs; resend it.
+            _wake_snapshot_waiters()
+
+
+def _queue_asset_prefetch(sections: list[list[dict]]) -> None:
+    """Queue the images of published items that are not cached yet; already cached ones count as used."""
+    global _asset_prefetcher
+    if not ASSET_CACHE_DIR or _http_archive is not None:
+        return
+    urls = {it.get("imageUrl") for items in sections for it in items}
+    now = time.time()
+    with _asset_lock:
+        _asset_load_locked()
+        for url in urls:
+            if not url or not url.startswith(("http://", "https://")):
+                continue
+            digest = _asset_urls.get(url)
+            if digest is not None:
+                _asset_files[digest]["used"] = now
+            else:
+                _asset_pending.add(url)
+        if not _asset_pending:
+            return
+        if _asset_prefetcher is None:
+            _asset_prefetcher = threading.Thread(target=_asset_prefetch_loop, name="asset-prefetcher", daemon=True)
+            _asset_prefetcher.start()
+    _asset_wakeup.set()
+
+
+def _local_image_items(items: list[dict]) -> list[dict]:
+    """Items with imageUrl pointing at /api/assets where the image is cached."""
+    if not ASSET_CACHE_DIR or not _asset_urls:
+        return items
+    out = []
+    for it in items:
+        digest = _asset_urls.get(it.get("imageUrl") or "")
+        meta = _asset_files.get(digest) if digest else None
+        if meta is not None:
+            it = {**it, "imageUrl": f"{PUBLIC_BASE_URL}/api/assets/{digest}{meta['ext']}"}
+        out.append(it)
+    return out
+
+
+def _asset_variant(digest: str, meta: dict, width: int) -> str | None:
+    """Path of the image downscaled to `width` (created on first use); None when it can't be made."""
+    global _asset_bytes
+    path = _asset_path(digest, meta["ext"], width)
+    if width in meta["variants"] and os.path.exists(path):
+        return path
+    if Image is None:
+        return None
+    with Image.open(_asset_path(digest, meta["ext"])) as img:
+        if img.width <= width:
+            return None
+        img.thumbnail((width, img.height * width // img.width + 1))
+        fmt = img.format or meta["ext"].lstrip(".").replace("jpg", "jpeg").upper()
+        _asset_write(path, lambda f: img.save(f, format=fmt))
+    with _asset_lock:
+        if width not in meta["variants"]:
+            meta["variants"].append(width)
+            meta["size"] += os.path.getsize(path)
+            _asset_bytes += os.path.getsize(path)
+    return path
+
+
+# Versioned snapshots. Every publish of the cache gets the next version and is
+# kept in a bounded ring, so clients can ask for what changed since the version
+# they have (GET /api/events/changes) instead of re-downloading the payload.
+SNAPSHOT_KEEP = max(2, int(os.environ.get("UMA_SNAPSHOT_KEEP", "20") or 20))
+SNAPSHOT_SECTIONS = ("banners", "events", "upcoming_banners", "upcoming_events")
+CHANGES_MAX_WAIT_SECONDS = 60.0
+
+_snapshot_lock = Lock()
+# Versions count up from the process start time rather than 0, so a version a
+# client kept from before a restart is never mistaken for a new snapshot: it is
+# not in the ring and gets `reset`. The last published version is also kept in
+# the state database (_restore_snapshot_version), in case the clock starts
+# behind after a reboot (the Pi has no RTC).
+_snapshot_version = int(time.time())
+_snapshots: deque = deque(
+    [{"version": _snapshot_version, "published_at": None, "sections": {k: [] for k in SNAPSHOT_SECTIONS}}],
+    maxlen=SNAPSHOT_KEEP,
+)
+events_cache["version"] = _snapshot_version
+# One future per event loop, resolved when the next version is published; every
+# long-poll and SSE client on that loop awaits the same future.
+_snapshot_waiters: dict[asyncio.AbstractEventLoop, asyncio.Future] = {}
+_changes_cache: OrderedDict[tuple[int, int], dict] = OrderedDict()
+
+
+def _item_key(item: dict) -> str:
+    """Identity of an item across versions; other fields changing makes it "changed"."""
+    return f"{item.get('url') or ''}#{item.get('title') or ''}"
+
+
+def _publish_snapshot(new_data: dict, region_banners: dict[str, list[dict]] | None = None) -> int:
+    """Swap new sections into the cache, record them as the next version and wake waiters."""
+    global _snapshot_version
+    with _snapshot_lock:
+        for section in SNAPSHOT_SECTIONS:
+            events_cache[section] = new_data[section]
+        events_cache["region_banners"] = region_banners or {}
+        events_cache["last_updated"] = datetime.now().isoformat()
+        _snapshot_version += 1
+        events_cache["version"] = _snapshot_version
+        _snapshots.append({
+            "version": _snapshot_version,
+            "published_at": events_cache["last_updated"],
+            "sections": {k: new_data[k] for k in SNAPSHOT_SECTIONS},
+        })
+        version = _snapshot_version
+    _wake_snapshot_waiters()
+    return version
+
+
+def _wake_snapshot_waiters() -> None:
+    """Wake every long-poll and SSE client; each re-checks whether what it waits for happened."""
+    with _snapshot_lock:
+        waiters = list(_snapshot_waiters.items())
+        _snapshot_waiters.clear()
+    for loop, fut in waiters:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(_wake_waiter, fut)
+
+
+def _wake_waiter(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+async def _wait_for_snapshot(after: int, timeout: float, assets: int | None = None) -> bool:
+    """Wait (without holding a thread) until a version newer than `after` is published.
+
+    With `assets`, also return (True) once the asset generation moved on from it.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        with _snapshot_lock:
+            if _snapshot_version > after or (assets is not None and _asset_generation != assets):
+                return True
+            fut = _snapshot_waiters.get(loop)
+            if fut is None:
+                fut = _snapshot_waiters[loop] = loop.create_future()
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        try:
+            # shield: one waiter timing out must not cancel the shared future.
+            await asyncio.wait_for(asyncio.shield(fut), remaining)
+        except asyncio.TimeoutError:
+            pass
+
+
+def _section_changes(old: list[dict], new: list[dict]) -> dict | None:
+    old_by_key = {_item_key(it): it for it in old}
+    new_by_key = {_item_key(it): it for it in new}
+    added = [{**it, "key": k} for k, it in new_by_key.items() if k not in old_by_key]
+    changed = [{**it, "key": k} for k, it in new_by_key.items() if k in old_by_key and old_by_key[k] != it]
+    removed = [k for k in old_by_key if k not in new_by_key]
+    order = list(new_by_key)
+    if not (added or changed or removed) and order == list(old_by_key):
+        return None
+    return {"added": added, "removed": removed, "changed": changed, "order": order}
+
+
+def _snapshot_changes(since: int) -> dict:
+    """Per-section changes from version `since` to the current one.
+
+    If `since` is no longer in the ring (or from before a restart: versions
+    never repeat across restarts) the response has `reset: true` and lists
+    every current item as added.
+    """
+    with _snapshot_lock:
+        current = _snapshots[-1]
+        base = next((snap for snap in _snapshots if snap["version"] == since), None)
+    cache_key = (since, current["version"])
+    cached = _changes_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    reset = base is None
+    base_sections = {k: [] for k in SNAPSHOT_SECTIONS} if reset else base["sections"]
+    sections = {}
+    for section in SNAPSHOT_SECTIONS:
+        diff = _section_changes(base_sections[section], current["sections"][section])
+        if diff is not None:
+            sections[section] = diff
+    result = {
+        "version": current["version"],
+        "since": since,
+        "reset": reset,
+        "published_at": current["published_at"],
+        "sections": sections,
+    }
+    _changes_cache[cache_key] = result
+    while len(_changes_cache) > 2 * SNAPSHOT_KEEP:
+        _changes_cache.popitem(last=False)
+    return result
+
+
+# iCalendar feed (/api/calendar.ics). Every dated banner/event becomes a VEVENT
+# with a UID that follows the thing rather than the listing: when an item shows
+# up under a new identity (an upcoming banner going live moves from Game8's page
+# to GameTora's, an estimate gets confirmed), it takes over the UID of the entry
+# with the same title and start date, so calendars update the event instead of
+# showing it twice. VEVENTs are rendered once and only re-rendered (with
+# SEQUENCE bumped) when their fields change, so a refresh that changes one event
+# touches one VEVENT. Feed bodies per (region, types) are joined from the
+# rendered VEVENTs at most once per calendar generation. Entries are kept in the
+# state database, so UIDs and SEQUENCEs carry over restarts.
+CALENDAR_TYPES = ("banner", "event")
+# How long ended events stay in the feed after they drop out of the sources.
+CALENDAR_KEEP_DAYS = int(os.environ.get("UMA_CALENDAR_KEEP_DAYS", "30") or 0)
+CALENDAR_REFRESH_INTERVAL = "PT6H"
+# How far apart the starts of an entry and an item under a new identity may be
+# for it to continue that entry (estimated dates move a little when confirmed).
+CALENDAR_MATCH_SLACK_SECONDS = 3 * 86400
+_CALENDAR_PRODID = "-//umamusume-tracker//calendar//EN"
+
+_calendar_lock = Lock()
+# uid -> {"type", "region", "fields", "sequence", "first_seen", "modified", "idents", "vevent"}
+_calendar_entries: dict[str, dict] = {}
+# item identity (type|region|url#title) -> uid of the entry it belongs to
+_calendar_idents: dict[str, str] = {}
+_calendar_generation = 0
+# Set once the calendar was restored from the state database or built by a
+# refresh; until then the feed is 503 rather than an empty calendar.
+_calendar_ready = False
+# (region, types) -> (generation, body, etag)
+_calendar_bodies: dict[tuple, tuple] = {}
+
+
+def _ics_escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _ics_line(line: str) -> str:
+    """Fold a content line at 75 octets (RFC 5545 3.1) without splitting UTF-8 sequences."""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line + "\r\n"
+    parts, start, limit = [], 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        while end < len(data) and (data[end] & 0xC0) == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode("utf-8"))
+        start, limit = end, 74  # continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ics_time(ts: int) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _calendar_vevent(uid: str, entry: dict) -> str:
+    title, subtitle, url, start, end, status = entry["fields"]
+    start = start or entry["first_seen"]
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{_ics_time(entry['modified'])}",
+        f"LAST-MODIFIED:{_ics_time(entry['modified'])}",
+        f"SEQUENCE:{entry['sequence']}",
+        f"DTSTART:{_ics_time(start)}",
+    ]
+    if end and end > start:
+        lines.append(f"DTEND:{_ics_time(end)}")
+    lines.append(f"SUMMARY:{_ics_escape(title)}")
+    if subtitle:
+        lines.append(f"DESCRIPTION:{_ics_escape(subtitle)}")
+    if url:
+        lines.append(f"URL:{url}")
+    lines += [f"CATEGORIES:{entry['type'].capitalize()}", f"STATUS:{status}", "TRANSP:TRANSPARENT", "END:VEVENT"]
+    return "".join(_ics_line(line) for line in lines)
+
+
+def _calendar_items(sections: dict[str, list[dict]], region_banners: dict[str, list[dict]]):
+    """(type, region, item) for every item of a refresh; region is None for items shown in every region."""
+    for region, items in region_banners.items():
+        for it in items:
+            yield "banner", region, it
+    for section, kind in (("upcoming_banners", "banner"), ("events", "event"), ("upcoming_events", "event")):
+        for it in sections.get(section) or []:
+            yield kind, None, it
+
+
+def _calendar_fields(it: dict) -> tuple:
+    start, end = it.get("_start"), it.get("_end")
+    # Dates only uma.moe has are projections from the JP schedule.
+    estimated = all(src["source"] == "uma.moe" for src in it.get("sources") or [{"source": ""}])
+    return (
+        it.get("title") or "", it.get("subtitle") or "", it.get("url") or "",
+        int(start) if start else None, int(end) if end else None,
+        "TENTATIVE" if estimated else "CONFIRMED",
+    )
+
+
+def _calendar_match(pending: list[tuple], entries: list[tuple[str, dict]]) -> dict[int, str]:
+    """Index into `pending` -> uid of the entry (not claimed by this refresh) each item continues.
+
+    An item continues an entry of the same type shown in the same region
+    (Global and every-region count as one) whose title resolves to the same
+    entity and whose start is within CALENDAR_MATCH_SLACK_SECONDS.
+    """
+    def group(kind: str, region: str | None) -> tuple:
+        return kind, region if region not in (None, "en") else ""
+
+    matches: dict[int, str] = {}
+    indexes: dict[tuple, tuple[_EntityIndex, list[tuple[str, dict]]]] = {}
+    for uid, entry in entries:
+        index, olds = indexes.setdefault(
+            group(entry["type"], entry["region"]), (_EntityIndex(slack_seconds=CALENDAR_MATCH_SLACK_SECONDS), []))
+        # Items of one source never merge, so entity i of the index is olds[i].
+        title, _, _, start, end, _ = entry["fields"]
+        index.add("calendar", [{"title": title, "_start": start, "_end": end}])
+        olds.append((uid, entry))
+    for i, (kind, region, it, _) in enumerate(pending):
+        found = indexes.get(group(kind, region))
+        if found is None:
+            continue
+        index, olds = found
+        tokens = _entity_tokens(it.get("title") or "")
+        key = " ".join(tokens)
+        eid, score = index._resolve("refresh", it, set(tokens), _entity_trigrams(key) if key else set())
+        if eid is None:
+            continue
+        start, old_start = it.get("_start"), olds[eid][1]["fields"][3]
+        if start and old_start and abs(int(start) - old_start) > CALENDAR_MATCH_SLACK_SECONDS:
+            continue
+        index._attach(eid, "refresh", it, score)  # one item per entry
+        matches[i] = olds[eid][0]
+    return matches
+
+
+def _update_calendar(sections: dict[str, list[dict]], region_banners: dict[str, list[dict]]) -> int:
+    """Fold a refresh's merged items (with `_start`/`_end`) into the calendar; returns VEVENTs changed."""
+    global _calendar_generation, _calendar_ready
+    now = _now_ts()
+    changed = 0
+    upserts: dict[str, dict] = {}
+    with _calendar_lock:
+        # uid -> (type, region, item, identity) of the item that is that entry now
+        claimed: dict[str, tuple] = {}
+        pending: list[tuple] = []
+        seen: set[str] = set()
+        for kind, region, it in _calendar_items(sections, region_banners):
+            if not (it.get("_start") or it.get("_end")):
+                continue
+            ident = f"{kind}|{region or ''}|{_item_key(it)}"
+            if ident in seen:
+                continue
+            seen.add(ident)
+            uid = _calendar_idents.get(ident)
+            if uid is not None and uid not in claimed:
+                claimed[uid] = (kind, region, it, ident)
+            else:
+                pending.append((kind, region, it, ident))
+        unclaimed = [(uid, e) for uid, e in _calendar_entries.items() if uid not in claimed]
+        matches = _calendar_match(pending, unclaimed)
+        for i, row in enumerate(pending):
+            uid = matches.get(i) or hashlib.sha1(row[3].encode("utf-8")).hexdigest()[:24] + "@umamusume-tracker"
+            claimed.setdefault(uid, row)
+
+        for uid, (kind, region, it, ident) in claimed.items():
+            fields = _calendar_fields(it)
+            prev = _calendar_entries.get(uid)
+            _calendar_idents[ident] = uid
+            if prev is not None and prev["fields"] == fields and prev["region"] == region:
+                if ident not in prev["idents"]:
+                    prev["idents"].append(ident)
+                    upserts[uid] = prev
+                continue
+            entry = {
+                "type": kind,
+                "region": region,
+                "fields": fields,
+                "sequence": prev["sequence"] + 1 if prev else 0,
+                "first_seen": prev["first_seen"] if prev else now,
+                "modified": now,
+                "idents": (prev["idents"] if prev else []) + ([] if prev and ident in prev["idents"] else [ident]),
+            }
+            entry["vevent"] = _calendar_vevent(uid, entry)
+            _calendar_entries[uid] = entry
+            upserts[uid] = entry
+            changed += 1
+
+        # Events that dropped out stay while they are running or recently ended;
+        # upcoming ones that vanished were estimates that got replaced.
+        deletes = []
+        for uid in [u for u in _calendar_entries if u not in claimed]:
+            entry = _calendar_entries[uid]
+            start, end = entry["fields"][3] or entry["first_seen"], entry["fields"][4]
+            if start <= now and (end or start) > now - CALENDAR_KEEP_DAYS * 86400:
+                continue
+            del _calendar_entries[uid]
+            for ident in entry["idents"]:
+                if _calendar_idents.get(ident) == uid:
+                    del _calendar_idents[ident]
+            deletes.append(uid)
+            changed += 1
+
+        if changed:
+            _calendar_generation += 1
+        _calendar_ready = True
+        rows = [(uid, json.dumps({k: v for k, v in e.items() if k != "vevent"})) for uid, e in upserts.items()]
+    _persist_calendar(rows, deletes)
+    return changed
+
+
+def _calendar_region(region: str) -> str:
+    """Resolve a ?region= value for the calendar ("en" for Global).
+
+    Regions of the calendar's entries count as known, so a calendar restored
+    from the state database serves its regions before the first refresh has
+    loaded region banners; 503 for others until it has, 404 after.
+    """
+    region = GACHA_REGION_ALIASES.get(region.strip().lower(), region.strip().lower())
+    if region in ("", "en"):
+        return "en"
+    with _calendar_lock:
+        known = {e["region"] for e in _calendar_entries.values() if e["region"]}
+    available = events_cache.get("region_banners") or {}
+    if region in known or region in available:
+        return region
+    if not available:
+        raise HTTPException(status_code=503, detail="Region banners not loaded yet", headers={"Retry-After": "30"})
+    raise HTTPException(status_code=404, detail=f"Unknown region {region!r}; available: {sorted(known | set(available))}")
+
+
+def _calendar_body(region: str, types: tuple[str, ...]) -> tuple[bytes, str]:
+    """The .ics feed for a region ("en" is Global) and event types, with its ETag."""
+    key = (region, types)
+    with _calendar_lock:
+        cached = _calendar_bodies.get(key)
+        if cached is not None and cached[0] == _calendar_generation:
+            _CACHE_LOOKUPS.labels("calendar", "hit").inc()
+            return cached[1], cached[2]
+        _CACHE_LOOKUPS.labels("calendar", "miss").inc()
+        generation = _calendar_generation
+        entries = sorted(
+            (e for e in _calendar_entries.values()
+             if e["type"] in types and e["region"] in (None, region)),
+            key=lambda e: (e["fields"][3] or e["first_seen"], e["vevent"]),
+        )
+        name = "Umamusume" + ("" if region == "en" else f" ({region.upper()})")
+        if types != CALENDAR_TYPES:
+            name += " " + " & ".join(f"{t}s" for t in types)
+        header = "".join(_ics_line(line) for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{_CALENDAR_PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{_ics_escape(name)}",
+            f"REFRESH-INTERVAL;VALUE=DURATION:{CALENDAR_REFRESH_INTERVAL}",
+            f"X-PUBLISHED-TTL:{CALENDAR_REFRESH_INTERVAL}",
+        ))
+        body = (header + "".join(e["vevent"] for e in entries) + "END:VCALENDAR\r\n").encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        _calendar_bodies[key] = (generation, body, etag)
+    return body, etag
+
+
+# Local state database (stdlib sqlite3). One connection, used under _db_lock.
+# Empty UMA_STATE_DB disables everything stored in it (webhooks).
+STATE_DB = os.environ.get("UMA_STATE_DB", "tracker-state.sqlite3")
+_db_lock = Lock()
+_db_conn: sqlite3.Connection | None = None
+
+_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    version INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    kind TEXT NOT NULL,
+    section TEXT NOT NULL,
+    key TEXT NOT NULL,
+    item TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_created_at ON outbox(created_at);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    uid TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT,
+    image_url TEXT,
+    banner_id INTEGER,
+    pickups TEXT,
+    start_ts INTEGER,
+    end_ts INTEGER,
+    sort_ts INTEGER NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_sort ON history(sort_ts DESC, id DESC);
+CREATE INDEX IF NOT EXISTS history_kind_sort ON history(kind, sort_ts DESC, id DESC);
+CREATE INDEX IF NOT EXISTS history_end ON history(end_ts);
+CREATE TABLE IF NOT EXISTS history_characters (
+    name TEXT NOT NULL,
+    history_id INTEGER NOT NULL,
+    PRIMARY KEY (name, history_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS history_characters_item ON history_characters(history_id);
+CREATE TABLE IF NOT EXISTS webhooks (
+    id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    secret TEXT NOT NULL DEFAULT '',
+    sections TEXT,
+    kinds TEXT,
+    created_at REAL NOT NULL,
+    cursor INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    delivered_at REAL
+);
+CREATE TABLE IF NOT EXISTS calendar (
+    uid TEXT PRIMARY KEY,
+    entry TEXT NOT NULL
+);
+"""
+
+
+def _db() -> sqlite3.Connection:
+    """The state database connection (call with _db_lock held)."""
+    global _db_conn
+    if _db_conn is None:
+        conn = sqlite3.connect(STATE_DB, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_DB_SCHEMA)
+        _db_conn = conn
+    return _db_conn
+
+
+def _restore_snapshot_version() -> None:
+    """Continue above the last version published with this state database (at startup)."""
+    global _snapshot_version
+    if not STATE_DB:
+        return
+    with _db_lock:
+        row = _db().execute("SELECT value FROM state WHERE key = 'snapshot_version'").fetchone()
+    if row is None:
+        return
+    with _snapshot_lock:
+        # Only before the first publish; the ring then holds just the empty start snapshot.
+        if len(_snapshots) == 1 and _snapshots[0]["published_at"] is None and int(row[0]) >= _snapshot_version:
+            _snapshot_version = int(row[0]) + 1
+            _snapshots[0]["version"] = _snapshot_version
+            events_cache["version"] = _snapshot_version
+
+
+def _persist_snapshot_version(version: int) -> None:
+    if not STATE_DB or (_http_archive is not None and _http_archive.mode == "replay"):
+        return
+    with _db_lock:
+        conn = _db()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO state(key, value) VALUES ('snapshot_version', ?)", (str(version),))
+
+
+def _persist_calendar(rows: list[tuple[str, str]], deletes: list[str]) -> None:
+    if not STATE_DB or (_http_archive is not None and _http_archive.mode == "replay") or not (rows or deletes):
+        return
+    with _db_lock:
+        conn = _db()
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO calendar(uid, entry) VALUES (?, ?)", rows)
+            conn.executemany("DELETE FROM calendar WHERE uid = ?", [(uid,) for uid in deletes])
+
+
+def _restore_calendar() -> None:
+    """Load the calendar kept in the state database (at startup), so UIDs and SEQUENCEs carry over."""
+    global _calendar_generation, _calendar_ready
+    if not STATE_DB:
+        return
+    with _db_lock:
+        rows = _db().execute("SELECT uid, entry FROM calendar").fetchall()
+    if not rows:
+        return
+    with _calendar_lock:
+        if _calendar_ready:
+            return
+        for uid, raw in rows:
+            entry = json.loads(raw)
+            entry["fields"] = tuple(entry["fields"])
+            entry["vevent"] = _calendar_vevent(uid, entry)
+            _calendar_entries[uid] = entry
+            for ident in entry["idents"]:
+                _calendar_idents[ident] = uid
+        _calendar_generation += 1
+        _calendar_ready = True
+
+
+# History archive: every banner/event any source has reported, one row per
+# thing (gacha banners by ID, GameTora events by page, estimates by title).
+# Ingestion compares a content hash per row (kept in memory) and only writes
+# rows that changed, plus a last_seen touch at most every few hours.
+HISTORY_SEEN_RESOLUTION_SECONDS = 6 * 3600
+HISTORY_PAGE_MAX = 500
+_history_hashes: dict[str, tuple[str, float]] | None = None
+
+
+def _character_names(pickups: list[str]) -> set[str]:
+    """Normalized names for the character index: "[Epithet] Name" also indexes "name"."""
+    names = set()
+    for pickup in pickups or []:
+        full = re.sub(r"\s+", " ", pickup).strip().lower()
+        if full:
+            names.add(full)
+        bare = re.sub(r"\s+", " ", re.sub(r"\[[^\]]*\]|\([^)]*\)", " ", pickup)).strip().lower()
+        if bare:
+            names.add(bare)
+    return names
+
+
+def _history_record(source: str, item: dict) -> dict | None:
+    title = (item.get("title") or "").strip()
+    kind = item.get("_kind") or "unknown"
+    if not title:
+        return None
+    if item.get("_banner_id"):
+        uid = f"{source}:gacha:{item['_banner_id']}"
+    elif source == "gametora" and item.get("url"):
+        uid = f"{source}:{kind}:{item['url']}"
+    else:
+        uid = f"{source}:{kind}:{re.sub(r'[^a-z0-9]+', ' ', title.lower()).strip() or title.lower()}"
+    rec = {
+        "uid": uid,
+        "source": source,
+        "kind": kind,
+        "title": title,
+        "url": item.get("url") or "",
+        "image_url": item.get("imageUrl") or "",
+        "banner_id": item.get("_banner_id"),
+        "pickups": list(item.get("_pickups") or []),
+        "start_ts": item.get("_start"),
+        "end_ts": item.get("_end"),
+    }
+    rec["content_hash"] = hashlib.sha1(json.dumps(rec, sort_keys=True).encode("utf-8")).hexdigest()
+    return rec
+
+
+def _history_ingest(source: str, result: dict) -> int:
+    """Upsert the items of one source's refresh result; returns the number of rows written."""
+    global _history_hashes
+    if not STATE_DB or (_http_archive is not None and _http_archive.mode == "replay"):
+        return 0
+    records: dict[str, dict] = {}
+    for items in result.values():
+        # Per-region banner dicts stay out of the archive, which is Global only.
+        if not isinstance(items, list):
+            continue
+        for item in items:
+            rec = _history_record(source, item)
+            if rec is not None:
+                records[rec["uid"]] = rec
+
+    now = time.time()
+    with _db_lock:
+        conn = _db()
+        if _history_hashes is None:
+            _history_hashes = {uid: (h, seen) for uid, h, seen in conn.execute("SELECT uid, content_hash, last_seen FROM history")}
+        changed = [r for uid, r in records.items() if _history_hashes.get(uid, ("",))[0] != r["content_hash"]]
+        touched = [
+            uid for uid, r in records.items()
+            if uid in _history_hashes and _history_hashes[uid][0] == r["content_hash"]
+            and now - _history_hashes[uid][1] > HISTORY_SEEN_RESOLUTION_SECONDS
+        ]
+        with conn:
+            for r in changed:
+                conn.execute(
+                    "INSERT INTO history(uid, source, kind, title, url, image_url, banner_id, pickups, start_ts, end_ts, "
+                    "sort_ts, first_seen, last_seen, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(uid) DO UPDATE SET kind = excluded.kind, title = excluded.title, url = excluded.url, "
+                    "image_url = excluded.image_url, banner_id = excluded.banner_id, pickups = excluded.pickups, "
+                    "start_ts = excluded.start_ts, end_ts = excluded.end_ts, "
+                    "sort_ts = COALESCE(excluded.start_ts, CAST(history.first_seen AS INTEGER)), "
+                    "last_seen = excluded.last_seen, content_hash = excluded.content_hash",
+                    (
+                        r["uid"], r["source"], r["kind"], r["title"], r["url"], r["image_url"], r["banner_id"],
+                        json.dumps(r["pickups"], ensure_ascii=False) if r["pickups"] else None,
+                        r["start_ts"], r["end_ts"], r["start_ts"] or int(now), now, now, r["content_hash"],
+                    ),
+                )
+                history_id = conn.execute("SELECT id FROM history WHERE uid = ?", (r["uid"],)).fetchone()[0]
+                conn.execute("DELETE FROM history_characters WHERE history_id = ?", (history_id,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO history_characters(name, history_id) VALUES (?, ?)",
+                    [(name, history_id) for name in _character_names(r["pickups"])],
+                )
+            conn.executemany("UPDATE history SET last_seen = ? WHERE uid = ?", [(now, uid) for uid in touched])
+        for r in changed:
+            _history_hashes[r["uid"]] = (r["content_hash"], now)
+        for uid in touched:
+            _history_hashes[uid] = (_history_hashes[uid][0], now)
+    return len(changed)
+
+
+def _history_item(row: tuple) -> dict:
+    (hid, source, kind, title, url, image_url, banner_id, pickups, start_ts, end_ts, sort_ts, first_seen, last_seen) = row
+    return {
+        "id": hid,
+        "source": source,
+        "kind": kind,
+        "title": title,
+        "url": url,
+        "imageUrl": image_url,
+        "bannerId": banner_id,
+        "pickups": json.loads(pickups) if pickups else [],
+        "start": start_ts,
+        "end": end_ts,
+        "firstSeen": int(first_seen),
+        "lastSeen": int(last_seen),
+    }
+
+
+def _parse_history_time(value: str) -> int | None:
+    """Unix seconds or an ISO date/datetime (UTC when no offset is given)."""
+    if not value:
+        return None
+    if value.lstrip("-").isdigit():
+        return int(value)
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+# Webhook outbox. Each publish is diffed against the last published sections
+# (persisted, so a restart doesn't re-announce everything) and the changes are
+# appended to the outbox in the same transaction. A dispatcher thread hands
+# each webhook's next batch (records after its cursor) to a small pool; a
+# failing or slow subscriber only delays itself, retrying with backoff.
+WEBHOOK_WORKERS = max(1, int(os.environ.get("UMA_WEBHOOK_WORKERS", "4") or 4))
+WEBHOOK_BATCH = 50
+WEBHOOK_TIMEOUT_SECONDS = 10
+WEBHOOK_BACKOFF_SECONDS = 5.0
+WEBHOOK_BACKOFF_MAX_SECONDS = 3600.0
+OUTBOX_RETENTION_DAYS = 14
+WEBHOOK_KINDS = ("added", "removed", "changed")
+
+_webhook_wakeup = threading.Event()
+_webhook_inflight: set[str] = set()
+_webhook_dispatcher: threading.Thread | None = None
+
+
+def _outbox_record_changes(version: int, new_data: dict) -> int:
+    """Append the changes since the last published sections to the outbox."""
+    if not STATE_DB or (_http_archive is not None and _http_archive.mode == "replay"):
+        return 0
+    now = time.time()
+    records = []
+    with _db_lock:
+        conn = _db()
+        with conn:
+            row = conn.execute("SELECT value FROM state WHERE key = 'published_sections'").fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO state(key, value) VALUES ('published_sections', ?)",
+                (json.dumps({k: new_data[k] for k in SNAPSHOT_SECTIONS}),),
+            )
+            if row is None:
+                # First publish with this database: it becomes the baseline.
+                return 0
+            previous = json.loads(row[0])
+            for section in SNAPSHOT_SECTIONS:
+                old = previous.get(section, [])
+                diff = _section_changes(old, new_data[section])
+                if diff is None:
                     continue
-                upcoming_banners.append(b)
-                seen.add(key)
-                if len(upcoming_banners) >= 5:
+                old_by_key = {_item_key(it): it for it in old}
+                for kind in ("added", "changed"):
+                    for it in diff[kind]:
+                        records.append((version, now, kind, section, it["key"], json.dumps(it, ensure_ascii=False)))
+                for key in diff["removed"]:
+                    item = {**old_by_key[key], "key": key}
+                    records.append((version, now, "removed", section, key, json.dumps(item, ensure_ascii=False)))
+            conn.executemany(
+                "INSERT INTO outbox(version, created_at, kind, section, key, item) VALUES (?, ?, ?, ?, ?, ?)", records
+            )
+    if records:
+        logger.info(f"Outbox: {len(records)} change records for version {version}")
+        _webhook_wakeup.set()
+    return len(records)
+
+
+def _webhook_row(row: sqlite3.Row | tuple) -> dict:
+    keys = ("id", "url", "secret", "sections", "kinds", "created_at", "cursor", "attempts", "next_attempt_at", "last_error", "delivered_at")
+    hook = dict(zip(keys, row))
+    hook["sections"] = json.loads(hook["sections"]) if hook["sections"] else None
+    hook["kinds"] = json.loads(hook["kinds"]) if hook["kinds"] else None
+    return hook
+
+
+def _deliver_webhook(hook: dict) -> None:
+    """POST the webhook's next batch of matching records and move its cursor."""
+    import requests
+
+    if _http_archive is not None and _http_archive.mode == "replay":
+        # Replays never touch the network, and must not use up real deliveries.
+        return
+    try:
+        with _db_lock:
+            rows = _db().execute(
+                "SELECT seq, version, created_at, kind, section, key, item FROM outbox WHERE seq > ? ORDER BY seq LIMIT ?",
+                (hook["cursor"], WEBHOOK_BATCH * 4),
+            ).fetchall()
+        if not rows:
+            return
+        records = []
+        cursor = hook["cursor"]
+        for seq, version, created_at, kind, section, key, item in rows:
+            if (hook["sections"] is None or section in hook["sections"]) and (hook["kinds"] is None or kind in hook["kinds"]):
+                if len(records) >= WEBHOOK_BATCH:
                     break
-
-        new_data["upcoming_banners"] = upcoming_banners
-        
-        # Helper to parse sections
-        def parse_section(header_text, target_list):
-            header = soup.find(lambda tag: tag.name == "h2" and header_text in tag.text)
-            if not header:
-                logger.warning(f"Header '{header_text}' not found.")
-                return
-
-            # Iterate through siblings until the next header
-            current_element = header.find_next_sibling()
-            while current_element and current_element.name != "h2":
-                if current_element.name == "a":
-                    # Found a link, likely an image link
-                    link = current_element.get('href')
-                    if not link.startswith('http'):
-                        link = f"https://gametora.com{link}"
-                    
-                    img = current_element.find('img')
-                    image_url = ""
-                    if img:
-                        image_url = img.get('src')
-                        if not image_url.startswith('http'):
-                            image_url = f"https://gametora.com{image_url}"
-                    
-                    # The text usually follows the link or is inside a div nearby
-                    # In the fetch output we saw "Ends 29 Dec 2025..."
-                    # Let's look at the text content of the container or next sibling text node
-                    
-                    # GameTora structure is often: <a><img></a> TextNode <br>
-                    end_time_text = ""
-                    next_node = current_element.next_sibling
-                    if next_node and isinstance(next_node, str):
-                        end_time_text = next_node.strip()
-                    
-                    target_list.append({
-                        "title": "Current Banner" if "Banner" in header_text else "Current Event", # Placeholder title
-                        "image": image_url,
-                        "link": link,
-                        "time": end_time_text
-                    })
-                
-                current_element = current_element.find_next_sibling()
-
-        # NOTE: banners are now sourced from /umamusume/gacha __NEXT_DATA__ (EN region).
-
-        # Parse Events
-        # Try finding header first
-        event_header = soup.find(lambda tag: tag.name == "h2" and "Current Mission Events" in tag.text)
-        if event_header:
-            container = event_header.find_next_sibling('div')
-            if container:
-                for item_div in container.find_all('div', recursive=False):
-                    link_tag = item_div.find('a')
-                    if not link_tag:
+                records.append({
+                    "seq": seq, "version": version, "created_at": created_at,
+                    "kind": kind, "section": section, "key": key, "item": json.loads(item),
+                })
+            cursor = seq
+
+        error = None
+        if records:
+            body = json.dumps({"webhook_id": hook["id"], "records": records}, ensure_ascii=False).encode("utf-8")
+            headers = {"Content-Type": "application/json", "User-Agent": "umamusume-tracker"}
+            if hook["secret"]:
+                digest = hmac.new(hook["secret"].encode("utf-8"), body, hashlib.sha256).hexdigest()
+                headers["X-Uma-Signature"] = f"sha256={digest}"
+            try:
+                resp = requests.post(hook["url"], data=body, headers=headers, timeout=WEBHOOK_TIMEOUT_SECONDS)
+                if resp.status_code >= 300:
+                    error = f"HTTP {resp.status_code}"
+            except Exception as e:
+                error = str(e)
+            _WEBHOOK_DELIVERIES.labels("failure" if error else "success").inc()
+
+        with _db_lock:
+            conn = _db()
+            with conn:
+                if error is None:
+                    conn.execute(
+                        "UPDATE webhooks SET cursor = ?, attempts = 0, next_attempt_at = 0, last_error = NULL, "
+                        "delivered_at = COALESCE(?, delivered_at) WHERE id = ?",
+                        (cursor, time.time() if records else None, hook["id"]),
+                    )
+                else:
+                    attempts = hook["attempts"] + 1
+                    delay = min(WEBHOOK_BACKOFF_SECONDS * (2 ** (attempts - 1)), WEBHOOK_BACKOFF_MAX_SECONDS)
+                    conn.execute(
+                        "UPDATE webhooks SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                        (attempts, time.time() + delay, error, hook["id"]),
+                    )
+                    logger.warning(f"Webhook {hook['id']} delivery failed ({error}), retry {attempts} in {delay:.0f}s")
+    except Exception as e:
+        logger.error(f"Webhook {hook['id']} delivery error: {e}")
+    finally:
+        with _db_lock:
+            _webhook_inflight.discard(hook["id"])
+        _webhook_wakeup.set()
+
+
+def _prune_outbox() -> None:
+    """Drop records every webhook has received, and anything past the retention period."""
+    with _db_lock:
+        conn = _db()
+        with conn:
+            conn.execute(
+                "DELETE FROM outbox WHERE seq <= COALESCE((SELECT MIN(cursor) FROM webhooks), (SELECT MAX(seq) FROM outbox)) "
+                "OR created_at < ?",
+                (time.time() - OUTBOX_RETENTION_DAYS * 86400,),
+            )
+
+
+def _webhook_dispatch_loop() -> None:
+    pool = ThreadPoolExecutor(max_workers=WEBHOOK_WORKERS, thread_name_prefix="webhook")
+    next_prune = 0.0
+    wait = 0.0
+    while True:
+        _webhook_wakeup.wait(timeout=wait)
+        _webhook_wakeup.clear()
+        wait = 60.0
+        try:
+            now = time.time()
+            with _db_lock:
+                conn = _db()
+                max_seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM outbox").fetchone()[0]
+                hooks = [_webhook_row(r) for r in conn.execute("SELECT * FROM webhooks WHERE cursor < ?", (max_seq,))]
+                due = []
+                for hook in hooks:
+                    if hook["id"] in _webhook_inflight:
+                        continue
+                    if hook["next_attempt_at"] > now:
+                        wait = min(wait, hook["next_attempt_at"] - now)
                         continue
+                    _webhook_inflight.add(hook["id"])
+                    due.append(hook)
+            for hook in due:
+                pool.submit(_deliver_webhook, hook)
+            if now >= next_prune:
+                _prune_outbox()
+                next_prune = now + 600
+        except Exception as e:
+            logger.error(f"Webhook dispatcher error: {e}")
 
-                    link = link_tag.get('href')
-                    if not link.startswith('http'):
-                        link = f"https://gametora.com{link}"
-                    
-                    # Title is often in the link text or a sibling span/div
-                    title = link_tag.get_text(strip=True)
-                    
-                    img = link_tag.find('img')
-                    image_url = ""
-                    if img:
-                        image_url = img.get('src')
-                        if not image_url.startswith('http'):
-                            image_url = f"https://gametora.com{image_url}"
-                            
-                    # Date
-                    text_div = item_div.find('div', class_=lambda x: x and 'text' in x)
-                    time_text = ""
-                    if text_div:
-                        time_text = text_div.get_text(strip=True)
-                    
-                    if not title and time_text:
-                        title = "Mission Event"
-
-                    new_data["events"].append({
-                        "title": title,
-                        "imageUrl": image_url,
-                        "url": link,
-                        "subtitle": time_text
-                    })
-        else:
-            # Fallback: Look for links with /missions in href that are not in the nav
-            # This is a bit risky but better than nothing if header is missing
-            pass
 
-        global events_cache
-        events_cache["banners"] = new_data["banners"]
-        events_cache["events"] = new_data["events"]
-        events_cache["upcoming_banners"] = new_data.get("upcoming_banners", [])
-        events_cache["upcoming_events"] = new_data.get("upcoming_events", [])
-        events_cache["last_updated"] = datetime.now().isoformat()
-        logger.info(
-            f"Updated cache: {len(new_data['banners'])} banners, {len(new_data['events'])} current events, "
-            f"{len(new_data.get('upcoming_banners', []))} upcoming banners, {len(new_data.get('upcoming_events', []))} upcoming events"
+def _start_webhook_dispatcher() -> None:
+    global _webhook_dispatcher
+    if not STATE_DB or _webhook_dispatcher is not None:
+        return
+    if _http_archive is not None and _http_archive.mode == "replay":
+        return
+    _webhook_dispatcher = threading.Thread(target=_webhook_dispatch_loop, name="webhook-dispatcher", daemon=True)
+    _webhook_dispatcher.start()
+
+
+# Sources a refresh can target. Each keeps its last pre-merge results, so a
+# refresh of some sources is merged with the others' latest data.
+REFRESH_SOURCES = ("gametora", "game8", "uma.moe")
+_source_results: dict[str, dict] = {}
+
+
+def fetch_gametora_data(trace_id: str | None = None, sources=REFRESH_SOURCES, job: dict | None = None) -> bool:
+    """Refreshes the cache from GameTora, Game8 and uma.moe (or only `sources`).
+
+    The refresh runs as a sequence of stages. Each stage downloads its documents,
+    reduces them to plain item dicts and drops the parsed trees before the next
+    stage starts, so at most one large document is alive at a time.
+
+    Every refresh is traced; `trace_id` names the trace (random when omitted).
+    `job` is the refresh job to report progress and per-source status on.
+    Returns whether the cache was updated.
+    """
+    with _trace(trace_id):
+        return _run_profiled("refresh", _refresh_cache, tuple(sources), job)
+
+
+@contextmanager
+def _refresh_stage(job: dict | None, name: str, **attrs):
+    if job is not None:
+        with _refresh_lock:
+            job["progress"]["stage"] = name
+    with _span(name, **attrs) as span:
+        yield span
+    _refresh_sample(name)
+
+
+def _refresh_gametora(job: dict | None) -> dict:
+    # Home page -> current mission events.
+    with _refresh_stage(job, "gametora:home", source="gametora"):
+        mission_events = fetch_gametora_mission_events()
+
+    # Gacha __NEXT_DATA__ -> current banners of every region (EN is Global).
+    try:
+        with _refresh_stage(job, "gametora:gacha", source="gametora"):
+            region_banners = fetch_gametora_banners()
+    except Exception as e:
+        logger.warning(f"Failed to build banners from gacha data: {e}")
+        region_banners = {}
+    banners = region_banners.get("en", [])
+
+    # Current + upcoming story events (best-effort); past ones only go to the history archive.
+    seen_events: list[dict] = []
+    with _refresh_stage(job, "gametora:story_events", source="gametora"):
+        current_events, upcoming_events = fetch_story_events(limit=UPCOMING_ITEMS, seen=seen_events)
+
+    return {
+        "missions": mission_events,
+        "banners": banners,
+        "current_events": current_events,
+        "upcoming_events": upcoming_events,
+        "_seen_events": seen_events,
+        "_region_banners": region_banners,
+    }
+
+
+def _refresh_game8(job: dict | None) -> dict:
+    # GameTora doesn't expose future banners in __NEXT_DATA__; Game8 is the
+    # best-effort source for upcoming banners.
+    with _refresh_stage(job, "game8:banners", source="game8"):
+        return {"upcoming_banners": fetch_game8_upcoming_banners(limit=UPCOMING_ITEMS)}
+
+
+def _refresh_uma_moe(job: dict | None) -> dict:
+    # uma.moe's timeline fills gaps with estimated global dates.
+    with _refresh_stage(job, "uma.moe:timeline", source="uma.moe"):
+        champions_meetings: list[dict] = []
+        uma_banners, uma_events = fetch_uma_moe_upcoming(
+            limit_banners=max(10, UPCOMING_ITEMS), limit_events=max(10, UPCOMING_ITEMS),
+            champions_meetings=champions_meetings,
         )
-        
+    # A chunk without Champions Meetings keeps the previous schedule.
+    if champions_meetings:
+        _update_champions_meetings(champions_meetings)
+    return {"banners": uma_banners, "events": uma_events}
+
+
+_SOURCE_REFRESHERS = {
+    "gametora": _refresh_gametora,
+    "game8": _refresh_game8,
+    "uma.moe": _refresh_uma_moe,
+}
+
+
+def _refresh_source(job: dict | None, source: str) -> dict | None:
+    """Run one source's stages, recording its status on the job. None if it failed."""
+    status = job["source_status"][source] if job is not None else {}
+    with _refresh_lock:
+        status.update(status="running", started_at=time.time())
+    t0 = time.perf_counter()
+    errors: list[str] = []
+    token = _upstream_errors.set(errors)
+    try:
+        result = _SOURCE_REFRESHERS[source](job)
     except Exception as e:
-        logger.error(f"Error fetching data: {e}")
+        logger.error(f"Error fetching data from {source}: {e}")
+        result = None
+        errors.append(str(e))
+    finally:
+        _upstream_errors.reset(token)
 
-def _run_refresh_in_background() -> None:
-    global _refresh_in_progress
+    items = sum(len(v) for k, v in result.items() if not k.startswith("_")) if result is not None else 0
+    # Nothing produced and upstream errors: an outage, not an empty schedule.
+    # Keep the source's previous results rather than publishing nothing.
+    failed = result is None or (not items and errors)
+    if not failed:
+        try:
+            status["history_changes"] = _history_ingest(source, result)
+        except Exception as e:
+            logger.error(f"Failed to update the history archive for {source}: {e}")
     with _refresh_lock:
-        if _refresh_in_progress:
-            return
-        _refresh_in_progress = True
+        status.update(
+            status="failed" if failed else "ok",
+            duration_s=round(time.perf_counter() - t0, 3),
+            items=items,
+            upstream_errors=len(errors),
+        )
+        if errors:
+            status["error"] = errors[0]
+        if job is not None:
+            job["progress"]["sources_done"] += 1
+    return None if failed else result
+
+
+def _refresh_cache(sources: tuple[str, ...] = REFRESH_SOURCES, job: dict | None = None) -> bool:
+    global _refresh_memory, _last_refresh_memory, _last_refresh_success_ts
+    mem = _RefreshMemory(REFRESH_RSS_BUDGET_MB, trace=REFRESH_TRACEMALLOC)
+    mem.start()
+    _refresh_memory = mem
+    refresh_t0 = time.perf_counter()
+    ok = False
 
     try:
-        fetch_gametora_data()
+        fetched = 0
+        for source in REFRESH_SOURCES:
+            if source not in sources:
+                continue
+            result = _refresh_source(job, source)
+            if result is not None:
+                _source_results[source] = result
+                fetched += 1
+        if not fetched:
+            return False
+
+        gametora = _source_results.get("gametora", {})
+        game8 = _source_results.get("game8", {})
+        uma = _source_results.get("uma.moe", {})
+
+        # Merge sources into deduplicated entities (titles differ across sites,
+        # e.g. "Champions Meeting: Taurus Cup" vs "Taurus Cup").
+        with _refresh_stage(job, "merge"):
+            upcoming_banners = _merge_sources(
+                [("game8", game8.get("upcoming_banners", [])), ("uma.moe", uma.get("banners", []))],
+                limit=UPCOMING_ITEMS,
+            )
+            upcoming_events = _merge_sources(
+                [("gametora", gametora.get("upcoming_events", [])), ("uma.moe", uma.get("events", []))],
+                limit=UPCOMING_ITEMS,
+                sort=True,
+            )
+            current = _merge_sources(
+                [("gametora", gametora.get("current_events", [])), ("gametora:missions", gametora.get("missions", []))]
+            )
+            banners = _merge_sources([("gametora", gametora.get("banners", []))])
+            merged_region_banners = {
+                region: _merge_sources([("gametora", items)])
+                for region, items in gametora.get("_region_banners", {}).items()
+            }
+
+        merged = {
+            "banners": banners,
+            "events": current,
+            "upcoming_banners": upcoming_banners,
+            "upcoming_events": upcoming_events,
+        }
+        new_data = {k: _public_items(v) for k, v in merged.items()}
+        region_banners = {region: _public_items(v) for region, v in merged_region_banners.items()}
+
+        _ITEMS_PRODUCED.clear()
+        for section, items in new_data.items():
+            for it in items:
+                for src in it.get("sources") or []:
+                    _ITEMS_PRODUCED.labels(src["source"], section).inc()
+
+        version = _publish_snapshot(new_data, region_banners)
+        try:
+            _persist_snapshot_version(version)
+            _outbox_record_changes(version, new_data)
+        except Exception as e:
+            logger.error(f"Failed to record version {version} in the state database: {e}")
+        try:
+            calendar_changed = _update_calendar(merged, merged_region_banners)
+            if calendar_changed:
+                logger.info(f"Calendar: {calendar_changed} event(s) changed, {len(_calendar_entries)} in total")
+        except Exception as e:
+            logger.error(f"Failed to update the calendar: {e}")
+        _queue_asset_prefetch(list(new_data.values()) + list(region_banners.values()))
+        logger.info(
+            f"Updated cache (version {version}): {len(new_data['banners'])} banners, {len(new_data['events'])} current events, "
+            f"{len(new_data['upcoming_banners'])} upcoming banners, {len(new_data['upcoming_events'])} upcoming events"
+        )
+        ok = True
+        _last_refresh_success_ts = time.time()
+        _REFRESH_LAST_SUCCESS.set(_last_refresh_success_ts)
+
+    except Exception as e:
+        logger.error(f"Error fetching data: {e}")
     finally:
+        _refresh_memory = None
+        _last_refresh_memory = mem.stop()
+        _REFRESH_SECONDS.observe(time.perf_counter() - refresh_t0)
+        _REFRESHES.labels("success" if ok else "failure").inc()
+        _REFRESH_PEAK_RSS.set(mem.peak_rss)
+        logger.info(
+            f"Refresh memory: peak RSS {_last_refresh_memory['peak_rss_mb']} MiB "
+            f"(start {_last_refresh_memory['start_rss_mb']} MiB, budget {_last_refresh_memory['budget_mb']}), "
+            f"deferred: {', '.join(_last_refresh_memory['deferred']) or 'none'}"
+        )
+    return ok
+
+
+# Refresh jobs. One worker thread runs them in order; at most one job waits
+# behind the running one, and further requests are folded into it (its
+# sources become the union), so a burst of POSTs costs at most one extra run.
+REFRESH_JOBS_KEEP = 50
+_refresh_jobs: OrderedDict[str, dict] = OrderedDict()
+_refresh_pending: dict | None = None
+_refresh_running: dict | None = None
+_refresh_wakeup = threading.Condition(_refresh_lock)
+_refresh_worker: threading.Thread | None = None
+
+
+def _new_refresh_job(sources: set[str]) -> dict:
+    job = {
+        "id": uuid.uuid4().hex[:16],
+        "status": "queued",
+        "sources": [s for s in REFRESH_SOURCES if s in sources],
+        "requested_at": time.time(),
+        "requests": 1,
+        "started_at": None,
+        "finished_at": None,
+        "duration_s": None,
+        "progress": {"stage": None, "sources_done": 0, "sources_total": 0},
+        "source_status": {},
+    }
+    _refresh_jobs[job["id"]] = job
+    while len(_refresh_jobs) > REFRESH_JOBS_KEEP:
+        oldest = next(iter(_refresh_jobs))
+        if _refresh_jobs[oldest]["status"] in ("queued", "running"):
+            break
+        del _refresh_jobs[oldest]
+    return job
+
+
+def _enqueue_refresh(sources=REFRESH_SOURCES) -> dict:
+    """Queue a refresh of `sources`, coalescing with the pending job if there is one.
+
+    Returns (a snapshot of) the job that will cover the request.
+    """
+    global _refresh_pending, _refresh_worker
+    with _refresh_lock:
+        if _refresh_pending is not None:
+            job = _refresh_pending
+            job["sources"] = [s for s in REFRESH_SOURCES if s in set(job["sources"]) | set(sources)]
+            job["requests"] += 1
+        else:
+            job = _refresh_pending = _new_refresh_job(set(sources))
+            _refresh_wakeup.notify()
+        if _refresh_worker is None:
+            _refresh_worker = threading.Thread(target=_refresh_worker_loop, name="refresh-worker", daemon=True)
+            _refresh_worker.start()
+        return json.loads(json.dumps(job))
+
+
+def _refresh_worker_loop() -> None:
+    global _refresh_pending, _refresh_running
+    while True:
         with _refresh_lock:
-            _refresh_in_progress = False
+            while _refresh_pending is None:
+                _refresh_wakeup.wait()
+            job = _refresh_running = _refresh_pending
+            _refresh_pending = None
+            job["status"] = "running"
+            job["started_at"] = time.time()
+            job["progress"]["sources_total"] = len(job["sources"])
+            job["source_status"] = {s: {"status": "pending"} for s in job["sources"]}
+        published = False
+        try:
+            published = fetch_gametora_data(trace_id=job["id"], sources=job["sources"], job=job)
+        except Exception as e:
+            logger.error(f"Refresh job {job['id']} failed: {e}")
+        finally:
+            with _refresh_lock:
+                all_ok = all(st["status"] == "ok" for st in job["source_status"].values())
+                job["status"] = "failed" if not published else ("done" if all_ok else "partial")
+                job["finished_at"] = time.time()
+                job["duration_s"] = round(job["finished_at"] - job["started_at"], 3)
+                job["progress"]["stage"] = None
+                _refresh_running = None
+
+
+# Startup report: how long the imports, the module body and the startup hook
+# took, and how old the process was when the first /api/events response was
+# built, checked against UMA_STARTUP_TARGET_SECONDS. Logged once and exported
+# as uma_startup_seconds{phase}.
+STARTUP_TARGET_SECONDS = float(os.environ.get("UMA_STARTUP_TARGET_SECONDS", "3") or 0)
+_startup_phases: dict[str, float] = {}
+
+
+def _process_age_seconds() -> float | None:
+    """Seconds since this process started, interpreter start-up included (Linux only)."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Field 22 (starttime, in clock ticks since boot); the command name may contain spaces.
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except Exception:
+        return None
+
+
+def _startup_mark(phase: str, seconds: float) -> None:
+    _startup_phases[phase] = round(seconds, 3)
+    _STARTUP_SECONDS.labels(phase).set(seconds)
+
+
+def _startup_first_response() -> None:
+    age = _process_age_seconds()
+    if age is None:
+        # Without /proc, count from the top of this module instead.
+        age = time.perf_counter() - _STARTUP_T0
+    _startup_mark("first_response", age)
+    p = _startup_phases
+    within = not STARTUP_TARGET_SECONDS or age <= STARTUP_TARGET_SECONDS
+    (logger.info if within else logger.warning)(
+        f"Startup: imports {p.get('imports', 0):.2f}s, module {p.get('module', 0):.2f}s, "
+        f"startup hook {p.get('startup_event', 0):.3f}s; first response {age:.2f}s after process start "
+        f"(target {STARTUP_TARGET_SECONDS:g}s: {'ok' if within else 'missed'})"
+    )
 
 
 @app.on_event("startup")
 def startup_event():
+    t0 = time.perf_counter()
+    try:
+        _restore_snapshot_version()
+    except Exception as e:
+        logger.warning(f"Failed to restore the snapshot version: {e}")
+    try:
+        _restore_calendar()
+    except Exception as e:
+        logger.warning(f"Failed to restore the calendar: {e}")
     # Do an initial refresh once after boot.
-    threading.Thread(target=_run_refresh_in_background, daemon=True).start()
+    _enqueue_refresh()
+    _start_webhook_dispatcher()
 
-    # Register service
-    register_service()
+    # Register service; it only touches a file, so don't hold up serving for it.
+    threading.Thread(target=register_service, name="register-service", daemon=True).start()
+    _startup_mark("startup_event", time.perf_counter() - t0)
 
 
 @app.post("/api/refresh")
-def refresh_now():
-    """Trigger a background refresh (used by systemd timer)."""
-    threading.Thread(target=_run_refresh_in_background, daemon=True).start()
+def refresh_now(sources: str = ""):
+    """Queue a background refresh (used by systemd timer).
+
+    `sources` (comma-separated, default all) limits it to some of gametora, game8 and uma.moe.
+    """
+    wanted = [s.strip() for s in sources.split(",") if s.strip()] or list(REFRESH_SOURCES)
+    unknown = [s for s in wanted if s not in REFRESH_SOURCES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown sources {unknown}; expected some of {list(REFRESH_SOURCES)}")
+    job = _enqueue_refresh(wanted)
+    with _refresh_lock:
+        in_progress = _refresh_running is not None
     return {
         "status": "scheduled",
-        "in_progress": _refresh_in_progress,
+        "refresh_id": job["id"],
+        "job": job,
+        "in_progress": in_progress,
         "last_updated": events_cache.get("last_updated"),
+        "last_refresh_memory": _last_refresh_memory,
+    }
+
+
+@app.get("/api/refresh/{refresh_id}")
+def get_refresh_job(refresh_id: str):
+    """Status of a refresh job: queued/running/done/partial/failed, progress and per-source status."""
+    with _refresh_lock:
+        job = _refresh_jobs.get(refresh_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Unknown refresh job or no longer kept")
+        return json.loads(json.dumps(job))
+
+
+def _require_admin(token: str | None) -> None:
+    if ADMIN_TOKEN and token != ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+class WebhookSubscription(BaseModel):
+    url: str
+    sections: list[str] | None = None
+    kinds: list[str] | None = None
+    secret: str = ""
+
+
+def _webhook_public(hook: dict, max_seq: int) -> dict:
+    out = {k: v for k, v in hook.items() if k != "secret"}
+    out["signed"] = bool(hook["secret"])
+    out["pending"] = max(0, max_seq - hook["cursor"])
+    return out
+
+
+@app.get("/api/history")
+def get_history(
+    kind: str = "",
+    source: str = "",
+    character: str = "",
+    q: str = "",
+    since: str = "",
+    until: str = "",
+    limit: int = 50,
+    cursor: str = "",
+):
+    """Archived banners/events, newest first, with keyset pagination.
+
+    `kind` and `source` take comma-separated values, `character` matches gacha
+    pickups by name, `q` is a title substring, and `since`/`until` (unix seconds
+    or ISO dates) keep items active in that range. Pass `next_cursor` back as
+    `cursor` for the next page.
+    """
+    if not STATE_DB:
+        raise HTTPException(status_code=503, detail="History needs UMA_STATE_DB")
+    try:
+        since_ts, until_ts = _parse_history_time(since), _parse_history_time(until)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="since/until must be unix seconds or ISO dates")
+    limit = max(1, min(int(limit), HISTORY_PAGE_MAX))
+
+    where, args = [], []
+    for column, value in (("kind", kind), ("source", source)):
+        values = [v.strip() for v in value.split(",") if v.strip()]
+        if values:
+            where.append(f"{column} IN ({', '.join('?' * len(values))})")
+            args += values
+    if character.strip():
+        where.append("id IN (SELECT history_id FROM history_characters WHERE name = ?)")
+        args.append(re.sub(r"\s+", " ", character).strip().lower())
+    if q.strip():
+        where.append("title LIKE ? ESCAPE '\\'")
+        args.append("%" + re.sub(r"([%_\\])", r"\\\1", q.strip()) + "%")
+    if until_ts is not None:
+        where.append("sort_ts <= ?")
+        args.append(until_ts)
+    if since_ts is not None:
+        where.append("COALESCE(end_ts, sort_ts) >= ?")
+        args.append(since_ts)
+    if cursor:
+        try:
+            cursor_ts, cursor_id = (int(x) for x in cursor.split(":", 1))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        where.append("(sort_ts < ? OR (sort_ts = ? AND id < ?))")
+        args += [cursor_ts, cursor_ts, cursor_id]
+
+    sql = (
+        "SELECT id, source, kind, title, url, image_url, banner_id, pickups, start_ts, end_ts, sort_ts, first_seen, last_seen "
+        f"FROM history {'WHERE ' + ' AND '.join(where) if where else ''} ORDER BY sort_ts DESC, id DESC LIMIT ?"
+    )
+    with _API_SECONDS.labels("/api/history").time():
+        with _db_lock:
+            rows = _db().execute(sql, args + [limit + 1]).fetchall()
+    next_cursor = f"{rows[limit - 1][10]}:{rows[limit - 1][0]}" if len(rows) > limit else None
+    return {"items": [_history_item(r) for r in rows[:limit]], "next_cursor": next_cursor}
+
+
+@app.get("/api/cards")
+def search_cards(
+    q: str = "",
+    kind: str = "",
+    rarity: int | None = None,
+    type: str = "",
+    region: str = "",
+    limit: int = 20,
+):
+    """Search the GameTora card catalogue by name.
+
+    `q` matches anywhere in a card's name in any region (one or two characters
+    match word prefixes). `kind` is character or support, `type` a support
+    type (speed, stamina, ...), and `region` keeps cards released there and
+    returns their names in that region.
+    """
+    index = _card_index
+    if index is None:
+        raise HTTPException(status_code=503, detail="Card index not built yet")
+    if kind and kind not in _CARD_CATALOGUES.values():
+        raise HTTPException(status_code=400, detail="kind must be character or support")
+    region = GACHA_REGION_ALIASES.get(region.lower(), region.lower())
+    if region and region not in index.regions:
+        raise HTTPException(status_code=404, detail=f"Unknown region {region!r}; available: {index.regions}")
+    limit = max(1, min(int(limit), CARD_SEARCH_MAX))
+
+    with _API_SECONDS.labels("/api/cards").time():
+        total, cards = index.search(q, kind, rarity, type, region, limit)
+        items = [c.public(region) for c in cards]
+    return {"total": total, "items": items, "index": index.stats()}
+
+
+@app.get("/api/banners/{banner_id}/simulate")
+def simulate_banner(
+    banner_id: int,
+    pulls: int = 200,
+    targets: str = "",
+    spark: int = 200,
+    trials: int = SIMULATE_DEFAULT_TRIALS,
+):
+    """Monte Carlo pull cost of getting `targets` from a character banner.
+
+    `banner_id` is the gacha ID (as in GameTora's banner images). `targets` are
+    pickup names, comma-separated and matched case-insensitively by prefix
+    (default: every pickup). `spark` is how many pulls can be exchanged for a
+    pickup (0 disables). Returns percentiles of the pulls needed and the
+    chance of finishing within `pulls`.
+    """
+    banner = (_uma_char_banner_image_cache.get("rates") or {}).get(banner_id)
+    if banner is None:
+        raise HTTPException(status_code=404, detail="Unknown banner or no pickup rates for it")
+    pickups = banner["pickups"]
+    chosen: list[tuple[str, float]] = []
+    for want in [t.strip() for t in targets.split(",") if t.strip()] or [name for name, _ in pickups]:
+        w = " ".join(want.lower().split())
+        matches = [p for p in pickups if p[0].lower() == w] or [p for p in pickups if p[0].lower().startswith(w)]
+        if len(matches) != 1:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Target {want!r} matches {len(matches)} pickups; pickups: {[name for name, _ in pickups]}",
+            )
+        if matches[0] not in chosen:
+            chosen.append(matches[0])
+    pulls = max(1, min(int(pulls), SIMULATE_MAX_PULLS))
+    spark = max(0, int(spark))
+    trials = max(1000, min(int(trials), SIMULATE_MAX_TRIALS))
+
+    key = (banner_id, tuple(chosen), pulls, spark, trials)
+    with _simulate_lock:
+        cached = _simulate_cache.get(key)
+        if cached is not None:
+            _simulate_cache.move_to_end(key)
+    if cached is not None:
+        _CACHE_LOOKUPS.labels("simulate", "hit").inc()
+        return {**cached, "cached": True}
+    _CACHE_LOOKUPS.labels("simulate", "miss").inc()
+
+    started = time.perf_counter()
+    seed = int.from_bytes(hashlib.blake2b(repr(key).encode(), digest_size=8).digest(), "big")
+    with _API_SECONDS.labels("/api/banners/{id}/simulate").time():
+        needed = _simulate(tuple(rate for _, rate in chosen), spark, trials, seed)
+
+    def pct(q: float) -> int:
+        return needed[max(0, min(trials - 1, math.ceil(q * trials) - 1))]
+
+    result = {
+        "banner": {
+            "id": banner_id,
+            "imageUrl": banner["imageUrl"],
+            "pickups": [{"name": name, "rate": rate} for name, rate in pickups],
+        },
+        "targets": [{"name": name, "rate": rate} for name, rate in chosen],
+        "pulls": pulls,
+        "spark": spark,
+        "trials": trials,
+        "success_rate": bisect.bisect_right(needed, pulls) / trials,
+        "pulls_needed": {
+            "mean": round(sum(needed) / trials, 1),
+            "p50": pct(0.5),
+            "p75": pct(0.75),
+            "p90": pct(0.9),
+            "p95": pct(0.95),
+            "p99": pct(0.99),
+            "max": needed[-1],
+        },
+        "took_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    with _simulate_lock:
+        _simulate_cache[key] = result
+        while len(_simulate_cache) > SIMULATE_CACHE_SIZE:
+            _simulate_cache.popitem(last=False)
+    return {**result, "cached": False}
+
+
+@app.get("/api/assets/{name}")
+def get_asset(name: str, w: int = 0):
+    """A cached image by content hash; `w` (160, 320 or 640) serves a downscaled copy."""
+    m = re.fullmatch(r"([0-9a-f]{64})(\.\w+)?", name)
+    if not m or not ASSET_CACHE_DIR:
+        raise HTTPException(status_code=404, detail="Unknown asset")
+    if w and w not in ASSET_WIDTHS:
+        raise HTTPException(status_code=400, detail=f"w must be one of {list(ASSET_WIDTHS)}")
+    digest = m.group(1)
+    with _asset_lock:
+        _asset_load_locked()
+        meta = _asset_files.get(digest)
+        if meta is not None:
+            meta["used"] = time.time()
+    if meta is None:
+        raise HTTPException(status_code=404, detail="Unknown asset")
+    path = _asset_path(digest, meta["ext"])
+    if w:
+        try:
+            path = _asset_variant(digest, meta, w) or path
+        except Exception as e:
+            logger.warning(f"Failed to downscale {digest} to {w}px: {e}")
+    media_type = next(t for t, ext in _ASSET_EXTENSIONS.items() if ext == meta["ext"])
+    return FileResponse(path, media_type=media_type, headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+
+@app.get("/api/champions-meetings")
+def get_champions_meetings(
+    track: str = "",
+    distance: str = "",
+    surface: str = "",
+    ground: str = "",
+    since: str = "",
+    until: str = "",
+    upcoming: bool = False,
+    limit: int = 50,
+):
+    """Champions Meetings with their course and Global dates, by Global start.
+
+    `distance` is a class (sprint, mile, medium, long), `surface` turf or dirt,
+    `ground` the going (good, firm, soft, heavy). `since`/`until` (unix seconds
+    or ISO dates) bound the Global start; `upcoming=true` keeps those starting
+    from now on. Dates are projected from JP unless `estimated` is false.
+    """
+    index = _champions_meetings
+    try:
+        since_ts, until_ts = _parse_history_time(since), _parse_history_time(until)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="since/until must be unix seconds or ISO dates")
+    if upcoming:
+        since_ts = max(since_ts or 0, _now_ts())
+    filters = {
+        facet: value.strip()
+        for facet, value in (("track", track), ("distance_class", distance), ("surface", surface), ("ground", ground))
+        if value.strip()
+    }
+    limit = max(1, min(int(limit), 500))
+    with _API_SECONDS.labels("/api/champions-meetings").time():
+        records = index.query(filters, since_ts, until_ts)
+    return {
+        "total": len(records),
+        "items": records[:limit],
+        "facets": {facet: index.values(facet) for facet in CM_FACETS},
+        "built_at": index.built_at,
     }
 
+
+@app.get("/api/calendar.ics")
+def get_calendar(region: str = "", type: str = "", if_none_match: str | None = Header(default=None)):
+    """Banners and events as an iCalendar feed to subscribe to.
+
+    `region` works as for /api/events (its current banners, Global everything
+    else), also knowing the regions of a calendar restored at startup; `type` is banner, event or both (default). Estimated dates are
+    marked TENTATIVE. The body only changes when an event does, so polling
+    clients revalidating with If-None-Match mostly get 304s. Until the
+    calendar was built (or restored) this is a 503, not an empty calendar
+    that would make subscribers drop every event.
+    """
+    if not _calendar_ready:
+        raise HTTPException(status_code=503, detail="Calendar not built yet", headers={"Retry-After": "60"})
+    region = _calendar_region(region)
+    wanted = _csv(type)
+    unknown = [t for t in wanted if t not in CALENDAR_TYPES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown types {unknown}; expected some of {list(CALENDAR_TYPES)}")
+    types = tuple(t for t in CALENDAR_TYPES if t in wanted) or CALENDAR_TYPES
+    with _API_SECONDS.labels("/api/calendar.ics").time():
+        body, etag = _calendar_body(region, types)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="text/calendar; charset=utf-8", headers=headers)
+
+
+@app.get("/api/history/stats")
+def get_history_stats(source: str = ""):
+    """Per kind: number of archived items and how long the dated ones ran (days).
+
+    `source` takes comma-separated values, as for /api/history.
+    """
+    if not STATE_DB:
+        raise HTTPException(status_code=503, detail="History needs UMA_STATE_DB")
+    sources = [v.strip() for v in source.split(",") if v.strip()]
+    source_filter = f" AND source IN ({', '.join('?' * len(sources))})" if sources else ""
+    args = sources
+    with _db_lock:
+        conn = _db()
+        counts = dict(conn.execute(f"SELECT kind, COUNT(*) FROM history WHERE 1{source_filter} GROUP BY kind", args))
+        durations: dict[str, list[float]] = {}
+        for kind, seconds in conn.execute(
+            f"SELECT kind, end_ts - start_ts FROM history WHERE start_ts IS NOT NULL AND end_ts > start_ts{source_filter}", args
+        ):
+            durations.setdefault(kind, []).append(seconds / 86400)
+    out = {}
+    for kind, count in sorted(counts.items()):
+        days = sorted(durations.get(kind, []))
+        out[kind] = {
+            "count": count,
+            "dated": len(days),
+            "avg_days": round(sum(days) / len(days), 2) if days else None,
+            "median_days": round(statistics.median(days), 2) if days else None,
+            "min_days": round(days[0], 2) if days else None,
+            "max_days": round(days[-1], 2) if days else None,
+        }
+    return {"kinds": out}
+
+
+@app.post("/api/webhooks")
+def create_webhook(sub: WebhookSubscription, x_admin_token: str | None = Header(default=None)):
+    """Register a webhook for change records (optionally only some sections/kinds).
+
+    Delivery starts with the changes published after registration.
+    """
+    _require_admin(x_admin_token)
+    if not STATE_DB:
+        raise HTTPException(status_code=503, detail="Webhooks need UMA_STATE_DB")
+    if not re.match(r"https?://", sub.url):
+        raise HTTPException(status_code=400, detail="url must be http(s)")
+    for name, value, allowed in (("sections", sub.sections, SNAPSHOT_SECTIONS), ("kinds", sub.kinds, WEBHOOK_KINDS)):
+        if value is not None and not set(value) <= set(allowed):
+            raise HTTPException(status_code=400, detail=f"{name} must be some of {list(allowed)}")
+    hook_id = uuid.uuid4().hex[:16]
+    with _db_lock:
+        conn = _db()
+        with conn:
+            max_seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM outbox").fetchone()[0]
+            conn.execute(
+                "INSERT INTO webhooks(id, url, secret, sections, kinds, created_at, cursor) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    hook_id, sub.url, sub.secret,
+                    json.dumps(sub.sections) if sub.sections is not None else None,
+                    json.dumps(sub.kinds) if sub.kinds is not None else None,
+                    time.time(), max_seq,
+                ),
+            )
+            hook = _webhook_row(conn.execute("SELECT * FROM webhooks WHERE id = ?", (hook_id,)).fetchone())
+    _start_webhook_dispatcher()
+    return _webhook_public(hook, max_seq)
+
+
+@app.get("/api/webhooks")
+def list_webhooks(x_admin_token: str | None = Header(default=None)):
+    """Registered webhooks with their delivery state (pending records, attempts, last error)."""
+    _require_admin(x_admin_token)
+    if not STATE_DB:
+        return {"webhooks": []}
+    with _db_lock:
+        conn = _db()
+        max_seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM outbox").fetchone()[0]
+        hooks = [_webhook_row(r) for r in conn.execute("SELECT * FROM webhooks ORDER BY created_at")]
+    return {"webhooks": [_webhook_public(h, max_seq) for h in hooks]}
+
+
+@app.delete("/api/webhooks/{webhook_id}")
+def delete_webhook(webhook_id: str, x_admin_token: str | None = Header(default=None)):
+    _require_admin(x_admin_token)
+    if not STATE_DB:
+        raise HTTPException(status_code=404, detail="Unknown webhook")
+    with _db_lock:
+        conn = _db()
+        with conn:
+            deleted = conn.execute("DELETE FROM webhooks WHERE id = ?", (webhook_id,)).rowcount
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Unknown webhook")
+    return {"deleted": webhook_id}
+
+
+@app.post("/api/admin/profile")
+def arm_profile(
+    target: str = "refresh",
+    requests: int = 1,
+    cpu: bool = True,
+    alloc: bool = True,
+    x_admin_token: str | None = Header(default=None),
+):
+    """Arm cProfile/tracemalloc around the next refresh or the next N /api/events requests."""
+    _require_admin(x_admin_token)
+    if target not in ("refresh", "events"):
+        raise HTTPException(status_code=400, detail="target must be 'refresh' or 'events'")
+    if not (cpu or alloc):
+        raise HTTPException(status_code=400, detail="Enable cpu and/or alloc")
+    session = _arm_profile(target, max(1, min(int(requests), 10000)), cpu, alloc)
+    return {"profile_id": session["id"], "status": session["status"], "target": target, "requests": session["requests"]}
+
+
+@app.get("/api/admin/profile/{profile_id}")
+def get_profile(profile_id: str, format: str = "json", x_admin_token: str | None = Header(default=None)):
+    """Profile status and report; `format=pstats` downloads the raw stats for pstats/snakeviz."""
+    _require_admin(x_admin_token)
+    with _profile_lock:
+        session = _profile_sessions.get(profile_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Unknown profile")
+    if format == "pstats":
+        if not session["pstats"]:
+            raise HTTPException(status_code=404, detail="No CPU profile recorded (yet)")
+        return Response(
+            session["pstats"],
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{profile_id}.pstats"'},
+        )
+    if format == "text":
+        return Response((session["report"] or {}).get("cpu") or "", media_type="text/plain")
+    return {
+        "profile_id": session["id"],
+        "target": session["target"],
+        "status": session["status"],
+        "armed_at": session["armed_at"],
+        "finished_at": session["finished_at"],
+        "completed": session["completed"],
+        "requests": session["requests"],
+        "report": session["report"],
+    }
+
+
+@app.get("/api/refresh/{refresh_id}/trace")
+def get_refresh_trace(refresh_id: str, format: str = "json"):
+    """Span tree of a recent refresh; `format=folded` gives collapsed stacks for flamegraphs."""
+    with _recent_traces_lock:
+        trace = _recent_traces.get(refresh_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Unknown refresh or trace no longer kept")
+    if format == "folded":
+        return Response(_trace_folded(trace), media_type="text/plain")
+    return _trace_tree(trace)
+
 def register_service():
     """Registers this service with the home-page dashboard."""
     try:
@@ -1156,8 +4620,9 @@ def register_service():
             "id": "umamusume-tracker",
             "name": "Umamusume Events",
             "description": "Global server banners and events",
-            "url": "http://raspberrypi.local:8003",
-            "apiUrl": "http://raspberrypi.local:8003/api/events",
+            "url": PUBLIC_BASE_URL,
+            "apiUrl": f"{PUBLIC_BASE_URL}/api/events",
+            "streamUrl": f"{PUBLIC_BASE_URL}/api/events/stream",
             "type": "split-slide", # Use the new split-slide type we added for Fortnite
             "icon": "horse-head" # FontAwesome icon name (hope it exists or generic)
         }
@@ -1190,8 +4655,352 @@ def register_service():
     except Exception as e:
         logger.error(f"Failed to register service: {e}")
 
+@app.get("/metrics")
+def metrics():
+    """Prometheus metrics for refreshes and API handlers."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+# Slides of /api/events and the sections on their left and right side.
+EVENTS_SLIDE_SECTIONS = {
+    "current": ("banners", "events"),
+    "upcoming": ("upcoming_banners", "upcoming_events"),
+}
+_EVENTS_SIDE_KEYS = (("title", "subtitle", "items"), ("rightTitle", "rightSubtitle", "rightItems"))
+EVENTS_MAX_FIELDS = 16
+# (sections, per-section limits, item fields) of the unfiltered payload.
+EVENTS_DEFAULT_SHAPE = (SNAPSHOT_SECTIONS, (), ())
+EVENTS_MEDIA_TYPES = {"json": "application/json", "cbor": "application/cbor"}
+_EVENTS_ENCODINGS = {v: k for k, v in EVENTS_MEDIA_TYPES.items()}
+# Rendered /api/events bodies per (region, shape, encoding); each is rendered
+# once per published version, so customized responses cost a dict lookup too.
+EVENTS_BODY_CACHE_SIZE = max(1, int(os.environ.get("UMA_EVENTS_BODY_CACHE_SIZE", "64") or 64))
+
+# (region, shape, encoding) -> ((version, asset generation), body, etag), least recently used first.
+_events_body_cached: OrderedDict[tuple, tuple] = OrderedDict()
+_events_body_lock = Lock()
+
+
+def _events_region(region: str) -> str:
+    """Resolve a ?region= value to a GameTora region key ("" for Global).
+
+    503 while no refresh has brought region banners yet (after every restart),
+    404 for regions a refresh didn't have.
+    """
+    region = GACHA_REGION_ALIASES.get(region.strip().lower(), region.strip().lower())
+    if region in ("", "en"):
+        return ""
+    available = events_cache.get("region_banners") or {}
+    if not available:
+        raise HTTPException(status_code=503, detail="Region banners not loaded yet", headers={"Retry-After": "30"})
+    if region not in available:
+        raise HTTPException(status_code=404, detail=f"Unknown region {region!r}; available: {sorted(available)}")
+    return region
+
+
+def _csv(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _events_shape(slides: str = "", sections: str = "", limit: str = "", fields: str = "") -> tuple:
+    """Normalize the /api/events selection parameters; 400 on unknown names.
+
+    Equivalent queries map to the same shape (and no parameters to
+    EVENTS_DEFAULT_SHAPE), so they share one cached body.
+    """
+    selected = set(SNAPSHOT_SECTIONS)
+    if slides:
+        unknown = [v for v in _csv(slides) if v not in EVENTS_SLIDE_SECTIONS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown slides {unknown}; expected some of {list(EVENTS_SLIDE_SECTIONS)}")
+        selected = {sec for v in _csv(slides) for sec in EVENTS_SLIDE_SECTIONS[v]}
+    if sections:
+        unknown = [v for v in _csv(sections) if v not in SNAPSHOT_SECTIONS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown sections {unknown}; expected some of {list(SNAPSHOT_SECTIONS)}")
+        selected &= set(_csv(sections))
+
+    # `limit=3` caps every section, `limit=banners:2,events:4` single ones; both can be combined.
+    limits: dict[str, int] = {}
+    default_limit = None
+    for part in _csv(limit):
+        name, sep, value = part.rpartition(":")
+        if sep and name not in SNAPSHOT_SECTIONS:
+            raise HTTPException(status_code=400, detail=f"Unknown section {name!r} in limit")
+        if not value.isdigit():
+            raise HTTPException(status_code=400, detail=f"Invalid limit {part!r}; expected N or section:N")
+        if sep:
+            limits[name] = int(value)
+        else:
+            default_limit = int(value)
+    if default_limit is not None:
+        for sec in SNAPSHOT_SECTIONS:
+            limits.setdefault(sec, default_limit)
+
+    names = sorted(set(_csv(fields)))
+    if len(names) > EVENTS_MAX_FIELDS or not all(re.fullmatch(r"\w{1,64}", n) for n in names):
+        raise HTTPException(status_code=400, detail=f"fields must be at most {EVENTS_MAX_FIELDS} comma-separated item keys")
+
+    return (
+        tuple(sec for sec in SNAPSHOT_SECTIONS if sec in selected),
+        tuple((sec, limits[sec]) for sec in SNAPSHOT_SECTIONS if sec in selected and sec in limits),
+        tuple(names),
+    )
+
+
+def _events_encoding(accept: str | None) -> str:
+    """Pick json or cbor from an Accept header (highest q wins, JSON on ties and by default)."""
+    best, best_q = "json", 0.0
+    for part in (accept or "").split(","):
+        media, _, params = part.partition(";")
+        encoding = _EVENTS_ENCODINGS.get(media.strip().lower())
+        if encoding is None:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _shape_events_payload(payload: dict, shape: tuple) -> dict:
+    """Apply section selection, limits and field projection to a full /api/events payload."""
+    if shape == EVENTS_DEFAULT_SHAPE:
+        return payload
+    sections, limits, fields = shape
+    limits = dict(limits)
+    fields = frozenset(fields)
+    slides = []
+    for slide, side_sections in zip(payload["slides"], EVENTS_SLIDE_SECTIONS.values()):
+        out = {"type": slide["type"]}
+        for section, (title, subtitle, items_key) in zip(side_sections, _EVENTS_SIDE_KEYS):
+            if section not in sections:
+                continue
+            items = slide[items_key]
+            if section in limits:
+                items = items[:limits[section]]
+            if fields:
+                items = [{k: v for k, v in it.items() if k in fields} for it in items]
+            out.update({title: slide[title], subtitle: slide[subtitle], items_key: items})
+        if len(out) > 1:
+            slides.append(out)
+    return {**payload, "slides": slides}
+
+
+def _cbor_head(out: bytearray, major: int, n: int) -> None:
+    if n < 24:
+        out.append(major << 5 | n)
+    elif n < 0x100:
+        out += bytes((major << 5 | 24, n))
+    elif n < 0x10000:
+        out.append(major << 5 | 25)
+        out += n.to_bytes(2, "big")
+    elif n < 0x100000000:
+        out.append(major << 5 | 26)
+        out += n.to_bytes(4, "big")
+    else:
+        out.append(major << 5 | 27)
+        out += n.to_bytes(8, "big")
+
+
+def _cbor_append(out: bytearray, value) -> None:
+    if value is None:
+        out.append(0xF6)
+    elif value is True:
+        out.append(0xF5)
+    elif value is False:
+        out.append(0xF4)
+    elif isinstance(value, int):
+        if value >= 0:
+            _cbor_head(out, 0, value)
+        else:
+            _cbor_head(out, 1, -1 - value)
+    elif isinstance(value, float):
+        out.append(0xFB)
+        out += struct.pack(">d", value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        _cbor_head(out, 3, len(data))
+        out += data
+    elif isinstance(value, (list, tuple)):
+        _cbor_head(out, 4, len(value))
+        for v in value:
+            _cbor_append(out, v)
+    elif isinstance(value, dict):
+        _cbor_head(out, 5, len(value))
+        for k, v in value.items():
+            _cbor_append(out, k)
+            _cbor_append(out, v)
+    else:
+        raise TypeError(f"Cannot CBOR-encode {type(value).__name__}")
+
+
+def _cbor_encode(value) -> bytes:
+    """CBOR (RFC 8949) encoding of JSON-like data, definite lengths only."""
+    out = bytearray()
+    _cbor_append(out, value)
+    return bytes(out)
+
+
+def _events_body(region: str = "", shape: tuple = EVENTS_DEFAULT_SHAPE, encoding: str = "json") -> tuple[bytes, str]:
+    """Serialized /api/events payload and its ETag, rendered once per version for every shape."""
+    cache_key = (region, shape, encoding)
+    version = (events_cache["version"], _asset_generation)
+    with _events_body_lock:
+        key, body, etag = _events_body_cached.get(cache_key, (None, b"", ""))
+        if key == version:
+            _events_body_cached.move_to_end(cache_key)
+            _CACHE_LOOKUPS.labels("events_body", "hit").inc()
+            return body, etag
+    _CACHE_LOOKUPS.labels("events_body", "miss").inc()
+    payload = _shape_events_payload(_build_events_payload(region), shape)
+    if encoding == "cbor":
+        body = _cbor_encode(payload)
+    else:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+    with _events_body_lock:
+        _events_body_cached[cache_key] = (version, body, etag)
+        _events_body_cached.move_to_end(cache_key)
+        while len(_events_body_cached) > EVENTS_BODY_CACHE_SIZE:
+            _events_body_cached.popitem(last=False)
+    return body, etag
+
+
+@app.get("/api/events/changes")
+async def get_event_changes(since: int = 0, wait: float = 0.0):
+    """Added/removed/changed items per section since version `since`.
+
+    With `wait` (seconds, at most 60) and nothing newer than `since` yet, the
+    request is held until the next version is published or the wait runs out.
+    """
+    if wait > 0 and since == _snapshot_version:
+        await _wait_for_snapshot(since, min(wait, CHANGES_MAX_WAIT_SECONDS))
+    with _API_SECONDS.labels("/api/events/changes").time():
+        return _snapshot_changes(since)
+
+
+SSE_HEARTBEAT_SECONDS = float(os.environ.get("UMA_SSE_HEARTBEAT_SECONDS", "15") or 15)
+
+
+def _sse_message(version: int, mode: str, since: int) -> str:
+    if mode == "version":
+        event, data = "version", json.dumps({"version": version, "last_updated": events_cache["last_updated"]})
+    elif mode == "changes":
+        event, data = "changes", json.dumps(_snapshot_changes(since), ensure_ascii=False, separators=(",", ":"))
+    else:
+        event, data = "events", _events_body()[0].decode("utf-8")
+    return f"id: {version}\nevent: {event}\ndata: {data}\n\n"
+
+
+@app.get("/api/events/stream")
+async def stream_events(mode: str = "payload", last_event_id: str | None = Header(default=None)):
+    """Server-Sent Events: a message per published version, heartbeats in between.
+
+    `mode=payload` (default) sends the full /api/events payload, `mode=version`
+    only a version notice, `mode=changes` the delta since the previous message.
+    Event IDs are versions; a reconnect with Last-Event-ID resumes from there
+    (a client that is already current gets nothing until the next version).
+    Versions never repeat across restarts, so an ID from before one always
+    gets the current version, and `mode=changes` starts with a reset.
+    When images of the current version get cached locally after it was sent,
+    `payload` and `version` clients get it again (same ID) so they pick up
+    the local image URLs.
+    """
+    if mode not in ("payload", "version", "changes"):
+        raise HTTPException(status_code=400, detail="mode must be payload, version or changes")
+    try:
+        last = int(last_event_id) if last_event_id else -1
+    except ValueError:
+        last = -1
+
+    async def messages():
+        nonlocal last
+        # `changes` deltas carry the snapshot's items, which never point at cached images.
+        sent_assets = _asset_generation if mode != "changes" else None
+        _SSE_CLIENTS.inc()
+        try:
+            yield f"retry: {int(SSE_HEARTBEAT_SECONDS * 1000)}\n\n"
+            while True:
+                version, assets = _snapshot_version, _asset_generation
+                if version != last or (sent_assets is not None and assets != sent_assets):
+                    yield _sse_message(version, mode, max(last, 0))
+                    last = version
+                    if sent_assets is not None:
+                        sent_assets = assets
+                    continue
+                if not await _wait_for_snapshot(last, SSE_HEARTBEAT_SECONDS, sent_assets):
+                    yield ": heartbeat\n\n"
+        finally:
+            _SSE_CLIENTS.dec()
+
+    return StreamingResponse(
+        messages(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/events/{slug}")
+def get_event_detail(slug: str):
+    """Full record of one GameTora event (everything in its page's eventData)."""
+    if not re.fullmatch(r"[\w-]{1,128}", slug):
+        raise HTTPException(status_code=400, detail="Invalid event slug")
+    with _API_SECONDS.labels("/api/events/{slug}").time():
+        try:
+            body = _event_detail(slug)
+        except Exception as e:
+            logger.warning(f"Failed to fetch event {slug}: {e}")
+            raise HTTPException(status_code=502, detail="Failed to fetch event from GameTora")
+    if body is None:
+        raise HTTPException(status_code=404, detail="Unknown event")
+    return Response(content=body, media_type="application/json")
+
+
 @app.get("/api/events")
-def get_events():
+def get_events(
+    region: str = "",
+    slides: str = "",
+    sections: str = "",
+    limit: str = "",
+    fields: str = "",
+    accept: str | None = Header(default=None),
+    if_none_match: str | None = Header(default=None),
+):
+    """The dashboard payload. `region` (jp, en, ko, zh_tw, ...) picks whose current banners are shown;
+    the event sections always come from the Global sources.
+
+    `slides` (current, upcoming) and `sections` select parts of it, `limit` caps
+    items per section (`3` or `banners:2,events:4`) and `fields` keeps only the
+    given item keys. `Accept: application/cbor` returns CBOR instead of JSON.
+    """
+    with _API_SECONDS.labels("/api/events").time():
+        region = _events_region(region)
+        shape = _events_shape(slides, sections, limit, fields)
+        encoding = _events_encoding(accept)
+        if _profile_armed:
+            body, etag = _run_profiled("events", _events_body, region, shape, encoding)
+        else:
+            body, etag = _events_body(region, shape, encoding)
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+        if "first_response" not in _startup_phases:
+            _startup_first_response()
+        if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type=EVENTS_MEDIA_TYPES[encoding], headers=headers)
+
+
+def _build_events_payload(region: str = "") -> dict:
+    if region:
+        banners = (events_cache.get("region_banners") or {}).get(region, [])
+    else:
+        banners = events_cache["banners"]
     upcoming_banners = events_cache.get("upcoming_banners", []) or []
     upcoming_events = events_cache.get("upcoming_events", []) or []
 
@@ -1216,24 +5025,68 @@ def get_events():
             {
                 "type": "split-slide",
                 "title": "Current Banners",
-                "subtitle": "Gacha",
-                "items": events_cache["banners"],
+                "subtitle": f"Gacha ({region.upper()})" if region else "Gacha",
+                "items": _local_image_items(banners),
                 "rightTitle": "Current Events",
                 "rightSubtitle": "Story",
-                "rightItems": events_cache["events"],
+                "rightItems": _local_image_items(events_cache["events"]),
             },
             {
                 "type": "split-slide",
                 "title": "Upcoming Banners",
                 "subtitle": "Gacha",
-                "items": upcoming_banners,
+                "items": _local_image_items(upcoming_banners),
                 "rightTitle": "Upcoming Events",
                 "rightSubtitle": "Story",
-                "rightItems": upcoming_events,
+                "rightItems": _local_image_items(upcoming_events),
             }
         ],
-        "last_updated": events_cache["last_updated"]
+        "last_updated": events_cache["last_updated"],
+        "version": events_cache["version"],
+        "region": region or "en",
     }
 
+def _replay_snapshot(output: str = "") -> None:
+    """Rebuild the snapshot from the open replay archive and write the /api/events payload."""
+    t0 = time.perf_counter()
+    fetch_gametora_data()
+    elapsed = time.perf_counter() - t0
+    body = json.dumps(_build_events_payload(), indent=2, ensure_ascii=False)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(body + "\n")
+    else:
+        print(body)
+    logger.info(f"Replayed snapshot in {elapsed:.2f}s (clock frozen at {_format_dt(_now_ts())})")
+
+
+_startup_mark("imports", _STARTUP_IMPORTED - _STARTUP_T0)
+_startup_mark("module", time.perf_counter() - _STARTUP_IMPORTED)
+
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8003)
+    parser = argparse.ArgumentParser(description="Umamusume Tracker API")
+    parser.add_argument(
+        "--record", metavar="ARCHIVE", default=os.environ.get("UMA_RECORD_ARCHIVE", ""),
+        help="record every upstream fetch into this archive directory",
+    )
+    parser.add_argument("--replay", metavar="ARCHIVE", help="rebuild the snapshot from an archive without network access")
+    parser.add_argument("--replay-refresh", metavar="ID", help="only replay the fetches of this refresh")
+    parser.add_argument("--output", metavar="FILE", help="with --replay: write the payload here instead of stdout")
+    parser.add_argument("--serve", action="store_true", help="with --replay: keep serving the replayed snapshot")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8003)
+    args = parser.parse_args()
+
+    if args.replay:
+        _http_archive = _HttpArchive(args.replay, "replay", args.replay_refresh)
+        if not args.serve:
+            _replay_snapshot(args.output or "")
+            sys.exit(0)
+    elif args.record:
+        _http_archive = _HttpArchive(args.record, "record")
+        logger.info(f"Recording upstream fetches to {args.record}")
+
+    import uvicorn
+
+    uvicorn.run(app, host=args.host, port=args.port)